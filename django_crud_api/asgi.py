@@ -7,6 +7,10 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
 
-from django.core.asgi import get_asgi_application
+import django
 
-application = get_asgi_application()
+from django_crud_api.handlers import StreamingASGIHandler
+
+# As get_asgi_application(), with a handler that streams responses off the event loop
+django.setup(set_prefix=False)
+application = StreamingASGIHandler()
@@ -0,0 +1,57 @@
+from typing import Any, Callable, List, Tuple
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIHandler
+from django.http import HttpResponseBase
+
+# Returned by next() once a streaming response is exhausted
+_END_OF_STREAM = object()
+
+
+class StreamingASGIHandler(ASGIHandler):
+    """
+    Django's ASGI handler, reading streaming responses off the event loop.
+
+    Django 4.1 iterates streaming content on the event loop itself, so a
+    generator reading the database (e.g. the email export) fails with
+    ``SynchronousOnlyOperation`` once the response has started. Here each part
+    is produced through ``sync_to_async``, on the request's thread like the
+    view that created it, and sent as soon as it is ready.
+    """
+
+    async def send_response(self, response: HttpResponseBase, send: Callable[..., Any]) -> None:
+        """Encode and send a response out over ASGI, streaming ones part by part."""
+        if not response.streaming:
+            await super().send_response(response, send)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": self._encode_headers(response),
+            },
+        )
+        parts = iter(response)
+        next_part = sync_to_async(next, thread_sensitive=True)
+        while True:
+            part = await next_part(parts, _END_OF_STREAM)
+            if part is _END_OF_STREAM:
+                break
+            for chunk, _ in self.chunk_bytes(part):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body"})
+        await sync_to_async(response.close, thread_sensitive=True)()
+
+    def _encode_headers(self, response: HttpResponseBase) -> List[Tuple[bytes, bytes]]:
+        # Same encoding as ASGIHandler.send_response, cookies included
+        response_headers = []
+        for header, header_value in response.items():
+            if isinstance(header, str):
+                header = header.encode("ascii")
+            if isinstance(header_value, str):
+                header_value = header_value.encode("latin1")
+            response_headers.append((bytes(header), bytes(header_value)))
+        for cookie in response.cookies.values():
+            response_headers.append((b"Set-Cookie", cookie.output(header="").encode("ascii").strip()))
+        return response_headers
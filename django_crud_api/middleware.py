@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any, Callable
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.http import HttpRequest, HttpResponse
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise, able to run in an async middleware chain.
+
+    Django runs a sync-only middleware, and everything after it (the views
+    included), on its single sync thread, so one of them in the chain would
+    serialize every async request. Static files are still served on a thread,
+    every other request is passed on without leaving the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Initialize a new instance of the AsyncWhiteNoiseMiddleware class."""
+        super().__init__(get_response, *args, **kwargs)
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """Serve a static file, or pass the request on."""
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Serve a static file, or pass the request on, without blocking the event loop."""
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
@@ -11,6 +11,8 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
 import os
+import sys
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -25,6 +27,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY")
 
+# Running the test suite (`python manage.py test`)
+TESTING = sys.argv[1:2] == ["test"]
+
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -49,7 +54,7 @@ INSTALLED_APPS = [  # noqa: WPS407
 
 MIDDLEWARE = [  # noqa: WPS407
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django_crud_api.middleware.AsyncWhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -89,6 +94,16 @@ DATABASES = {
     ),
 }
 
+# Cache
+# Use a shared backend (e.g. Redis or Memcached) so gunicorn workers share cached responses
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", ""),
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -131,3 +146,52 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.coreapi.AutoSchema",
     "EXCEPTION_HANDLER": "django_crud_api.utils.custom_exception_handler",
 }
+
+# Hunter client
+# Keys are passed as lower-cased keyword arguments to HunterClient / BaseFetcher.
+
+HUNTER_CLIENT = {
+    "POOL_CONNECTIONS": int(os.getenv("HUNTER_POOL_CONNECTIONS", "10")),
+    "POOL_MAXSIZE": int(os.getenv("HUNTER_POOL_MAXSIZE", "10")),
+    "POOL_BLOCK": os.getenv("HUNTER_POOL_BLOCK", "false").lower() == "true",
+    "TIMEOUT": (
+        float(os.getenv("HUNTER_CONNECT_TIMEOUT", "3.05")),
+        float(os.getenv("HUNTER_READ_TIMEOUT", "10")),
+    ),
+    # Overall budget of a call, retries included, and the circuit breaker of each endpoint
+    "DEADLINE": float(os.getenv("HUNTER_DEADLINE", "15")),
+    "RETRY_MAX_ATTEMPTS": int(os.getenv("HUNTER_RETRY_MAX_ATTEMPTS", "3")),
+    "RETRY_BACKOFF_BASE": float(os.getenv("HUNTER_RETRY_BACKOFF_BASE", "0.2")),
+    "RETRY_BACKOFF_MAX": float(os.getenv("HUNTER_RETRY_BACKOFF_MAX", "5")),
+    "CIRCUIT_FAILURE_THRESHOLD": int(os.getenv("HUNTER_CIRCUIT_FAILURE_THRESHOLD", "5")),
+    "CIRCUIT_RESET_TIMEOUT": float(os.getenv("HUNTER_CIRCUIT_RESET_TIMEOUT", "30")),
+    "RESPONSE_CACHE_ALIAS": os.getenv("HUNTER_RESPONSE_CACHE_ALIAS", "default"),
+    "RESPONSE_CACHE_MAX_ENTRIES": int(os.getenv("HUNTER_RESPONSE_CACHE_MAX_ENTRIES", "1024")),
+    # "sqlite" shares the rate limits between the workers of a host (the production
+    # default), "cache" between every worker using the cache, "memory" keeps them
+    # per process (the development default, and always in tests)
+    "RATE_LIMIT_BACKEND": "memory" if TESTING else (
+        os.getenv("HUNTER_RATE_LIMIT_BACKEND") or ("sqlite" if os.getenv("APP_ENV") == "production" else "memory")
+    ),
+    "RATE_LIMIT_SQLITE_PATH": os.getenv(
+        "HUNTER_RATE_LIMIT_SQLITE_PATH",
+        os.path.join(tempfile.gettempdir(), "hunter_rate_limits.sqlite3"),
+    ),
+    "RATE_LIMIT_CACHE_ALIAS": os.getenv("HUNTER_RATE_LIMIT_CACHE_ALIAS", "default"),
+    # Replay (or record) the Hunter calls from a cassette file instead of the network
+    "CASSETTE_PATH": os.getenv("HUNTER_CASSETTE_PATH") or None,
+    "CASSETTE_MODE": os.getenv("HUNTER_CASSETTE_MODE", "replay"),
+}
+
+# Service clients
+# Clients whose stubs are built by `python manage.py generate_client_stubs`.
+# Runtime stub generation is meant for development only, production workers
+# should never write to the source tree.
+
+SERVICE_CLIENTS = [  # noqa: WPS407
+    "modules.email_module.services.hunter_client.hunter_client.HunterClient",
+]
+
+GENERATE_CLIENT_STUBS = (
+    os.getenv("GENERATE_CLIENT_STUBS", "false" if os.getenv("APP_ENV") == "production" else "true").lower() == "true"
+)
@@ -1,7 +1,10 @@
 from django.contrib import admin
 
-from .models import Email
+from .models import Email, EmailImport, EmailStat, VerificationJob
 
 # Register Models into the admin site
 
 admin.site.register(Email)
+admin.site.register(VerificationJob)
+admin.site.register(EmailImport)
+admin.site.register(EmailStat)
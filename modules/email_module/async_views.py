@@ -0,0 +1,181 @@
+import json
+from typing import Any, Callable, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views import View
+from rest_framework import status
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Email
+from .serializer import CreateEmailSerializer, EmailSerializer, UpdateEmailSerializer
+from .services.db_client import DatabaseClient
+from .views import EmailServiceView, create_outcome, email_validators
+
+
+def _json_response(response_data: Any, status_code: int, **kwargs: Any) -> JsonResponse:
+    # DRF's encoder, so payloads match the synchronous endpoints byte for byte
+    return JsonResponse(response_data, status=status_code, encoder=JSONEncoder, safe=False, **kwargs)
+
+
+def _not_found() -> JsonResponse:
+    return _json_response({"detail": "Not found."}, status.HTTP_404_NOT_FOUND)
+
+
+def _parse_json_body(request: HttpRequest) -> Optional[Dict[str, Any]]:
+    try:
+        payload = json.loads(request.body or b"{}")
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+class AsyncEmailView(View):
+    """
+    Base of the async email service views.
+
+    Handlers are coroutines, so under ASGI a request waiting on Hunter or the
+    database holds no thread: one worker keeps as many verifications in flight
+    as its connection pool allows. Like DRF's views, they are exempt from CSRF.
+    """
+
+    # The same client as the synchronous views, sharing their pools, caches and rate limits
+    hunter_client = EmailServiceView.hunter_client
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Callable[..., Any]:
+        """Return the async view function, exempt from CSRF."""
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True  # type: ignore
+        return view
+
+
+class AsyncEmailListView(AsyncEmailView):
+    """Async twin of the email service's list and create endpoints."""
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        """
+        List the emails, through the synchronous list view run on a thread.
+
+        This endpoint is not async: it reuses the keyset pagination, filters and
+        conditional GET of the synchronous list as they are. A page is a single
+        indexed query, which the async ORM of Django 4.1 would run on a thread
+        all the same.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            HttpResponse: The response object.
+        """
+        list_view = EmailServiceView.as_view({"get": "list"})
+        return await sync_to_async(lambda: list_view(request).render())()
+
+    async def post(self, request: HttpRequest) -> HttpResponse:
+        """
+        Create a new email record and verifies the email address.
+
+        Args:
+            request (HttpRequest): The request object.
+
+        Returns:
+            HttpResponse: The response object.
+        """
+        serializer = CreateEmailSerializer(data=_parse_json_body(request))
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        email: str = serializer.validated_data["email"]
+        email_data = await DatabaseClient.aget_email_by_address(email)
+        if email_data is not None:
+            outcome = create_outcome(email, email_data)
+        else:
+            try:
+                response = await self.hunter_client.averify_email(email)
+
+                new_email_data = await DatabaseClient.astore_email(
+                    email,
+                    response.status,
+                    response.score,
+                    response.disposable,
+                )
+                outcome = create_outcome(email, new_email_data, created=True)
+            except Exception as err:
+                outcome = create_outcome(email, error=err)
+        response_data, status_code, headers = outcome
+        return _json_response(response_data, status_code, headers=headers)
+
+
+class AsyncEmailDetailView(AsyncEmailView):
+    """Async twin of the email service's retrieve, update and destroy endpoints."""
+
+    async def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        """
+        Retrieve an email record, answering 304 when the client's copy is still current.
+
+        Like the synchronous retrieve, only ``updated_at`` is read to check the
+        ETag and Last-Modified validators.
+
+        Args:
+            request (HttpRequest): The request object.
+            pk (int): The ID of the email.
+
+        Returns:
+            HttpResponse: The response object.
+        """
+        updated_at = await Email.objects.filter(pk=pk).values_list("updated_at", flat=True).afirst()
+        if updated_at is None:
+            return _not_found()
+        etag, last_modified = email_validators(request.get_full_path(), "json", updated_at)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        try:
+            email_instance = await Email.objects.aget(pk=pk)
+        except Email.DoesNotExist:
+            return _not_found()
+        response = _json_response(EmailSerializer(email_instance).data, status.HTTP_200_OK)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    async def put(self, request: HttpRequest, pk: int) -> HttpResponse:
+        """
+        Update the internal status of an email record.
+
+        Args:
+            request (HttpRequest): The request object.
+            pk (int): The ID of the email.
+
+        Returns:
+            HttpResponse: The response object.
+        """
+        serializer = UpdateEmailSerializer(data=_parse_json_body(request))
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        email_obj = await DatabaseClient.aupdate_email(
+            pk,
+            internal_status=serializer.validated_data["internal_status"],
+        )
+        if email_obj is None:
+            return _not_found()
+        return HttpResponse(status=status.HTTP_200_OK)
+
+    async def delete(self, request: HttpRequest, pk: int) -> HttpResponse:
+        """
+        Delete an email record.
+
+        Args:
+            request (HttpRequest): The request object.
+            pk (int): The ID of the email.
+
+        Returns:
+            HttpResponse: The response object.
+        """
+        if not await DatabaseClient.adelete_email(pk):
+            return _not_found()
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,216 @@
+import json
+import platform
+import time
+from typing import Any, Callable, Dict, Sequence
+
+import django
+import requests
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+
+from utils.benchmark import compare, measure
+from utils.rate_limiter import Bucket, RateLimiter
+
+from ...models import Email
+from ...services.hunter_client.fake_server import FakeHunterServer
+from ...services.hunter_client.hunter_client import HunterClient
+from ...views import EmailServiceView
+
+BENCHMARKS = (
+    "manager_construction",
+    "manager_construction_lazy",
+    "method_call",
+    "dto_construction",
+    "view_create_miss",
+    "view_create_hit",
+    "view_list",
+    "view_retrieve",
+    "view_update",
+)
+
+EMAILS_URL = "/api/v1/email_service/"
+
+# p50 the fake Hunter API may add to its configured latency before the view timings are distrusted
+MAX_UPSTREAM_OVERHEAD_MS = 5.0
+
+HUNTER_PAYLOAD = {"data": {"status": "valid", "score": 90, "disposable": False, "result": "deliverable"}}
+
+
+def measure_upstream_overhead(fake_hunter: FakeHunterServer, iterations: int = 20) -> float:
+    """Return the p50 milliseconds a keep-alive call to the fake Hunter API adds to its configured latency."""
+    with requests.Session() as session:
+        verifier_url = f"{fake_hunter.base_url}/v2/email-verifier"
+        upstream_results = measure(
+            lambda index: session.get(verifier_url, params={"email": f"overhead{index}@example.com"}),
+            iterations,
+            warmup=1,
+        )
+    return round(upstream_results["p50_ms"] - fake_hunter.latency * 1000, 4)
+
+
+class UnlimitedBucketBackend:
+    """Grant every token: the benchmarks measure this code, not Hunter's quotas."""
+
+    def try_acquire(self, buckets: Sequence[Bucket]) -> float:
+        """Never wait."""
+        return 0.0
+
+
+class Command(BaseCommand):
+    """Benchmark the client machinery and the email service views."""
+
+    help = (
+        "Benchmark the client machinery and the email service views against a fake Hunter API "
+        "and a throwaway test database, printing p50/p95/p99 latencies as JSON."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run, all by default: {', '.join(BENCHMARKS)}")
+        parser.add_argument("--iterations", type=int, default=200, help="Timed runs of each benchmark")
+        parser.add_argument("--warmup", type=int, default=20, help="Untimed runs before timing")
+        parser.add_argument("--upstream-latency", type=float, default=0.0, help="Latency of the fake Hunter API")
+        parser.add_argument("--output", help="Write the results to this file instead of stdout")
+        parser.add_argument("--baseline", help="Results file of an earlier run to compare against")
+        parser.add_argument("--threshold", type=float, default=0.1, help="p50 growth reported as a regression")
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error when a benchmark regressed past the threshold",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the benchmarks and report the results."""
+        unknown_benchmarks = set(options["benchmarks"]) - set(BENCHMARKS)
+        if unknown_benchmarks:
+            raise CommandError(f"Unknown benchmarks: {', '.join(sorted(unknown_benchmarks))}")
+
+        setup_test_environment()
+        old_database_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        fake_hunter = FakeHunterServer(latency=options["upstream_latency"]).start()
+        view_client = EmailServiceView.hunter_client
+        view_client_state = (view_client.base_url, view_client.rate_limiter)
+        view_client.base_url = fake_hunter.base_url
+        view_client.rate_limiter = RateLimiter(UnlimitedBucketBackend())
+        try:
+            upstream_overhead_ms = measure_upstream_overhead(fake_hunter)
+            if upstream_overhead_ms > MAX_UPSTREAM_OVERHEAD_MS:
+                raise CommandError(
+                    f"The fake Hunter API adds {upstream_overhead_ms} ms per call, "
+                    f"over {MAX_UPSTREAM_OVERHEAD_MS} ms: the view timings would measure it, not the views",
+                )
+            results = {
+                name: measure(getattr(self, f"benchmark_{name}")(), options["iterations"], options["warmup"])
+                for name in options["benchmarks"] or BENCHMARKS
+            }
+        finally:
+            view_client.base_url, view_client.rate_limiter = view_client_state
+            fake_hunter.stop()
+            connection.creation.destroy_test_db(old_database_name, verbosity=0)
+            teardown_test_environment()
+
+        report: Dict[str, Any] = {
+            "meta": {
+                "timestamp": int(time.time()),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "iterations": options["iterations"],
+                "upstream_latency": options["upstream_latency"],
+                "upstream_overhead_ms": upstream_overhead_ms,
+            },
+            "results": results,
+        }
+        if options["baseline"]:
+            with open(options["baseline"]) as baseline_file:
+                baseline = json.load(baseline_file)["results"]
+            report["comparison"] = compare(results, baseline, options["threshold"])
+
+        report_json = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as output_file:
+                output_file.write(report_json + "\n")
+        else:
+            self.stdout.write(report_json)
+
+        regressions = [name for name, change in report.get("comparison", {}).items() if change["regressed"]]
+        if regressions and options["fail_on_regression"]:
+            raise CommandError(f"Regressed past the threshold: {', '.join(regressions)}")
+
+    def benchmark_manager_construction(self) -> Callable[[int], Any]:
+        """Build a client with every method bound eagerly."""
+        return lambda index: HunterClient(generate_stubs=False)
+
+    def benchmark_manager_construction_lazy(self) -> Callable[[int], Any]:
+        """Build a client binding its methods on first access."""
+        return lambda index: HunterClient(generate_stubs=False, lazy_methods=True)
+
+    def benchmark_method_call(self) -> Callable[[int], Any]:
+        """Call a generated method, the upstream call itself costing nothing."""
+        hunter_client = self.offline_client()
+        return lambda index: hunter_client.verify_email(f"call-{index}@example.com")
+
+    def benchmark_dto_construction(self) -> Callable[[int], Any]:
+        """Build the response DTO of a Hunter payload."""
+        email_dto_class = self.offline_client()._find_dto_class("verify_email")  # noqa: WPS437
+        hunter_data = HUNTER_PAYLOAD["data"]
+        return lambda index: email_dto_class(**hunter_data)
+
+    def benchmark_view_create_miss(self) -> Callable[[int], Any]:
+        """Create an email that is not stored yet, verifying it with the fake Hunter API."""
+        api_client = APIClient()
+        return lambda index: self.check_status(
+            api_client.post(EMAILS_URL, {"email": f"miss{index + 100000}@example.com"}, format="json"),
+            201,
+        )
+
+    def benchmark_view_create_hit(self) -> Callable[[int], Any]:
+        """Create an email that is already stored."""
+        api_client = APIClient()
+        stored_email = self.stored_email()
+        return lambda index: self.check_status(
+            api_client.post(EMAILS_URL, {"email": stored_email.email}, format="json"),
+            200,
+        )
+
+    def benchmark_view_list(self) -> Callable[[int], Any]:
+        """List the stored emails."""
+        api_client = APIClient()
+        self.stored_email()
+        return lambda index: self.check_status(api_client.get(EMAILS_URL), 200)
+
+    def benchmark_view_retrieve(self) -> Callable[[int], Any]:
+        """Retrieve a stored email."""
+        api_client = APIClient()
+        email_url = f"{EMAILS_URL}{self.stored_email().id}/"
+        return lambda index: self.check_status(api_client.get(email_url), 200)
+
+    def benchmark_view_update(self) -> Callable[[int], Any]:
+        """Update the internal status of a stored email."""
+        api_client = APIClient()
+        email_url = f"{EMAILS_URL}{self.stored_email().id}/"
+        return lambda index: self.check_status(
+            api_client.put(email_url, {"internal_status": "completed"}, format="json"),
+            200,
+        )
+
+    def offline_client(self) -> HunterClient:
+        """Return a client whose upstream calls answer a canned payload right away."""
+        hunter_client = HunterClient(generate_stubs=False, rate_limit_backend="memory")
+        hunter_client.rate_limiter = RateLimiter(UnlimitedBucketBackend())
+        hunter_client.send_request = lambda *args, **kwargs: HUNTER_PAYLOAD  # type: ignore
+        return hunter_client
+
+    def stored_email(self) -> Email:
+        """Return an email stored in the benchmark database."""
+        email, _ = Email.objects.get_or_create(
+            email="hit@example.com",
+            defaults={"status": "valid", "score": 90, "disposable": False},
+        )
+        return email
+
+    def check_status(self, response: Any, expected_status: int) -> None:
+        """Stop the benchmark if a view fails, its timings would be meaningless."""
+        if response.status_code != expected_status:
+            raise CommandError(f"Expected status {expected_status}, got {response.status_code}: {response.content!r}")
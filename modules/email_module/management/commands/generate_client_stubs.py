@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    """Generate the .pyi stubs of the service clients whose sources changed."""
+
+    help = "Generate the .pyi stubs of the service clients whose sources changed."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "clients",
+            nargs="*",
+            help="Dotted paths of the client classes, defaults to settings.SERVICE_CLIENTS",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate the stubs even if their sources did not change",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Generate the stubs of every requested client."""
+        for client_path in options["clients"] or settings.SERVICE_CLIENTS:
+            client_class = import_string(client_path)
+            client = client_class(generate_stubs=False)
+            if client._generate_stubs(force=options["force"]):  # noqa: WPS437
+                self.stdout.write(self.style.SUCCESS(f"Generated stubs for {client_path}"))
+            else:
+                self.stdout.write(f"Stubs for {client_path} are up to date")
@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ...services.email_stats import STAT_DIMENSIONS, rebuild_stats
+
+
+class Command(BaseCommand):
+    """Rebuild the email stats from the email table."""
+
+    help = (
+        "Recount the email stats from the email table, e.g. after writes that bypassed DatabaseClient. "
+        "Writes made while it runs may be missed, run it again if the table was busy."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "dimensions",
+            nargs="*",
+            help=f"Dimensions to rebuild, all by default: {', '.join(STAT_DIMENSIONS)}",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild the stats."""
+        unknown_dimensions = set(options["dimensions"]) - set(STAT_DIMENSIONS)
+        if unknown_dimensions:
+            raise CommandError(f"Unknown dimensions: {', '.join(sorted(unknown_dimensions))}")
+
+        stat_count = rebuild_stats(options["dimensions"] or None)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {stat_count} email stats"))
@@ -0,0 +1,40 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...services.hunter_client.fake_server import FakeHunterServer
+
+
+class Command(BaseCommand):
+    """Serve a local stand-in of the Hunter API for offline tests and benchmarks."""
+
+    help = "Serve a local stand-in of the Hunter API for offline tests and benchmarks."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+        parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+        parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing (0 to 1)")
+        parser.add_argument("--error-status", type=int, default=503, help="Status code of the injected errors")
+        parser.add_argument("--domain-size", type=int, default=250, help="Emails returned by domain-search")
+        parser.add_argument("--seed", type=int, default=None, help="Seed of the error injection")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Serve until interrupted."""
+        fake_hunter = FakeHunterServer(
+            host=options["host"],
+            port=options["port"],
+            latency=options["latency"],
+            error_rate=options["error_rate"],
+            error_status=options["error_status"],
+            domain_size=options["domain_size"],
+            seed=options["seed"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Fake Hunter API listening, set HUNTER_API_URL={fake_hunter.base_url}"))
+        try:
+            fake_hunter.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping the fake Hunter API")
+        finally:
+            fake_hunter.stop()
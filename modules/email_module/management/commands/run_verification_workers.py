@@ -0,0 +1,96 @@
+import logging
+import os
+import socket
+import threading
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DatabaseError, close_old_connections, connection
+
+from ...services.hunter_client.hunter_client import HunterClient
+from ...services.job_queue import VerificationJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Run a pool of workers draining the verification job queue."""
+
+    help = "Run a pool of workers draining the verification job queue."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("--workers", type=int, default=4, help="Jobs processed at once")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between polls of an empty queue")
+        parser.add_argument("--drain", action="store_true", help="Exit once the queue is empty")
+        parser.add_argument("--chunk-size", type=int, default=50, help="Addresses verified between progress saves")
+        parser.add_argument("--max-concurrency", type=int, default=10, help="Hunter calls in flight per worker")
+        parser.add_argument(
+            "--stale-after",
+            type=float,
+            default=300,
+            help="Seconds without progress after which a running job is taken over",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Start the workers and wait for them."""
+        hunter_client = HunterClient(generate_stubs=False)
+        stop = threading.Event()
+        worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        workers = [
+            threading.Thread(
+                target=self.work,
+                args=(f"{worker_prefix}:{index}", hunter_client, stop, options),
+                daemon=True,
+            )
+            for index in range(options["workers"])
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                # Short joins keep the main thread responsive to Ctrl+C
+                while worker.is_alive():
+                    worker.join(timeout=0.5)
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping after the jobs in progress")
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+    def work(self, worker: str, hunter_client: HunterClient, stop: threading.Event, options: Any) -> None:
+        """
+        Process jobs until stopped, or until the queue is empty when draining.
+
+        Errors (a locked or restarted database...) are logged and the worker
+        backs off for a poll interval before carrying on, instead of dying.
+        """
+        try:
+            while not stop.is_set():
+                try:
+                    job = VerificationJobQueue.claim(worker, stale_after=options["stale_after"])
+                    if job is None:
+                        if options["drain"]:
+                            return
+                        stop.wait(options["poll_interval"])
+                        continue
+                    job = VerificationJobQueue.process(
+                        job,
+                        hunter_client,
+                        chunk_size=options["chunk_size"],
+                        max_concurrency=options["max_concurrency"],
+                    )
+                except DatabaseError:
+                    logger.exception("Worker %s lost its database connection or lock", worker)
+                    # Drops the connection if the error left it unusable
+                    close_old_connections()
+                    stop.wait(options["poll_interval"])
+                    continue
+                except Exception:
+                    logger.exception("Worker %s failed", worker)
+                    stop.wait(options["poll_interval"])
+                    continue
+                self.stdout.write(f"{worker} {job}: {job.processed}/{job.total} processed")
+        finally:
+            # Every worker thread opened its own database connection
+            connection.close()
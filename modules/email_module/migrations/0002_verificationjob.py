@@ -0,0 +1,47 @@
+# Generated by Django 4.1.7 on 2026-10-17 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("email_module", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VerificationJob",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                    ),
+                ),
+                ("emails", models.JSONField()),
+                ("total", models.IntegerField()),
+                ("processed", models.IntegerField(default=0)),
+                ("results", models.JSONField(blank=True, default=list)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("attempts", models.IntegerField(default=0)),
+                ("worker", models.CharField(blank=True, max_length=200, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("claimed_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="verificationjob",
+            index=models.Index(
+                fields=["status", "id"], name="verification_job_queue_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.1.7 on 2026-10-17 06:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("email_module", "0002_verificationjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmailImport",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("importing", "Importing"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="importing",
+                        max_length=20,
+                    ),
+                ),
+                ("file_format", models.CharField(max_length=20)),
+                ("rows_read", models.IntegerField(default=0)),
+                ("known", models.IntegerField(default=0)),
+                ("queued", models.IntegerField(default=0)),
+                ("invalid", models.IntegerField(default=0)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="verificationjob",
+            name="email_import",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="jobs",
+                to="email_module.emailimport",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.7 on 2026-10-17 07:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("email_module", "0003_emailimport"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="email",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.1.7 on 2026-10-17 08:15
+
+from typing import Any
+
+from django.db import migrations, models
+from django.db.models.functions import Lower, StrIndex, Substr
+
+
+def backfill_domains(apps: Any, schema_editor: Any) -> None:
+    """Set the domain of the emails stored before it was derived from the address."""
+    Email = apps.get_model("email_module", "Email")  # noqa: N806
+    Email.objects.filter(domain="").update(
+        domain=Lower(Substr("email", StrIndex("email", models.Value("@")) + 1)),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("email_module", "0004_email_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_domains, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="email",
+            index=models.Index(fields=["status", "id"], name="email_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="email",
+            index=models.Index(fields=["internal_status", "id"], name="email_internal_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="email",
+            index=models.Index(fields=["domain", "id"], name="email_domain_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="email",
+            index=models.Index(fields=["disposable", "id"], name="email_disposable_idx"),
+        ),
+    ]
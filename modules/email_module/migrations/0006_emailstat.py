@@ -0,0 +1,28 @@
+# Generated by Django 4.1.7 on 2026-10-17 09:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("email_module", "0005_email_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmailStat",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("dimension", models.CharField(max_length=50)),
+                ("value", models.CharField(max_length=200)),
+                ("count", models.IntegerField(default=0)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["dimension", "-count"], name="email_stat_top_idx")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="emailstat",
+            constraint=models.UniqueConstraint(fields=("dimension", "value"), name="email_stat_unique"),
+        ),
+    ]
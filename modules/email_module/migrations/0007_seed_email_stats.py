@@ -0,0 +1,41 @@
+# Generated by Django 4.1.7 on 2026-10-17 10:20
+
+from typing import Any
+
+from django.db import migrations
+from django.db.models import Count
+
+# The dimensions of services.email_stats at the time of this migration
+STAT_DIMENSIONS = ("status", "internal_status", "disposable", "domain")
+
+
+def stat_value(column_value: Any) -> str:
+    """Return the key a column value is counted under."""
+    if column_value is None:
+        return "null"
+    if isinstance(column_value, bool):
+        return "true" if column_value else "false"
+    return str(column_value)
+
+
+def seed_email_stats(apps: Any, schema_editor: Any) -> None:
+    """Count the emails stored before the stats were maintained, one GROUP BY per dimension."""
+    Email = apps.get_model("email_module", "Email")  # noqa: N806
+    EmailStat = apps.get_model("email_module", "EmailStat")  # noqa: N806
+    EmailStat.objects.all().delete()
+    for dimension in STAT_DIMENSIONS:
+        dimension_counts = Email.objects.values_list(dimension).annotate(email_count=Count("id")).order_by()
+        EmailStat.objects.bulk_create(
+            EmailStat(dimension=dimension, value=stat_value(column_value), count=email_count)
+            for column_value, email_count in dimension_counts
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("email_module", "0006_emailstat"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_email_stats, migrations.RunPython.noop),
+    ]
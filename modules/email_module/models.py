@@ -26,7 +26,112 @@ class Email(models.Model):
         null=True,
         default="pending",
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # The list endpoint filters on one of these columns and pages by id
+        indexes = [
+            models.Index(fields=["status", "id"], name="email_status_idx"),
+            models.Index(fields=["internal_status", "id"], name="email_internal_status_idx"),
+            models.Index(fields=["domain", "id"], name="email_domain_idx"),
+            models.Index(fields=["disposable", "id"], name="email_disposable_idx"),
+        ]
 
     def __str__(self) -> str:
         """Return a string representation of the Email object."""
         return self.email
+
+
+class EmailStat(models.Model):
+    """Represents the number of stored emails sharing a value of one of their columns."""
+
+    objects = models.Manager()  # noqa WPS110
+    id = models.AutoField(primary_key=True)
+
+    dimension = models.CharField(max_length=50)
+    value = models.CharField(max_length=200)  # noqa WPS110
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["dimension", "value"], name="email_stat_unique")]
+        # The stats endpoint reads the most frequent values of a dimension
+        indexes = [models.Index(fields=["dimension", "-count"], name="email_stat_top_idx")]
+
+    def __str__(self) -> str:
+        """Return a string representation of the EmailStat object."""
+        return f"{self.dimension}={self.value}: {self.count}"
+
+
+class EmailImport(models.Model):
+    """Represents an uploaded list of email addresses, imported as it streams in."""
+
+    IMPORTING = "importing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (IMPORTING, "Importing"),
+        (COMPLETED, "Completed"),
+        (FAILED, "Failed"),
+    ]
+
+    objects = models.Manager()  # noqa WPS110
+    id = models.AutoField(primary_key=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=IMPORTING)
+    file_format = models.CharField(max_length=20)
+    rows_read = models.IntegerField(default=0)
+    known = models.IntegerField(default=0)
+    queued = models.IntegerField(default=0)
+    invalid = models.IntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self) -> str:
+        """Return a string representation of the EmailImport object."""
+        return f"Email import {self.id} ({self.status})"
+
+
+class VerificationJob(models.Model):
+    """Represents email addresses queued for verification by the background workers."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (COMPLETED, "Completed"),
+        (FAILED, "Failed"),
+    ]
+
+    objects = models.Manager()  # noqa WPS110
+    id = models.AutoField(primary_key=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED)
+    emails = models.JSONField()
+    total = models.IntegerField()
+    processed = models.IntegerField(default=0)
+    results = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True, null=True)
+    attempts = models.IntegerField(default=0)
+    worker = models.CharField(max_length=200, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    email_import = models.ForeignKey(
+        EmailImport,
+        blank=True,
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="jobs",
+    )
+
+    class Meta:
+        # Workers look jobs up by status, oldest first
+        indexes = [models.Index(fields=["status", "id"], name="verification_job_queue_idx")]
+
+    def __str__(self) -> str:
+        """Return a string representation of the VerificationJob object."""
+        return f"Verification job {self.id} ({self.status})"
@@ -0,0 +1,48 @@
+from typing import Any, List, Optional
+
+from django.db import models
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class EmailCursorPagination(CursorPagination):
+    """
+    Keyset pagination of the email list on the primary key.
+
+    Pages are fetched with ``WHERE id > <last id> ORDER BY id LIMIT <size>``
+    behind an opaque cursor, so a page costs the same wherever it is in the
+    table. The total is only counted when asked for with ``?with_count=true``.
+    """
+
+    ordering = "id"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    count_query_param = "with_count"
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet,
+        request: Request,
+        view: Optional[APIView] = None,
+    ) -> Optional[List[Any]]:
+        """Paginate the queryset, counting it first if the client asked for the total."""
+        self.count: Optional[int] = None
+        if request.query_params.get(self.count_query_param, "").lower() in {"1", "true"}:
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: Any) -> Response:  # noqa: WPS110
+        """Return the page with its links, and its total when it was counted."""
+        response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data["count"] = self.count
+        return response
+
+    def get_paginated_response_schema(self, schema: Any) -> Any:
+        """Document the optional total of the paginated response."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"] = {"type": "integer", "example": 123}
+        return response_schema
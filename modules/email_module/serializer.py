@@ -1,6 +1,9 @@
+from typing import Any, Dict
+
+from django.db.models import Count, Sum
 from rest_framework import serializers
 
-from .models import Email
+from .models import Email, EmailImport, VerificationJob
 
 # Serializers define the API representation.
 # They are used to convert model instances to JSON.
@@ -27,6 +30,17 @@ class CreateEmailSerializer(serializers.ModelSerializer):
         fields = ["email"]
 
 
+class BulkEmailSerializer(serializers.Serializer):
+    """Serializer for validating a bulk verification request."""
+
+    emails = serializers.ListField(
+        child=serializers.CharField(),
+        min_length=1,
+        max_length=1000,
+        help_text="Email addresses to verify and store in database, invalid ones are reported per item",
+    )
+
+
 class UpdateEmailSerializer(serializers.ModelSerializer):
     """Serializer for updating the internal status of an email."""
 
@@ -46,3 +60,102 @@ class UpdateEmailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Email
         fields = ["internal_status"]
+
+
+class EmailFilterSerializer(serializers.Serializer):
+    """Serializer for validating the filters selecting a set of emails."""
+
+    status = serializers.CharField(required=False, help_text="Verification status of the emails")
+    # Any stored value, not only those an update can set
+    internal_status = serializers.CharField(required=False, help_text="Internal status of the emails")
+    domain = serializers.CharField(required=False, help_text="Domain of the emails")
+    disposable = serializers.BooleanField(required=False, help_text="Whether the emails are disposable")
+
+    def validate_domain(self, domain: str) -> str:
+        """Domains are stored lower-cased."""
+        return domain.lower()
+
+
+class BulkUpdateEmailSerializer(serializers.Serializer):
+    """Serializer for validating a bulk internal status update."""
+
+    internal_status = serializers.ChoiceField(
+        choices=UpdateEmailSerializer.internal_status_choices,
+        required=True,
+        help_text="Internal status to set",
+    )
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        min_length=1,
+        max_length=10000,
+        help_text="IDs of the emails to update",
+    )
+    filters = EmailFilterSerializer(required=False, help_text="Filters selecting the emails to update")
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """Require exactly one way of selecting the emails, never the whole table by accident."""
+        if ("ids" in attrs) == ("filters" in attrs):
+            raise serializers.ValidationError("Provide either ids or filters.")
+        if "filters" in attrs and not attrs["filters"]:
+            raise serializers.ValidationError({"filters": "Provide at least one filter."})
+        return attrs
+
+
+class VerificationJobSerializer(serializers.ModelSerializer):
+    """Serializer for reporting the progress of a verification job."""
+
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = VerificationJob
+        fields = [
+            "id",
+            "status",
+            "total",
+            "processed",
+            "progress",
+            "results",
+            "error",
+            "created_at",
+            "claimed_at",
+            "finished_at",
+        ]
+
+    def get_progress(self, job: VerificationJob) -> float:
+        """Return the share of the addresses processed so far."""
+        return round(job.processed / job.total, 4) if job.total else 1.0
+
+
+class EmailImportSerializer(serializers.ModelSerializer):
+    """Serializer for reporting the progress of an email import and of its verification."""
+
+    verification = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EmailImport
+        fields = [
+            "id",
+            "status",
+            "file_format",
+            "rows_read",
+            "known",
+            "queued",
+            "invalid",
+            "verification",
+            "error",
+            "created_at",
+            "finished_at",
+        ]
+
+    def get_verification(self, email_import: EmailImport) -> Dict[str, Any]:
+        """Return the progress of the import's verification jobs, summed in a single query."""
+        totals = email_import.jobs.aggregate(jobs=Count("id"), total=Sum("total"), processed=Sum("processed"))
+        total = totals["total"] or 0
+        processed = totals["processed"] or 0
+        return {
+            "jobs": totals["jobs"],
+            "total": total,
+            "processed": processed,
+            "progress": round(processed / total, 4) if total else 1.0,
+        }
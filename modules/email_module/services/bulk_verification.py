@@ -0,0 +1,59 @@
+from typing import Any, Dict, Iterable, List
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+
+from .db_client import DatabaseClient
+from .hunter_client.hunter_client import HunterClient
+
+
+def verify_and_store_emails(
+    hunter_client: HunterClient,
+    emails: Iterable[str],
+    max_concurrency: int = 10,
+) -> List[Dict[str, Any]]:
+    """
+    Verify and store many email addresses at once.
+
+    Stored addresses are found with a single query, only the missing ones are
+    verified, concurrently, and they are stored with a single insert.
+
+    Returns:
+        List[Dict[str, Any]]: One result per distinct address, in input order,
+            with its outcome (``existing``, ``created``, ``invalid`` or ``failed``).
+    """
+    addresses: List[str] = list(dict.fromkeys(email.strip() for email in emails))
+    results: Dict[str, Dict[str, Any]] = {}
+    valid_addresses = []
+    for email in addresses:
+        try:
+            validate_email(email)
+        except ValidationError:
+            results[email] = {"email": email, "outcome": "invalid", "error": "Enter a valid email address."}
+            continue
+        valid_addresses.append(email)
+
+    stored_emails = DatabaseClient.get_emails_by_addresses(valid_addresses)
+    for email, email_data in stored_emails.items():
+        results[email] = {"email": email, "outcome": "existing", "data": email_data}
+
+    missing_addresses = [email for email in valid_addresses if email not in stored_emails]
+    verified_emails = []
+    batch_results = hunter_client.batch("verify_email", missing_addresses, max_concurrency=max_concurrency)
+    for batch_result in batch_results:
+        email = batch_result.args[0]
+        if not batch_result.ok:
+            results[email] = {"email": email, "outcome": "failed", "error": "Failed to verify email"}
+            continue
+        verified_emails.append({
+            "email": email,
+            "status": batch_result.result.status,
+            "score": batch_result.result.score,
+            "disposable": batch_result.result.disposable,
+        })
+
+    if verified_emails:
+        for email, email_data in DatabaseClient.bulk_store_emails(verified_emails).items():
+            results[email] = {"email": email, "outcome": "created", "data": email_data}
+
+    return [results[email] for email in addresses]
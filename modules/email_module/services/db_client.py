@@ -1,10 +1,29 @@
-from typing import Any, Dict, Optional
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count
 from django.forms.models import model_to_dict
+from django.utils import timezone
 
 from ..models import Email
+from .email_stats import (
+    STAT_DIMENSIONS,
+    StatKey,
+    apply_stat_deltas,
+    email_stat_deltas,
+    stat_value,
+)
+
+
+def _email_domain(email: str) -> str:
+    return email.rsplit("@", 1)[-1].lower()
+
+
+def _stat_columns(email_obj: Email) -> Dict[str, Any]:
+    return {dimension: getattr(email_obj, dimension) for dimension in STAT_DIMENSIONS}
 
 
 class DatabaseClient:
@@ -44,17 +63,28 @@ class DatabaseClient:
         raise_exception: bool = False,
         **update_params: Any,
     ) -> Optional[Email]:
-        """Update email."""
-        try:
-            email_obj: Email = Email.objects.get(pk=email_id)
-            for key, update_val in update_params.items():
-                setattr(email_obj, key, update_val)
-            email_obj.save()
-            return email_obj
-        except Email.DoesNotExist:
-            if raise_exception:
-                raise ObjectDoesNotExist(f"Email with id {email_id} does not exist.")
-            return None
+        """Update email, and the stats of the columns it changes."""
+        with transaction.atomic():
+            # Locked, so concurrent updates of the email apply their stat deltas one after the other
+            email_obj: Optional[Email] = Email.objects.select_for_update().filter(pk=email_id).first()
+            updated_count = 0
+            if email_obj is not None:
+                old_columns = _stat_columns(email_obj)
+                for key, update_val in update_params.items():
+                    setattr(email_obj, key, update_val)
+                # An UPDATE statement does not run auto_now, so updated_at is set here
+                email_obj.updated_at = timezone.now()
+                updated_count = Email.objects.filter(pk=email_id).update(
+                    updated_at=email_obj.updated_at,
+                    **update_params,
+                )
+            # A concurrent delete may have won on databases without row locks (SQLite)
+            if updated_count:
+                apply_stat_deltas(email_stat_deltas(added=[_stat_columns(email_obj)], removed=[old_columns]))
+                return email_obj
+        if raise_exception:
+            raise ObjectDoesNotExist(f"Email with id {email_id} does not exist.")
+        return None
 
     @staticmethod
     def store_email(
@@ -64,24 +94,162 @@ class DatabaseClient:
         disposable: bool,
         raise_exception: bool = False,
     ) -> Optional[Dict[str, Any]]:
-        """Store email."""
+        """Store email, counting it in the stats if it is new."""
         try:
             store_params = {
                 "email": email,
                 "status": status,
                 "score": score,
                 "disposable": disposable,
+                "domain": _email_domain(email),
             }
-            email_obj, created = Email.objects.get_or_create(
-                email=email,
-                defaults=store_params,
-            )
-            return model_to_dict(email_obj)
+            with transaction.atomic():
+                email_obj, created = Email.objects.get_or_create(
+                    email=email,
+                    defaults=store_params,
+                )
+                email_data = model_to_dict(email_obj)
+                if created:
+                    apply_stat_deltas(email_stat_deltas(added=[email_data]))
+            return email_data
         except IntegrityError:
             if raise_exception:
                 raise IntegrityError(f"Email {email} is already in use.")
             return None
 
+    @staticmethod
+    def delete_email(email_id: int) -> bool:
+        """Delete email, discounting it from the stats. Returns whether it existed."""
+        with transaction.atomic():
+            email_obj = Email.objects.select_for_update().filter(pk=email_id).first()
+            if email_obj is None:
+                return False
+            old_columns = _stat_columns(email_obj)
+            deleted_count, _ = Email.objects.filter(pk=email_id).delete()
+            # A concurrent delete may have won on databases without row locks (SQLite)
+            if deleted_count:
+                apply_stat_deltas(email_stat_deltas(removed=[old_columns]))
+        return bool(deleted_count)
+
+    @staticmethod
+    def filter_emails(queryset: models.QuerySet, filters: Dict[str, Any]) -> models.QuerySet:
+        """Filter emails on exact column values, in a shape their indexes can serve."""
+        lookups: Dict[str, Any] = {}
+        for field_name, field_value in filters.items():
+            if isinstance(field_value, bool):
+                # SQLite compiles ``disposable = true`` to a bare column test, which no index serves
+                lookups[f"{field_name}__in"] = [field_value]
+            else:
+                lookups[field_name] = field_value
+        return queryset.filter(**lookups)
+
+    @staticmethod
+    def bulk_update_internal_status(
+        internal_status: str,
+        email_ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Set the internal status of the emails selected by IDs or filters, in a single UPDATE.
+
+        Emails already in that status are left out, so their ``updated_at``
+        does not move. Returns the number of emails updated.
+        """
+        queryset = DatabaseClient.filter_emails(Email.objects.all(), filters or {})
+        if email_ids is not None:
+            queryset = queryset.filter(pk__in=email_ids)
+        queryset = queryset.exclude(internal_status=internal_status)
+        with transaction.atomic():
+            # The statuses being replaced, counted over the same index as the update
+            old_statuses = queryset.values_list("internal_status").annotate(email_count=Count("id")).order_by()
+            deltas: Counter[StatKey] = Counter()
+            for old_status, email_count in old_statuses:
+                deltas[("internal_status", stat_value(old_status))] -= email_count
+                deltas[("internal_status", stat_value(internal_status))] += email_count
+            # An UPDATE statement does not run auto_now, so updated_at is set here
+            updated_count = queryset.update(internal_status=internal_status, updated_at=timezone.now())
+            apply_stat_deltas(deltas)
+        return updated_count
+
+    @staticmethod
+    async def aget_email_by_address(email: str) -> Optional[Dict[str, Any]]:
+        """Get email by address, without blocking the event loop."""
+        email_instance = await Email.objects.filter(email=email).afirst()
+        return model_to_dict(email_instance) if email_instance is not None else None
+
+    @staticmethod
+    async def aupdate_email(
+        email_id: int,
+        raise_exception: bool = False,
+        **update_params: Any,
+    ) -> Optional[Email]:
+        """Update email, and the stats of the columns it changes, without blocking the event loop."""
+        # The row is read, locked and written in one transaction, which the async ORM cannot open
+        return await sync_to_async(DatabaseClient.update_email)(email_id, raise_exception, **update_params)
+
+    @staticmethod
+    async def adelete_email(email_id: int) -> bool:
+        """Delete email, discounting it from the stats, without blocking the event loop."""
+        # Like aupdate_email, the row is locked for the read and the delete
+        return await sync_to_async(DatabaseClient.delete_email)(email_id)
+
+    @staticmethod
+    async def astore_email(
+        email: str,
+        status: str,
+        score: float,
+        disposable: bool,
+        raise_exception: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Store email, counting it in the stats if it is new, without blocking the event loop."""
+        # The insert and its stats are committed together, in one transaction
+        return await sync_to_async(DatabaseClient.store_email)(email, status, score, disposable, raise_exception)
+
+    @staticmethod
+    def get_emails_by_addresses(emails: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the stored emails among the given addresses, in a single query."""
+        return {
+            email_instance.email: model_to_dict(email_instance)
+            for email_instance in Email.objects.filter(email__in=list(emails))
+        }
+
+    @staticmethod
+    def get_stored_addresses(emails: Iterable[str]) -> Set[str]:
+        """Get the addresses already stored among the given ones, in a single query."""
+        return set(Email.objects.filter(email__in=list(emails)).values_list("email", flat=True))
+
+    @staticmethod
+    def bulk_store_emails(emails_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Store emails with a single insert, skipping the addresses already stored.
+
+        Only the addresses missing when read are inserted, all or nothing, so
+        exactly the rows this call inserted are counted in the stats. If another
+        request stored some of them in between, the insert fails and is retried
+        with what is still missing. The stored emails are read back, by address,
+        in one more query.
+        """
+        addresses = [email_data["email"] for email_data in emails_data]
+        with transaction.atomic():
+            while True:
+                previously_stored = DatabaseClient.get_stored_addresses(addresses)
+                new_emails: Dict[str, Email] = {}
+                for email_data in emails_data:
+                    # The first of repeated addresses is stored
+                    if email_data["email"] not in previously_stored and email_data["email"] not in new_emails:
+                        new_emails[email_data["email"]] = Email(domain=_email_domain(email_data["email"]), **email_data)
+                try:
+                    # A savepoint, so a lost race only rolls the insert back
+                    with transaction.atomic():
+                        Email.objects.bulk_create(new_emails.values())
+                except IntegrityError:
+                    # Every retry reads at least one more stored address, so this ends
+                    continue
+                break
+            apply_stat_deltas(email_stat_deltas(added=[_stat_columns(email_obj) for email_obj in new_emails.values()]))
+            stored_emails = DatabaseClient.get_emails_by_addresses(addresses)
+        return stored_emails
+
     # Example methods for retrieving collections of emails
     @staticmethod
     def get_all_emails() -> models.QuerySet:
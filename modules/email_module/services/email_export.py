@@ -0,0 +1,69 @@
+import csv
+import io
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+# Content type of each export format
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _ndjson_encoder(field_names: Sequence[str]) -> Callable[[Sequence[Any]], str]:
+    encoder = DjangoJSONEncoder()
+
+    def encode_row(row: Sequence[Any]) -> str:  # noqa: WPS430
+        return encoder.encode(dict(zip(field_names, row))) + "\n"
+
+    return encode_row
+
+
+def _csv_encoder(field_names: Sequence[str]) -> Callable[[Sequence[Any]], str]:
+    # The writer formats one row into the buffer, which is emptied right away
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode_row(row: Sequence[Any]) -> str:  # noqa: WPS430
+        writer.writerow(row)
+        encoded_row = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return encoded_row
+
+    return encode_row
+
+
+ROW_ENCODERS: Dict[str, Callable[[Sequence[str]], Callable[[Sequence[Any]], str]]] = {
+    "ndjson": _ndjson_encoder,
+    "csv": _csv_encoder,
+}
+
+
+def iter_export(
+    queryset: models.QuerySet,
+    field_names: List[str],
+    export_format: str,
+    chunk_size: int = 2000,
+) -> Iterator[str]:
+    """
+    Encode the rows of a queryset as NDJSON or CSV, chunk by chunk.
+
+    Rows are fetched as tuples with ``values_list(...).iterator()``, through a
+    server-side cursor where the database has one, so neither the rows nor the
+    encoded output are ever held in memory as a whole. Each yielded string
+    holds up to ``chunk_size`` encoded rows.
+    """
+    encode_row = ROW_ENCODERS[export_format](field_names)
+    encoded_rows: List[str] = []
+    if export_format == "csv":
+        encoded_rows.append(encode_row(field_names))
+    for row in queryset.values_list(*field_names).iterator(chunk_size=chunk_size):
+        encoded_rows.append(encode_row(row))
+        if len(encoded_rows) >= chunk_size:
+            yield "".join(encoded_rows)
+            encoded_rows.clear()
+    if encoded_rows:
+        yield "".join(encoded_rows)
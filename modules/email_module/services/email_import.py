@@ -0,0 +1,134 @@
+import codecs
+import csv
+import json
+from itertools import islice
+from typing import IO, Dict, Iterable, Iterator, List
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import EmailImport
+from .db_client import DatabaseClient
+from .job_queue import VerificationJobQueue
+
+# Content types of the accepted upload formats
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json-seq": "ndjson",
+}
+
+
+def iter_lines(stream: IO[bytes]) -> Iterator[str]:
+    """Decode a binary stream line by line, never holding more than one line."""
+    # The incremental decoder copes with characters split across reads and a leading BOM
+    return codecs.iterdecode(iter(stream.readline, b""), "utf-8-sig", errors="replace")
+
+
+def iter_csv_addresses(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the addresses of a CSV file.
+
+    The addresses are read from the ``email`` column when the header row has
+    one, otherwise from the first column, the first row being data unless it
+    holds no address.
+    """
+    reader = csv.reader(lines)
+    first_row = next(reader, None)
+    if first_row is None:
+        return
+    header = [column.strip().lower() for column in first_row]
+    column_index = 0
+    if "email" in header:
+        column_index = header.index("email")
+    elif first_row and "@" in first_row[0]:
+        yield first_row[0]
+    for row in reader:
+        if not row:
+            continue
+        yield row[column_index] if len(row) > column_index else ""
+
+
+def iter_ndjson_addresses(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the addresses of an NDJSON file.
+
+    Each line holds either an address or an object with an ``email`` key;
+    malformed lines are yielded as they are, to be counted as invalid.
+    """
+    for line in lines:
+        stripped_line = line.strip()
+        if not stripped_line:
+            continue
+        try:
+            record = json.loads(stripped_line)
+        except ValueError:
+            yield stripped_line
+            continue
+        if isinstance(record, dict):
+            record = record.get("email", "")
+        yield record if isinstance(record, str) else ""
+
+
+ADDRESS_READERS = {
+    "csv": iter_csv_addresses,
+    "ndjson": iter_ndjson_addresses,
+}
+
+
+def import_emails(
+    email_import: EmailImport,
+    stream: IO[bytes],
+    chunk_size: int = 500,
+) -> EmailImport:
+    """
+    Import the addresses of an uploaded file as it is read.
+
+    The file is parsed incrementally and handled ``chunk_size`` rows at a
+    time, so memory use does not grow with its size. For every chunk the
+    stored addresses are found with a single query, the unknown ones are
+    queued as one verification job, and the import progress is saved.
+    """
+    addresses = ADDRESS_READERS[email_import.file_format](iter_lines(stream))
+    try:
+        while True:
+            chunk = list(islice(addresses, chunk_size))
+            if not chunk:
+                break
+            _import_chunk(email_import, chunk)
+        email_import.status = EmailImport.COMPLETED
+    except Exception as err:
+        email_import.status = EmailImport.FAILED
+        email_import.error = str(err)
+    email_import.finished_at = timezone.now()
+    email_import.save(update_fields=["status", "error", "finished_at"])
+    return email_import
+
+
+def _import_chunk(email_import: EmailImport, chunk: List[str]) -> None:
+    # Within a chunk duplicates are dropped; across chunks the workers skip stored addresses
+    addresses: Dict[str, None] = {}
+    invalid = 0
+    for row_email in chunk:
+        email = row_email.strip()
+        try:
+            validate_email(email)
+        except ValidationError:
+            invalid += 1
+            continue
+        addresses[email] = None
+
+    stored_addresses = DatabaseClient.get_stored_addresses(addresses)
+    unknown_addresses = [email for email in addresses if email not in stored_addresses]
+    with transaction.atomic():
+        if unknown_addresses:
+            VerificationJobQueue.enqueue(unknown_addresses, email_import=email_import)
+        email_import.rows_read += len(chunk)
+        email_import.known += len(stored_addresses)
+        email_import.queued += len(unknown_addresses)
+        email_import.invalid += invalid
+        email_import.save(update_fields=["rows_read", "known", "queued", "invalid"])
@@ -0,0 +1,90 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from ..models import Email, EmailStat
+
+# Email columns counted per value
+STAT_DIMENSIONS = ("status", "internal_status", "disposable", "domain")
+
+StatKey = Tuple[str, str]
+
+
+def stat_value(column_value: Any) -> str:
+    """Return the key a column value is counted under."""
+    if column_value is None:
+        return "null"
+    if isinstance(column_value, bool):
+        return "true" if column_value else "false"
+    return str(column_value)
+
+
+def email_stat_keys(email_data: Mapping[str, Any]) -> Iterable[StatKey]:
+    """Return the stat keys an email counts towards, from its instance values or dict."""
+    return [(dimension, stat_value(email_data.get(dimension))) for dimension in STAT_DIMENSIONS]
+
+
+def email_stat_deltas(
+    added: Iterable[Mapping[str, Any]] = (),
+    removed: Iterable[Mapping[str, Any]] = (),
+) -> "Counter[StatKey]":
+    """Return the stat changes of emails being added, removed, or both for updated ones."""
+    deltas: Counter[StatKey] = Counter()
+    for added_email in added:
+        deltas.update(email_stat_keys(added_email))
+    for removed_email in removed:
+        deltas.subtract(email_stat_keys(removed_email))
+    return deltas
+
+
+def apply_stat_deltas(deltas: Mapping[StatKey, int]) -> None:
+    """Add the deltas to the stats, with one UPDATE per changed key."""
+    with transaction.atomic():
+        for (dimension, column_value), delta in deltas.items():
+            if not delta:
+                continue
+            stat = EmailStat.objects.filter(dimension=dimension, value=column_value)
+            if not stat.update(count=F("count") + delta):
+                EmailStat.objects.get_or_create(dimension=dimension, value=column_value)
+                stat.update(count=F("count") + delta)
+
+
+def get_stats(top_domains: int = 20) -> Dict[str, Any]:
+    """
+    Read the stats of the stored emails.
+
+    Every value of ``status``, ``internal_status`` and ``disposable`` is
+    reported, and the ``top_domains`` most frequent domains, each dimension
+    being read off the index of the stats table whatever the number of emails.
+    """
+    stats: Dict[str, Any] = {}
+    for dimension in STAT_DIMENSIONS:
+        dimension_stats = EmailStat.objects.filter(dimension=dimension, count__gt=0).order_by("-count", "value")
+        if dimension == "domain":
+            dimension_stats = dimension_stats[:top_domains]
+        stats[dimension] = dict(dimension_stats.values_list("value", "count"))
+    stats["total"] = sum(stats["status"].values())
+    return stats
+
+
+def rebuild_stats(dimensions: Optional[Iterable[str]] = None) -> int:
+    """
+    Recount the stats from the email table, one GROUP BY per dimension.
+
+    Returns:
+        int: The number of stats written.
+    """
+    rebuilt_stats = []
+    with transaction.atomic():
+        for dimension in dimensions or STAT_DIMENSIONS:
+            EmailStat.objects.filter(dimension=dimension).delete()
+            rebuilt_stats.extend(
+                EmailStat(dimension=dimension, value=stat_value(column_value), count=email_count)
+                for column_value, email_count in (
+                    Email.objects.values_list(dimension).annotate(email_count=Count("id")).order_by()
+                )
+            )
+        EmailStat.objects.bulk_create(rebuilt_stats)
+    return len(rebuilt_stats)
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+DISPOSABLE_DOMAINS = frozenset(("mailinator.com", "yopmail.com", "guerrillamail.com"))
+WEBMAIL_DOMAINS = frozenset(("gmail.com", "yahoo.com", "outlook.com", "hotmail.com"))
+
+FakeResponse = Tuple[int, Dict[str, Any]]
+
+
+def _stable_score(seed_value: str) -> int:
+    # Same input, same score, in every process
+    return int(hashlib.sha256(seed_value.encode()).hexdigest()[:8], 16) % 101
+
+
+def _missing_param(param: str) -> FakeResponse:
+    return 400, {"errors": [{"id": "wrong_params", "code": 400, "details": f"You are missing the {param} parameter"}]}
+
+
+class FakeHunterServer:
+    """
+    Local HTTP stand-in for the Hunter endpoints of methods.json.
+
+    Answers ``email-verifier``, ``email-count``, ``domain-search`` (offset/limit
+    paginated over ``domain_size`` emails) and ``email-finder`` with
+    deterministic Hunter-shaped payloads. Every request waits ``latency``
+    seconds, and a share ``error_rate`` of them fails with ``error_status``, so
+    throughput and latency can be measured repeatably without the network:
+
+        with FakeHunterServer(latency=0.05, error_rate=0.01) as fake_hunter:
+            hunter_client = HunterClient(base_url=fake_hunter.base_url)
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        domain_size: int = 250,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize a new instance of the FakeHunterServer class."""
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.domain_size = domain_size
+        self.request_count = 0
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Callable[[Dict[str, str]], FakeResponse]] = {
+            "email-verifier": self._verify_email,
+            "email-count": self._count_domain_emails,
+            "domain-search": self._domain_search,
+            "email-finder": self._find_email,
+        }
+        self._server = ThreadingHTTPServer((host, port), self._build_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL to use as ``HUNTER_API_URL``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeHunterServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests from the current thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeHunterServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def respond(self, path: str) -> FakeResponse:
+        """Return the status code and payload of a request path."""
+        url_parts = urlsplit(path)
+        endpoint = url_parts.path.rstrip("/").rsplit("/", 1)[-1]
+        with self._lock:
+            self.request_count += 1
+            inject_error = self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if inject_error:
+            return self.error_status, {"errors": [{"id": "injected_error", "code": self.error_status}]}
+
+        endpoint_handler = self._endpoints.get(endpoint)
+        if endpoint_handler is None:
+            return 404, {"errors": [{"id": "not_found", "code": 404, "details": f"Unknown endpoint {endpoint}"}]}
+        return endpoint_handler(dict(parse_qsl(url_parts.query)))
+
+    def _build_handler(self) -> type:
+        fake_server = self
+
+        class FakeHunterRequestHandler(BaseHTTPRequestHandler):  # noqa: WPS431
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes: with Nagle on, keep-alive requests stall on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:  # noqa: N802
+                status_code, payload = fake_server.respond(self.path)
+                body = json.dumps(payload).encode()
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status_code in {429, 503}:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                """Keep benchmark and test output quiet."""
+
+        return FakeHunterRequestHandler
+
+    def _verify_email(self, query: Dict[str, str]) -> FakeResponse:
+        email = query.get("email")
+        if not email:
+            return _missing_param("email")
+        domain = email.rsplit("@", 1)[-1].lower()
+        score = _stable_score(email)
+        disposable = domain in DISPOSABLE_DOMAINS
+        valid = score >= 50 and not disposable
+        return 200, {"data": {
+            "status": "valid" if valid else "invalid",
+            "result": "deliverable" if valid else "undeliverable",
+            "score": score,
+            "email": email,
+            "disposable": disposable,
+            "webmail": domain in WEBMAIL_DOMAINS,
+            "accept_all": False,
+        }}
+
+    def _count_domain_emails(self, query: Dict[str, str]) -> FakeResponse:
+        domain = query.get("domain")
+        if not domain:
+            return _missing_param("domain")
+        generic_emails = self.domain_size // 5
+        return 200, {"data": {
+            "total": self.domain_size,
+            "personal_emails": self.domain_size - generic_emails,
+            "generic_emails": generic_emails,
+        }}
+
+    def _domain_search(self, query: Dict[str, str]) -> FakeResponse:
+        domain = query.get("domain")
+        if not domain:
+            return _missing_param("domain")
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 10))
+        emails = [
+            {"value": f"user{index}@{domain}", "type": "personal", "confidence": _stable_score(f"{index}@{domain}")}
+            for index in range(offset, min(offset + limit, self.domain_size))
+        ]
+        return 200, {
+            "data": {"domain": domain, "emails": emails},
+            "meta": {"results": self.domain_size, "limit": limit, "offset": offset},
+        }
+
+    def _find_email(self, query: Dict[str, str]) -> FakeResponse:
+        for param in ("first_name", "last_name", "domain"):
+            if not query.get(param):
+                return _missing_param(param)
+        email = f"{query['first_name']}.{query['last_name']}@{query['domain']}".lower()
+        return 200, {"data": {
+            "first_name": query["first_name"],
+            "last_name": query["last_name"],
+            "email": email,
+            "score": _stable_score(email),
+            "domain": query["domain"],
+        }}
@@ -1,11 +1,16 @@
 import os
 from typing import Dict, Optional, Any
 
-from utils.base_fetcher import BaseFetcher
+from django.conf import settings
+
+from utils.async_base_fetcher import AsyncBaseFetcher
+from utils.cassette import Cassette, cassette_transports
 from utils.client_services_manager.client_services_manager import ClientServicesManager
+from utils.client_services_manager.response_cache import DjangoCacheBackend, ResponseCache
+from utils.rate_limiter import RateLimiter, build_bucket_backend
 
 
-class HunterClient(BaseFetcher, ClientServicesManager):
+class HunterClient(AsyncBaseFetcher, ClientServicesManager):
     """
     Client for interacting with the Hunter API.
 
@@ -14,12 +19,78 @@ class HunterClient(BaseFetcher, ClientServicesManager):
         - count_domain_emails({domain: str})
         - domain_search({domain: str})
         - find_email({first_name: str, last_name: str, domain: str})
+
+    Each dynamic method has a coroutine twin prefixed with ``a``
+    (e.g. ``await hunter_client.averify_email(email)``). ``domain_search`` is
+    paginated: ``iter_domain_search(domain)`` yields every email of the domain.
     """
 
-    def __init__(self) -> None:
-        """Initialize the HunterClient with necessary configurations."""
-        BaseFetcher.__init__(self, base_url=os.getenv("HUNTER_API_URL", ""))
-        ClientServicesManager.__init__(self)
+    def __init__(
+        self,
+        generate_stubs: Optional[bool] = None,
+        lazy_methods: bool = False,
+        **fetcher_options: Any,
+    ) -> None:
+        """
+        Initialize the HunterClient with necessary configurations.
+
+        Connection pool sizes and timeouts default to the ``HUNTER_CLIENT`` Django
+        setting and can be overridden per instance through keyword arguments,
+        e.g. ``HunterClient(pool_maxsize=50, timeout=(3, 5))``.
+
+        Stubs are generated on instantiation only if ``generate_stubs`` (defaulting
+        to the ``GENERATE_CLIENT_STUBS`` setting) is enabled. With ``lazy_methods``
+        the dynamic methods are only built on first access.
+
+        Cached methods keep an in-process LRU of ``response_cache_max_entries``
+        in front of the Django cache named ``response_cache_alias``.
+
+        Rate limits declared in methods.json are counted in the
+        ``rate_limit_backend`` (``sqlite`` at ``rate_limit_sqlite_path``, ``cache``
+        in ``rate_limit_cache_alias`` or ``memory``), so the workers sharing it
+        stay within Hunter's limits together.
+
+        With a ``cassette_path`` the Hunter calls are replayed from (and, per
+        ``cassette_mode``, recorded to) a cassette instead of reaching the API;
+        ``base_url`` (``HUNTER_API_URL`` by default) can point the client to a
+        ``FakeHunterServer``.
+        """
+        if generate_stubs is None:
+            generate_stubs = getattr(settings, "GENERATE_CLIENT_STUBS", True)
+        options = {
+            option.lower(): option_value
+            for option, option_value in getattr(settings, "HUNTER_CLIENT", {}).items()
+        }
+        options.update(fetcher_options)
+        response_cache = ResponseCache(
+            max_entries=options.pop("response_cache_max_entries", 1024),
+            shared_backend=DjangoCacheBackend(options.pop("response_cache_alias", "default")),
+        )
+        rate_limiter = RateLimiter(build_bucket_backend(
+            options.pop("rate_limit_backend", "memory"),
+            sqlite_path=options.pop("rate_limit_sqlite_path", None),
+            cache_alias=options.pop("rate_limit_cache_alias", "default"),
+        ))
+        cassette_path = options.pop("cassette_path", None)
+        cassette_mode = options.pop("cassette_mode", "replay")
+        if cassette_path:
+            options.update(cassette_transports(
+                Cassette(cassette_path, cassette_mode),
+                **{
+                    pool_option: options[pool_option]
+                    for pool_option in ("pool_connections", "pool_maxsize", "pool_block")
+                    if pool_option in options
+                },
+            ))
+        options.setdefault("base_url", os.getenv("HUNTER_API_URL", ""))
+        AsyncBaseFetcher.__init__(self, **options)
+        ClientServicesManager.__init__(
+            self,
+            generate_stubs=generate_stubs,
+            lazy=lazy_methods,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+        )
         self.api_key = os.getenv("HUNTER_API_KEY", "")
 
     def some_random_method_or_service_handler(self):
@@ -36,3 +107,14 @@ class HunterClient(BaseFetcher, ClientServicesManager):
         enriched_params = {**req_params, "api_key": self.api_key}
         response = self.send_request(endpoint, enriched_params, headers=req_headers)
         return response.get("data", {})
+
+    async def _default_async_service_method_handler(
+        self,
+        endpoint: str,
+        req_params: Optional[Dict[str, Any]] = None,
+        req_headers: Optional[Dict[str, Any]] = None,
+    ):
+        """Handle default async service methods and enrich the request with the API key."""
+        enriched_params = {**req_params, "api_key": self.api_key}
+        response = await self.asend_request(endpoint, enriched_params, headers=req_headers)
+        return response.get("data", {})
@@ -0,0 +1,155 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ..models import EmailImport, VerificationJob
+from .bulk_verification import verify_and_store_emails
+from .hunter_client.hunter_client import HunterClient
+
+
+class VerificationJobQueue:
+    """
+    A database-backed queue of verification jobs.
+
+    Jobs are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` where the
+    database supports it, so concurrent workers never wait on each other's
+    rows. Elsewhere (SQLite, whose writers are serialized anyway) a job is
+    claimed with a conditional update that only one worker can win.
+
+    A running job whose worker stopped reporting progress for ``stale_after``
+    seconds is handed to another worker, up to ``max_attempts`` claims. Jobs
+    past their last attempt are failed at most once per ``stale_after`` per
+    process, so idle polls stay read-only. A worker whose job was taken over
+    stops at its next save, which only writes the job while it still owns it.
+    """
+
+    _reaped_at = float("-inf")
+    _reap_lock = threading.Lock()
+
+    @staticmethod
+    def enqueue(
+        emails: List[str],
+        email_import: Optional[EmailImport] = None,
+    ) -> VerificationJob:
+        """Queue email addresses for verification, as part of ``email_import`` if given."""
+        return VerificationJob.objects.create(emails=emails, total=len(emails), email_import=email_import)
+
+    @staticmethod
+    def get_job(job_id: int) -> Optional[VerificationJob]:
+        """Get a job by ID."""
+        return VerificationJob.objects.filter(pk=job_id).first()
+
+    @classmethod
+    def claim(
+        cls,
+        worker: str,
+        stale_after: float = 300,
+        max_attempts: int = 3,
+    ) -> Optional[VerificationJob]:
+        """Claim the oldest claimable job for ``worker``, or return None if there is none."""
+        now = timezone.now()
+        stale = Q(status=VerificationJob.RUNNING, claimed_at__lt=now - timedelta(seconds=stale_after))
+        cls._reap_abandoned(stale, now, stale_after, max_attempts)
+        claimable = Q(status=VerificationJob.QUEUED) | (stale & Q(attempts__lt=max_attempts))
+        claim_fields: Dict[str, Any] = {
+            "status": VerificationJob.RUNNING,
+            "worker": worker,
+            "claimed_at": now,
+        }
+
+        if connection.features.has_select_for_update_skip_locked:
+            with transaction.atomic():
+                job = (
+                    VerificationJob.objects.select_for_update(skip_locked=True)
+                    .filter(claimable)
+                    .order_by("id")
+                    .first()
+                )
+                if job is None:
+                    return None
+                for claim_field, claim_value in claim_fields.items():
+                    setattr(job, claim_field, claim_value)
+                job.attempts += 1
+                job.save(update_fields=[*claim_fields, "attempts"])
+                return job
+
+        while True:
+            job_id = VerificationJob.objects.filter(claimable).order_by("id").values_list("id", flat=True).first()
+            if job_id is None:
+                return None
+            # Another worker may have claimed it in between, then try the next one
+            if VerificationJob.objects.filter(claimable, pk=job_id).update(attempts=F("attempts") + 1, **claim_fields):
+                return VerificationJob.objects.get(pk=job_id)
+
+    @classmethod
+    def process(
+        cls,
+        job: VerificationJob,
+        hunter_client: HunterClient,
+        chunk_size: int = 50,
+        max_concurrency: int = 10,
+    ) -> VerificationJob:
+        """
+        Verify the addresses of a claimed job, saving its progress after every chunk.
+
+        A job taken over from a stale worker resumes after its last saved chunk,
+        and the stale worker stops as soon as a save finds the job is no longer its own.
+        """
+        try:
+            for offset in range(job.processed, job.total, chunk_size):
+                chunk_results = verify_and_store_emails(
+                    hunter_client,
+                    job.emails[offset:offset + chunk_size],
+                    max_concurrency=max_concurrency,
+                )
+                job.results.extend(
+                    {
+                        "email": item_result["email"],
+                        "outcome": item_result["outcome"],
+                        "id": item_result.get("data", {}).get("id"),
+                        "error": item_result.get("error"),
+                    }
+                    for item_result in chunk_results
+                )
+                job.processed = min(offset + chunk_size, job.total)
+                # Saving progress doubles as the worker's heartbeat
+                job.claimed_at = timezone.now()
+                if not cls._save_owned(job, "processed", "results", "claimed_at"):
+                    return job
+            job.status = VerificationJob.COMPLETED
+        except Exception as err:
+            job.status = VerificationJob.FAILED
+            job.error = str(err)
+        job.finished_at = timezone.now()
+        cls._save_owned(job, "status", "error", "finished_at")
+        return job
+
+    @classmethod
+    def _reap_abandoned(cls, stale: Q, now: datetime, stale_after: float, max_attempts: int) -> None:
+        # A write transaction on every poll would contend with the claims themselves
+        with cls._reap_lock:
+            if time.monotonic() - cls._reaped_at < stale_after:
+                return
+            cls._reaped_at = time.monotonic()
+        VerificationJob.objects.filter(stale, attempts__gte=max_attempts).update(
+            status=VerificationJob.FAILED,
+            error="Abandoned by its workers",
+            finished_at=now,
+        )
+
+    @staticmethod
+    def _save_owned(job: VerificationJob, *field_names: str) -> bool:
+        # The claim (worker and attempt) identifies the owner: a taken over job is left alone
+        return bool(
+            VerificationJob.objects.filter(
+                pk=job.pk,
+                status=VerificationJob.RUNNING,
+                worker=job.worker,
+                attempts=job.attempts,
+            ).update(**{field_name: getattr(job, field_name) for field_name in field_names}),
+        )
@@ -1,9 +1,51 @@
-from django.test import TestCase
+import asyncio
+import csv
+import inspect
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import httpx
+import requests
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.test import AsyncClient, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
-from .models import Email
+from django_crud_api.asgi import application as asgi_application
+from utils.async_base_fetcher import AsyncBaseFetcher
+from utils.base_fetcher import BaseFetcher
+from utils.benchmark import compare, measure
+from utils.cassette import CassetteMissError
+from utils.client_services_manager.batch_result import BatchResult
+from utils.client_services_manager.dto_factory import build_dto_class
+from utils.client_services_manager.response_cache import CachedErrorResponse
+from utils.client_services_manager.service_manifest import ServiceManifest
+from utils.rate_limiter import MemoryBucketBackend, RateLimit, RateLimiter, RateLimitExceeded, SQLiteBucketBackend
+from utils.resilience import CircuitOpenError
+
+from .management.commands.benchmark import MAX_UPSTREAM_OVERHEAD_MS, measure_upstream_overhead
+from .models import Email, EmailImport, VerificationJob
+from .services.db_client import DatabaseClient
+from .services.email_import import iter_csv_addresses, iter_lines
+from .services.email_stats import get_stats
+from .services.hunter_client.fake_server import FakeHunterServer
+from .services.hunter_client.hunter_client import HunterClient
+from .services.job_queue import VerificationJobQueue
+from .views import EmailServiceView
 
 
 class EmailServiceViewTestCases(TestCase):  # noqa: WPS214
@@ -11,6 +53,16 @@ class EmailServiceViewTestCases(TestCase):  # noqa: WPS214
 
     client: APIClient
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Point the view's Hunter client to a local fake Hunter API."""
+        super().setUpClass()
+        cls.fake_hunter = FakeHunterServer().start()
+        cls.addClassCleanup(cls.fake_hunter.stop)
+        base_url_patch = mock.patch.object(EmailServiceView.hunter_client, "base_url", cls.fake_hunter.base_url)
+        base_url_patch.start()
+        cls.addClassCleanup(base_url_patch.stop)
+
     def setUp(self) -> None:
         """Set up the test case."""
         self.client = APIClient()
@@ -28,6 +80,33 @@ class EmailServiceViewTestCases(TestCase):  # noqa: WPS214
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Email.objects.count(), 1)
 
+    def test_bulk_create_emails(self) -> None:
+        """Test bulk verifies only the addresses not stored yet, with a constant number of queries."""
+        Email.objects.create(email="stored@example.com", status="valid", score=80, disposable=False)
+        request_data = {
+            "emails": ["stored@example.com", "first@example.com", "invalid", "second@example.com", "first@example.com"],
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = self.client.post(
+                "/api/v1/email_service/bulk/",
+                request_data,
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Stored lookup, insert, and the stored emails read back before and after it; the rest are stats
+        email_queries = [query for query in queries.captured_queries if '"email_module_email"' in query["sql"]]
+        self.assertEqual(len(email_queries), 4)
+        self.assertEqual(
+            [(item_result["email"], item_result["outcome"]) for item_result in response.data["results"]],
+            [
+                ("stored@example.com", "existing"),
+                ("first@example.com", "created"),
+                ("invalid", "invalid"),
+                ("second@example.com", "created"),
+            ],
+        )
+        self.assertEqual(Email.objects.count(), 3)
+
     def test_create_duplicate_email(self) -> None:
         """Test creating a duplicate email."""
         email: str = "test@example.com"
@@ -126,3 +205,1306 @@ class EmailServiceViewTestCases(TestCase):  # noqa: WPS214
         """Test deleting a nonexistent email."""
         response: Response = self.client.delete("/api/v1/email_service/9999/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class HunterClientConnectionPoolTestCases(TestCase):
+    """Test cases for the pooled HTTP sessions of the HunterClient."""
+
+    @override_settings(HUNTER_CLIENT={"POOL_MAXSIZE": 4, "TIMEOUT": 2})
+    def test_pool_options_from_settings(self) -> None:
+        """Test the pool options are read from settings and overridable."""
+        hunter_client = HunterClient(timeout=5)
+        self.assertEqual(hunter_client.timeout, 5)
+        self.assertEqual(hunter_client._adapter._pool_maxsize, 4)  # noqa: WPS437
+
+    def test_session_is_reused_per_thread(self) -> None:
+        """Test each thread reuses its own session over the shared adapter."""
+        hunter_client = HunterClient()
+        other_sessions = []
+        worker = threading.Thread(
+            target=lambda: other_sessions.append(hunter_client.session),
+        )
+        worker.start()
+        worker.join()
+
+        self.assertIs(hunter_client.session, hunter_client.session)
+        self.assertIsNot(hunter_client.session, other_sessions[0])
+        self.assertIs(
+            hunter_client.session.get_adapter("https://api.hunter.io"),
+            other_sessions[0].get_adapter("https://api.hunter.io"),
+        )
+
+
+class HunterClientAsyncMethodsTestCases(TestCase):
+    """Test cases for the coroutine twins of the HunterClient dynamic methods."""
+
+    def test_async_twin_uses_async_fetcher(self) -> None:
+        """Test averify_email awaits the async fetcher and returns the DTO."""
+        hunter_response = {"data": {"status": "valid", "score": 90, "disposable": False}}
+        with mock.patch.object(
+            HunterClient,
+            "asend_request",
+            mock.AsyncMock(return_value=hunter_response),
+        ) as asend_request:
+            hunter_client = HunterClient()
+            email_dto = asyncio.run(hunter_client.averify_email("test@example.com"))
+
+        self.assertIsInstance(email_dto, hunter_client._find_dto_class("verify_email"))  # noqa: WPS437
+        self.assertEqual(email_dto.score, 90.0)
+        self.assertEqual(asend_request.call_args.args[0], "email-verifier")
+        self.assertEqual(asend_request.call_args.args[1]["email"], "test@example.com")
+
+
+class HunterClientBatchTestCases(TestCase):
+    """Test cases for the batch invocation API of the HunterClient."""
+
+    addresses = ["first@example.com", "invalid", "second@example.com"]
+
+    @staticmethod
+    def fake_hunter_response(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Return a Hunter-like payload, failing for addresses without a domain."""
+        email: str = args[1]["email"]
+        if "@" not in email:
+            raise ValueError(f"Invalid address {email}")
+        return {"data": {"status": "valid", "score": len(email), "disposable": False}}
+
+    def assert_batch_results(self, batch_results: List[BatchResult]) -> None:
+        """Assert the results are in input order and carry per-item errors."""
+        email_dto_class = HunterClient(generate_stubs=False)._find_dto_class("verify_email")  # noqa: WPS437
+        self.assertEqual([batch_result.args[0] for batch_result in batch_results], self.addresses)
+        self.assertEqual([batch_result.ok for batch_result in batch_results], [True, False, True])
+        self.assertIsInstance(batch_results[1].error, ValueError)
+        self.assertIsInstance(batch_results[2].result, email_dto_class)
+        self.assertEqual(batch_results[2].result.score, float(len(self.addresses[2])))
+
+    def test_batch(self) -> None:
+        """Test batch fans the calls out over a thread pool."""
+        with mock.patch.object(HunterClient, "send_request", side_effect=self.fake_hunter_response):
+            batch_results = HunterClient().batch("verify_email", self.addresses, max_concurrency=2)
+        self.assert_batch_results(batch_results)
+
+    def test_abatch(self) -> None:
+        """Test abatch fans the calls out over the event loop."""
+        with mock.patch.object(HunterClient, "asend_request", side_effect=self.fake_hunter_response):
+            batch_results = asyncio.run(
+                HunterClient().abatch("verify_email", self.addresses, max_concurrency=2),
+            )
+        self.assert_batch_results(batch_results)
+
+    def test_batch_dict_items_are_request_parameters(self) -> None:
+        """Test a dict item calls the method with its entries as request parameters."""
+        with mock.patch.object(HunterClient, "send_request", side_effect=self.fake_hunter_response) as send_request:
+            batch_results = HunterClient().batch("verify_email", [{"email": self.addresses[0]}])
+        self.assertTrue(batch_results[0].ok)
+        self.assertEqual(batch_results[0].kwargs, {"params": {"email": self.addresses[0]}})
+        self.assertEqual(send_request.call_args.args[1]["email"], self.addresses[0])
+
+
+class ServiceManifestTestCases(SimpleTestCase):
+    """Test cases for the compiled and cached service manifest."""
+
+    def setUp(self) -> None:
+        """Create a methods directory with one JSON service and one method file."""
+        self.methods_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.methods_dir)
+        self.methods_file_path = os.path.join(self.methods_dir, "methods.json")
+        with open(self.methods_file_path, "w") as methods_file:
+            json.dump({"ping": {"endpoint": "ping", "params": []}}, methods_file)
+        with open(os.path.join(self.methods_dir, "ping.py"), "w") as method_file:
+            method_file.write("class PingDTO:\n    pass\n")
+
+    def load_in_new_process(self) -> ServiceManifest:
+        """Load the manifest as a fresh process would, without the in-memory cache."""
+        ServiceManifest._loaded.clear()  # noqa: WPS437
+        return ServiceManifest.load(self.methods_dir, self.methods_file_path)
+
+    def test_manifest_is_reused_from_disk(self) -> None:
+        """Test a second process reads the compiled manifest instead of rebuilding it."""
+        manifest = self.load_in_new_process()
+        self.assertEqual(manifest.services, {"ping": {"endpoint": "ping", "params": []}})
+        self.assertEqual(manifest.dto_class("ping").__name__, "PingDTO")
+
+        with mock.patch.object(ServiceManifest, "build") as build:
+            self.load_in_new_process()
+        build.assert_not_called()
+
+    def test_manifest_is_rebuilt_when_sources_change(self) -> None:
+        """Test a modified method file invalidates the cached manifest."""
+        self.load_in_new_process()
+        with open(os.path.join(self.methods_dir, "ping.py"), "w") as method_file:
+            method_file.write("class PongResponseDTO:\n    pass\n")
+
+        self.assertEqual(self.load_in_new_process().dto_classes, {"ping": "PongResponseDTO"})
+
+
+class GenerateClientStubsCommandTestCases(SimpleTestCase):
+    """Test cases for the generate_client_stubs management command."""
+
+    def test_stubs_are_only_regenerated_when_sources_change(self) -> None:
+        """Test a second run leaves up to date stubs untouched."""
+        output = io.StringIO()
+        call_command("generate_client_stubs", "--force", stdout=output)
+        self.assertIn("Generated stubs", output.getvalue())
+
+        output = io.StringIO()
+        call_command("generate_client_stubs", stdout=output)
+        self.assertIn("are up to date", output.getvalue())
+
+    def test_schema_dto_stubs_follow_the_imports(self) -> None:
+        """Test the class stubs of schema DTOs get their own section, between the imports and the client."""
+        call_command("generate_client_stubs", "--force", stdout=io.StringIO())
+        stubs_path = os.path.splitext(inspect.getfile(HunterClient))[0] + ".pyi"
+        with open(stubs_path) as stubs_file:
+            stubs_contents = stubs_file.read()
+
+        import_section, _, class_sections = stubs_contents.partition("\n\n\n")
+        self.assertNotIn("class ", import_section)
+        self.assertTrue(class_sections.startswith("class EmailDTO:"))
+        self.assertLess(class_sections.index("class EmailDTO:"), class_sections.index("class HunterClient:"))
+
+    def test_runtime_stub_generation_can_be_disabled(self) -> None:
+        """Test clients skip stub generation when the setting is off."""
+        with override_settings(GENERATE_CLIENT_STUBS=False):
+            with mock.patch.object(HunterClient, "_generate_stubs") as generate_stubs:
+                HunterClient()
+        generate_stubs.assert_not_called()
+
+
+class HunterClientLazyMethodsTestCases(SimpleTestCase):
+    """Test cases for the lazy binding of the HunterClient dynamic methods."""
+
+    def test_methods_are_bound_on_first_access(self) -> None:
+        """Test nothing is bound at construction and methods are memoized once resolved."""
+        with mock.patch.object(HunterClient, "_find_dto_class", return_value=None) as find_dto_class:
+            hunter_client = HunterClient(generate_stubs=False, lazy_methods=True)
+            self.assertNotIn("verify_email", vars(hunter_client))
+            find_dto_class.assert_not_called()
+
+            verify_email = hunter_client.verify_email
+            self.assertIs(hunter_client.verify_email, verify_email)
+            self.assertIn("averify_email", vars(hunter_client))
+            self.assertEqual(find_dto_class.call_count, 2)
+
+        self.assertIn("domain_search", dir(hunter_client))
+        self.assertTrue(callable(hunter_client.test_method_handler))
+        with self.assertRaises(AttributeError):
+            hunter_client.unknown_method  # noqa: WPS428
+
+
+class HunterClientMethodFilesTestCases(SimpleTestCase):
+    """Test cases for the loading of the HunterClient method files."""
+
+    def test_method_files_are_imported_once(self) -> None:
+        """Test DTOs and file-defined methods come from the regular imported modules."""
+        from .services.hunter_client.methods import test_method  # noqa: WPS433
+
+        hunter_client = HunterClient(generate_stubs=False)
+        self.assertIs(hunter_client._find_dto_class("test_method"), test_method.TestDTO)  # noqa: WPS437
+        self.assertIs(hunter_client.TestDTO, test_method.TestDTO)
+        self.assertIs(hunter_client.test_method_handler.__func__, test_method.test_method_handler)
+
+
+class SchemaDTOTestCases(SimpleTestCase):
+    """Test cases for the DTO classes built from methods.json response schemas."""
+
+    def setUp(self) -> None:
+        """Get the schema DTO class of verify_email."""
+        self.email_dto_class = HunterClient(generate_stubs=False)._find_dto_class("verify_email")  # noqa: WPS437
+
+    def test_schema_dto_is_slotted_and_shared(self) -> None:
+        """Test the DTO has no instance dict and is built once per process."""
+        email_dto = self.email_dto_class(status="valid", score=87, disposable=False, sources=[])
+        self.assertEqual(self.email_dto_class.__name__, "EmailDTO")
+        self.assertFalse(hasattr(email_dto, "__dict__"))
+        self.assertIs(self.email_dto_class, HunterClient(generate_stubs=False)._find_dto_class("verify_email"))  # noqa: WPS437
+
+    def test_schema_dto_validates_and_drops_unknown_fields(self) -> None:
+        """Test declared fields are coerced and validated and unknown ones dropped."""
+        email_dto = self.email_dto_class(status="valid", score=87, disposable=False, sources=[])
+        self.assertEqual(email_dto.score, 87.0)
+        self.assertIsNone(email_dto.result)
+        self.assertEqual(
+            email_dto.to_dict(),
+            {
+                "status": "valid",
+                "score": 87.0,
+                "disposable": False,
+                "result": None,
+                "webmail": None,
+                "accept_all": None,
+            },
+        )
+        with self.assertRaises(ValueError):
+            self.email_dto_class(status="valid", score=87, disposable="no")
+
+    def test_extra_fields_can_be_kept(self) -> None:
+        """Test undeclared fields are kept in a single mapping when requested."""
+        ping_dto_class = build_dto_class("PingDTO", {"fields": {"status": "str"}, "extra": "keep"})
+        ping_dto = ping_dto_class(status="ok", latency=3)
+        self.assertEqual(ping_dto.extra, {"latency": 3})
+
+
+class HunterClientResponseCacheTestCases(SimpleTestCase):
+    """Test cases for the methods.json driven response cache of the HunterClient."""
+
+    def setUp(self) -> None:
+        """Start every test with an empty shared cache."""
+        cache.clear()
+
+    def test_cached_method_hits_local_then_shared_tier(self) -> None:
+        """Test repeated calls are served from the LRU, and other instances from the shared tier."""
+        hunter_response = {"data": {"total": 12}}
+        with mock.patch.object(HunterClient, "send_request", return_value=hunter_response) as send_request:
+            hunter_client = HunterClient(generate_stubs=False)
+            hunter_client.count_domain_emails("example.com")
+            hunter_client.count_domain_emails("example.com")
+            other_hunter_client = HunterClient(generate_stubs=False)
+            self.assertEqual(other_hunter_client.count_domain_emails("example.com"), {"total": 12})
+
+        self.assertEqual(send_request.call_count, 1)
+        self.assertEqual(
+            hunter_client.cache_stats(),
+            {"count_domain_emails": {"local_hits": 1, "shared_hits": 0, "misses": 1}},
+        )
+        self.assertEqual(other_hunter_client.cache_stats()["count_domain_emails"]["shared_hits"], 1)
+
+    def test_async_twin_shares_the_cache(self) -> None:
+        """Test the coroutine twin reads what the blocking method cached."""
+        with mock.patch.object(HunterClient, "send_request", return_value={"data": {"total": 3}}):
+            hunter_client = HunterClient(generate_stubs=False)
+            hunter_client.count_domain_emails("example.com")
+        with mock.patch.object(HunterClient, "asend_request") as asend_request:
+            self.assertEqual(asyncio.run(hunter_client.acount_domain_emails("example.com")), {"total": 3})
+        asend_request.assert_not_called()
+
+    def test_client_errors_are_negatively_cached(self) -> None:
+        """Test a 404 is cached and replayed without calling Hunter again."""
+        not_found = requests.Response()
+        not_found.status_code = 404
+        with mock.patch.object(
+            HunterClient,
+            "send_request",
+            side_effect=requests.HTTPError("Not found", response=not_found),
+        ) as send_request:
+            hunter_client = HunterClient(generate_stubs=False)
+            with self.assertRaises(requests.HTTPError):
+                hunter_client.domain_search("unknown.example")
+            with self.assertRaises(CachedErrorResponse):
+                hunter_client.domain_search("unknown.example")
+        self.assertEqual(send_request.call_count, 1)
+
+
+class HunterClientSingleFlightTestCases(SimpleTestCase):
+    """Test cases for the coalescing of identical concurrent HunterClient calls."""
+
+    hunter_response = {"data": {"status": "valid", "score": 90, "disposable": False}}
+
+    def test_concurrent_threads_share_one_call(self) -> None:
+        """Test identical calls made from several threads reach Hunter once."""
+        release_upstream = threading.Event()
+
+        def slow_hunter_response(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            release_upstream.wait(timeout=5)
+            return self.hunter_response
+
+        with mock.patch.object(HunterClient, "send_request", side_effect=slow_hunter_response) as send_request:
+            hunter_client = HunterClient(generate_stubs=False)
+            workers = [
+                threading.Thread(target=hunter_client.verify_email, args=("test@example.com",))
+                for _ in range(5)
+            ]
+            for worker in workers:
+                worker.start()
+            deadline = time.monotonic() + 5
+            while hunter_client.single_flight.coalesced_calls < len(workers) - 1:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.001)
+            release_upstream.set()
+            for worker in workers:
+                worker.join()
+
+        self.assertEqual(send_request.call_count, 1)
+
+    def test_concurrent_coroutines_share_one_call(self) -> None:
+        """Test identical calls awaited together reach Hunter once, distinct ones don't coalesce."""
+
+        async def slow_hunter_response(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return self.hunter_response
+
+        async def verify_all(hunter_client: HunterClient) -> List[Any]:
+            return await asyncio.gather(
+                *(hunter_client.averify_email("test@example.com") for _ in range(5)),
+                hunter_client.averify_email("other@example.com"),
+            )
+
+        with mock.patch.object(HunterClient, "asend_request", side_effect=slow_hunter_response) as asend_request:
+            email_dtos = asyncio.run(verify_all(HunterClient(generate_stubs=False)))
+
+        self.assertEqual(asend_request.call_count, 2)
+        self.assertEqual(len(email_dtos), 6)
+
+
+class RateLimiterTestCases(SimpleTestCase):
+    """Test cases for the token bucket rate limits of outbound calls."""
+
+    def test_sqlite_buckets_are_shared_between_workers(self) -> None:
+        """Test two workers using the same SQLite file draw from the same bucket."""
+        rate_limit = RateLimit.from_config({
+            "buckets": [{"name": "hunter", "rate": 1, "per": 60, "burst": 2}],
+            "on_limit": "fail",
+        })
+        with tempfile.TemporaryDirectory() as temp_dir:
+            buckets_path = os.path.join(temp_dir, "rate_limits.sqlite3")
+            first_worker = RateLimiter(SQLiteBucketBackend(buckets_path))
+            second_worker = RateLimiter(SQLiteBucketBackend(buckets_path))
+            first_worker.acquire(rate_limit)
+            second_worker.acquire(rate_limit)
+            with self.assertRaises(RateLimitExceeded) as raised:
+                first_worker.acquire(rate_limit)
+        self.assertGreater(raised.exception.retry_after, 0)
+
+    def test_block_waits_for_a_token_until_the_deadline(self) -> None:
+        """Test blocking callers wait for the refill but give up past max_wait."""
+        rate_limiter = RateLimiter(MemoryBucketBackend())
+        rate_limit = RateLimit.from_config({
+            "buckets": [{"name": "hunter", "rate": 20, "burst": 1}],
+            "max_wait": 1,
+        })
+        started_at = time.monotonic()
+        rate_limiter.acquire(rate_limit)
+        asyncio.run(rate_limiter.aacquire(rate_limit))
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.04)
+
+        slow_rate_limit = RateLimit.from_config({
+            "buckets": [{"name": "quota", "rate": 1, "per": 3600}],
+            "max_wait": 1,
+        })
+        rate_limiter.acquire(slow_rate_limit)
+        with self.assertRaises(RateLimitExceeded):
+            rate_limiter.acquire(slow_rate_limit)
+
+    def test_only_upstream_calls_spend_tokens(self) -> None:
+        """Test rate limited methods acquire a token per call, except on cache hits."""
+        cache.clear()
+        hunter_response = {"data": {"total": 3}}
+        with mock.patch.object(HunterClient, "send_request", return_value=hunter_response):
+            hunter_client = HunterClient(generate_stubs=False, rate_limit_backend="memory")
+            with mock.patch.object(hunter_client.rate_limiter, "acquire") as acquire:
+                hunter_client.count_domain_emails("rate-limited.example")
+                hunter_client.count_domain_emails("rate-limited.example")
+        acquire.assert_called_once()
+        self.assertEqual(
+            [bucket.name for bucket in acquire.call_args.args[0].buckets],
+            ["hunter", "hunter-minute"],
+        )
+
+
+class BaseFetcherResilienceTestCases(TestCase):
+    """Test cases for the retries, deadlines and circuit breakers of the fetchers."""
+
+    @staticmethod
+    def make_response(status_code: int, headers: Dict[str, str] = None) -> requests.Response:
+        """Build a requests response with an empty JSON body."""
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        response._content = b"{}"  # noqa: WPS437
+        return response
+
+    def test_idempotent_requests_are_retried_after_retry_after(self) -> None:
+        """Test a GET is retried on a 503 and waits for the Retry-After delay."""
+        fetcher = BaseFetcher("https://api.example.com", retry_backoff_base=0)
+        responses = [self.make_response(503, {"Retry-After": "1"}), self.make_response(200)]
+        with mock.patch.object(requests.Session, "request", side_effect=responses) as request:
+            with mock.patch("utils.base_fetcher.time.sleep") as sleep:
+                self.assertEqual(fetcher.send_request("domain-search", {}, None), {})
+        self.assertEqual(request.call_count, 2)
+        sleep.assert_called_once_with(1.0)
+
+    def test_non_idempotent_requests_and_client_errors_are_not_retried(self) -> None:
+        """Test POSTs and 4xx responses fail on the first attempt."""
+        fetcher = BaseFetcher("https://api.example.com", retry_backoff_base=0)
+        with mock.patch.object(requests.Session, "request", return_value=self.make_response(503)) as request:
+            with self.assertRaises(requests.HTTPError):
+                fetcher.send_request("domain-search", {}, None, method="POST")
+        with mock.patch.object(requests.Session, "request", return_value=self.make_response(404)) as request:
+            with self.assertRaises(requests.HTTPError):
+                fetcher.send_request("domain-search", {}, None)
+        self.assertEqual(request.call_count, 1)
+
+    def test_retries_stop_at_the_deadline(self) -> None:
+        """Test no retry is attempted when its backoff would outlive the deadline."""
+        fetcher = BaseFetcher("https://api.example.com", deadline=0.5, retry_max_attempts=5)
+        retry_later = self.make_response(429, {"Retry-After": "10"})
+        with mock.patch.object(requests.Session, "request", return_value=retry_later) as request:
+            with self.assertRaises(requests.HTTPError):
+                fetcher.send_request("domain-search", {}, None)
+        self.assertEqual(request.call_count, 1)
+        self.assertLessEqual(request.call_args.kwargs["timeout"], 0.5)
+
+    def test_circuit_opens_after_consecutive_failures(self) -> None:
+        """Test an endpoint failing repeatedly is no longer called until the reset timeout."""
+        fetcher = BaseFetcher(
+            "https://api.example.com",
+            retry_max_attempts=1,
+            circuit_failure_threshold=2,
+            circuit_reset_timeout=60,
+        )
+        connection_error = requests.ConnectionError("Connection refused")
+        with mock.patch.object(requests.Session, "request", side_effect=connection_error) as request:
+            for _ in range(2):
+                with self.assertRaises(requests.ConnectionError):
+                    fetcher.send_request("email-verifier", {}, None)
+            with self.assertRaises(CircuitOpenError):
+                fetcher.send_request("email-verifier", {}, None)
+        self.assertEqual(request.call_count, 2)
+        self.assertFalse(fetcher.circuit_breaker("domain-search").is_open)
+
+    def test_half_open_trial_failing_unexpectedly_releases_the_circuit(self) -> None:
+        """Test a trial call raising a non-transport error reopens the circuit instead of wedging it."""
+        fetcher = BaseFetcher(
+            "https://api.example.com",
+            retry_max_attempts=1,
+            circuit_failure_threshold=1,
+            circuit_reset_timeout=0,
+        )
+        side_effects = [
+            requests.ConnectionError("Connection refused"),
+            requests.exceptions.ChunkedEncodingError("Connection broken"),
+            self.make_response(200),
+        ]
+        with mock.patch.object(requests.Session, "request", side_effect=side_effects):
+            with self.assertRaises(requests.ConnectionError):
+                fetcher.send_request("email-verifier", {}, None)
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                fetcher.send_request("email-verifier", {}, None)
+            self.assertTrue(fetcher.circuit_breaker("email-verifier").is_open)
+            self.assertEqual(fetcher.send_request("email-verifier", {}, None), {})
+        self.assertFalse(fetcher.circuit_breaker("email-verifier").is_open)
+
+    def test_cancelled_async_trial_releases_the_circuit(self) -> None:
+        """Test a trial call cancelled mid-flight lets the next call try the endpoint again."""
+        attempts = []
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("Connection refused", request=request)
+            if len(attempts) == 2:
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={"data": {}})
+
+        async def send(fetcher: AsyncBaseFetcher) -> Any:
+            loop = asyncio.get_running_loop()
+            fetcher._async_clients[loop] = httpx.AsyncClient(transport=httpx.MockTransport(handle))  # noqa: WPS437
+            with self.assertRaises(httpx.ConnectError):
+                await fetcher.asend_request("email-verifier", {}, None)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(fetcher.asend_request("email-verifier", {}, None), timeout=0.05)
+            return await fetcher.asend_request("email-verifier", {}, None)
+
+        fetcher = AsyncBaseFetcher(
+            "https://api.example.com",
+            retry_max_attempts=1,
+            circuit_failure_threshold=1,
+            circuit_reset_timeout=0,
+        )
+        self.assertEqual(asyncio.run(send(fetcher)), {"data": {}})
+        self.assertEqual(len(attempts), 3)
+
+    def test_async_requests_are_retried(self) -> None:
+        """Test asend_request retries transport errors with the same policy."""
+        attempts = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("Connection refused", request=request)
+            return httpx.Response(200, json={"data": {}})
+
+        async def send(fetcher: AsyncBaseFetcher) -> Any:
+            loop = asyncio.get_running_loop()
+            fetcher._async_clients[loop] = httpx.AsyncClient(transport=httpx.MockTransport(handle))  # noqa: WPS437
+            return await fetcher.asend_request("domain-search", {}, None)
+
+        fetcher = AsyncBaseFetcher("https://api.example.com", retry_backoff_base=0)
+        self.assertEqual(asyncio.run(send(fetcher)), {"data": {}})
+        self.assertEqual(len(attempts), 2)
+
+    def test_open_circuit_makes_create_fail_fast(self) -> None:
+        """Test the create endpoint answers 503 with Retry-After while Hunter's circuit is open."""
+        with mock.patch.object(HunterClient, "send_request", side_effect=CircuitOpenError("email-verifier", 12.5)):
+            response = APIClient().post(
+                "/api/v1/email_service/",
+                {"email": "circuit@example.com"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "13")
+
+
+class HunterClientPaginationTestCases(SimpleTestCase):
+    """Test cases for the paginated iterators of list endpoints."""
+
+    total_emails = 250
+
+    def setUp(self) -> None:
+        """Start every test with an empty response cache."""
+        cache.clear()
+
+    def fake_domain_search(self, endpoint: str, req_params: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        """Return the requested page of a domain with ``total_emails`` emails."""
+        page_end = min(req_params["offset"] + req_params["limit"], self.total_emails)
+        emails = [{"value": f"user{index}@big.example"} for index in range(req_params["offset"], page_end)]
+        return {"data": {"emails": emails}}
+
+    def test_pages_are_fetched_lazily(self) -> None:
+        """Test iter_domain_search only fetches the pages that are consumed."""
+        with mock.patch.object(HunterClient, "send_request", side_effect=self.fake_domain_search) as send_request:
+            hunter_client = HunterClient(generate_stubs=False)
+            first_emails = list(zip(range(5), hunter_client.iter_domain_search("big.example")))
+            self.assertEqual(len(first_emails), 5)
+            self.assertEqual(send_request.call_count, 1)
+
+            emails = list(hunter_client.iter_domain_search("other.example", prefetch=True))
+
+        self.assertEqual(len(emails), self.total_emails)
+        self.assertEqual(emails[-1]["value"], "user249@big.example")
+        self.assertEqual(
+            [call_args.args[1]["offset"] for call_args in send_request.call_args_list[1:]],
+            [0, 100, 200],
+        )
+
+    def test_async_pages_are_prefetched(self) -> None:
+        """Test aiter_domain_search yields every page with the async fetcher."""
+
+        async def fake_async_domain_search(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            return self.fake_domain_search(*args, **kwargs)
+
+        async def collect(hunter_client: HunterClient) -> List[Dict[str, Any]]:
+            return [email async for email in hunter_client.aiter_domain_search("big.example", prefetch=True)]
+
+        with mock.patch.object(HunterClient, "asend_request", side_effect=fake_async_domain_search) as asend_request:
+            emails = asyncio.run(collect(HunterClient(generate_stubs=False)))
+
+        self.assertEqual(len(emails), self.total_emails)
+        self.assertEqual(asend_request.call_count, 3)
+
+    def test_pages_skip_the_response_cache(self) -> None:
+        """Test crawling pages neither reads nor fills the response cache of the paginated method."""
+        with mock.patch.object(HunterClient, "send_request", side_effect=self.fake_domain_search) as send_request:
+            hunter_client = HunterClient(generate_stubs=False)
+            for _ in range(2):
+                self.assertEqual(len(list(hunter_client.iter_domain_search("big.example"))), self.total_emails)
+
+        self.assertEqual(send_request.call_count, 6)
+        self.assertNotIn("domain_search", hunter_client.cache_stats())
+
+
+class HunterClientTransportsTestCases(SimpleTestCase):
+    """Test cases for the cassette transports and the fake Hunter API."""
+
+    def test_cassette_replays_recorded_calls_offline(self) -> None:
+        """Test calls recorded against the fake Hunter API replay with no server, keys left out."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cassette_path = os.path.join(temp_dir, "hunter.json")
+            with FakeHunterServer() as fake_hunter:
+                recording_client = HunterClient(
+                    generate_stubs=False,
+                    base_url=fake_hunter.base_url,
+                    cassette_path=cassette_path,
+                    cassette_mode="record",
+                )
+                recorded_dto = recording_client.verify_email("cassette@example.com")
+                base_url = fake_hunter.base_url
+
+            replaying_client = HunterClient(generate_stubs=False, base_url=base_url, cassette_path=cassette_path)
+            self.assertEqual(replaying_client.verify_email("cassette@example.com"), recorded_dto)
+            self.assertEqual(asyncio.run(replaying_client.averify_email("cassette@example.com")), recorded_dto)
+            with self.assertRaises(CassetteMissError):
+                replaying_client.verify_email("unrecorded@example.com")
+            with open(cassette_path) as cassette_file:
+                self.assertNotIn("api_key", cassette_file.read())
+
+    def test_fake_hunter_injects_latency_and_errors(self) -> None:
+        """Test the fake Hunter API delays responses and fails the requested share of them."""
+        with FakeHunterServer(latency=0.05, error_rate=1, error_status=503) as fake_hunter:
+            fetcher = BaseFetcher(fake_hunter.base_url, retry_max_attempts=2, retry_backoff_base=0)
+            started_at = time.monotonic()
+            with self.assertRaises(requests.HTTPError) as raised:
+                fetcher.send_request("email-verifier", {"email": "slow@example.com"}, None)
+            self.assertGreaterEqual(time.monotonic() - started_at, 0.1)
+            self.assertEqual(raised.exception.response.status_code, 503)
+            self.assertEqual(fake_hunter.request_count, 2)
+
+    def test_fake_hunter_adds_no_latency_to_keep_alive_requests(self) -> None:
+        """Test requests on a pooled connection of a zero-latency fake Hunter API answer right away."""
+        with FakeHunterServer() as fake_hunter, requests.Session() as session:
+            timings = []
+            for index in range(10):
+                started_at = time.monotonic()
+                session.get(f"{fake_hunter.base_url}/v2/email-verifier", params={"email": f"{index}@example.com"})
+                timings.append(time.monotonic() - started_at)
+        # The first request opens the connection, the others reuse it
+        self.assertLess(sorted(timings[1:])[len(timings) // 2], 0.02)
+
+
+class BenchmarkTestCases(SimpleTestCase):
+    """Test cases for the benchmark timing and baseline comparison helpers."""
+
+    def test_measure_reports_percentiles(self) -> None:
+        """Test measure times every iteration and reports ordered percentiles."""
+        calls = []
+        benchmark_results = measure(calls.append, iterations=20, warmup=2)
+        self.assertEqual(len(calls), 22)
+        self.assertEqual(benchmark_results["iterations"], 20)
+        self.assertLessEqual(benchmark_results["p50_ms"], benchmark_results["p95_ms"])
+        self.assertLessEqual(benchmark_results["p95_ms"], benchmark_results["p99_ms"])
+
+    def test_zero_latency_upstream_costs_a_few_milliseconds(self) -> None:
+        """Test the fake Hunter API adds next to nothing to its configured latency, as the benchmarks assume."""
+        for latency in (0.0, 0.02):
+            with FakeHunterServer(latency=latency) as fake_hunter:
+                self.assertLess(measure_upstream_overhead(fake_hunter), MAX_UPSTREAM_OVERHEAD_MS)
+
+    def test_compare_flags_regressions_past_the_threshold(self) -> None:
+        """Test only benchmarks slower than the baseline by more than the threshold regress."""
+        comparison = compare(
+            {"view_list": {"p50_ms": 1.5}, "view_update": {"p50_ms": 1.05}, "new": {"p50_ms": 1}},
+            {"view_list": {"p50_ms": 1.0}, "view_update": {"p50_ms": 1.0}},
+            threshold=0.1,
+        )
+        self.assertTrue(comparison["view_list"]["regressed"])
+        self.assertFalse(comparison["view_update"]["regressed"])
+        self.assertIsNone(comparison["new"]["change"])
+
+
+class VerificationJobTestCases(TransactionTestCase):
+    """Test cases for the background verification jobs and their worker pool."""
+
+    def test_enqueued_job_is_drained_by_the_workers(self) -> None:
+        """Test an enqueued job is processed by the worker pool and reports its progress."""
+        api_client = APIClient()
+        response: Response = api_client.post(
+            "/api/v1/email_service/enqueue/",
+            {"emails": ["first@example.com", "invalid", "second@example.com"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        status_url = response.data["status_url"]
+        self.assertEqual(api_client.get(status_url).data["status"], VerificationJob.QUEUED)
+
+        with FakeHunterServer() as fake_hunter:
+            with mock.patch.dict(os.environ, {"HUNTER_API_URL": fake_hunter.base_url}):
+                call_command(
+                    "run_verification_workers",
+                    "--workers",
+                    "2",
+                    "--drain",
+                    "--chunk-size",
+                    "2",
+                    stdout=io.StringIO(),
+                )
+
+        job_status = api_client.get(status_url).data
+        self.assertEqual(job_status["status"], VerificationJob.COMPLETED)
+        self.assertEqual(job_status["progress"], 1.0)
+        self.assertEqual(
+            [item_result["outcome"] for item_result in job_status["results"]],
+            ["created", "invalid", "created"],
+        )
+        self.assertEqual(Email.objects.count(), 2)
+        self.assertEqual(api_client.get("/api/v1/email_service/jobs/9999/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_workers_survive_database_errors(self) -> None:
+        """Test a worker logs a failed claim and polls again instead of dying."""
+        claim_results = [OperationalError("database table is locked"), None]
+        with mock.patch.object(VerificationJobQueue, "claim", side_effect=claim_results) as claim:
+            with self.assertLogs("modules.email_module.management.commands.run_verification_workers") as logs:
+                call_command(
+                    "run_verification_workers",
+                    "--workers",
+                    "1",
+                    "--drain",
+                    "--poll-interval",
+                    "0",
+                    stdout=io.StringIO(),
+                )
+        self.assertEqual(claim.call_count, 2)
+        self.assertIn("database table is locked", logs.output[0])
+
+    def test_jobs_are_claimed_once_and_stale_jobs_taken_over(self) -> None:
+        """Test concurrent claims get distinct jobs and a stalled job goes to another worker."""
+        first_job = VerificationJobQueue.enqueue(["first@example.com"])
+        second_job = VerificationJobQueue.enqueue(["second@example.com"])
+
+        self.assertEqual(VerificationJobQueue.claim("worker-1").id, first_job.id)
+        self.assertEqual(VerificationJobQueue.claim("worker-2").id, second_job.id)
+        self.assertIsNone(VerificationJobQueue.claim("worker-3"))
+
+        stale_job = VerificationJobQueue.claim("worker-3", stale_after=0)
+        self.assertEqual(stale_job.id, first_job.id)
+        self.assertEqual((stale_job.worker, stale_job.attempts), ("worker-3", 2))
+
+    def test_taken_over_job_is_left_to_its_new_worker(self) -> None:
+        """Test a stalled worker coming back neither saves its progress nor finishes the job."""
+        VerificationJobQueue.enqueue(["first@example.com", "second@example.com"])
+        stalled_job = VerificationJobQueue.claim("worker-1")
+        VerificationJobQueue.claim("worker-2", stale_after=0)
+
+        chunk_results = [{"email": "first@example.com", "outcome": "created"}]
+        with mock.patch("modules.email_module.services.job_queue.verify_and_store_emails", return_value=chunk_results):
+            VerificationJobQueue.process(stalled_job, HunterClient(generate_stubs=False), chunk_size=1)
+
+        job = VerificationJob.objects.get(pk=stalled_job.pk)
+        self.assertEqual(
+            (job.status, job.worker, job.processed, job.results),
+            (VerificationJob.RUNNING, "worker-2", 0, []),
+        )
+
+    @mock.patch.object(VerificationJobQueue, "_reaped_at", float("-inf"))
+    def test_idle_polls_only_reap_abandoned_jobs_once_per_stale_after(self) -> None:
+        """Test abandoned jobs are failed by the first poll only, and never claimed again."""
+        abandoned_job = VerificationJobQueue.enqueue(["first@example.com"])
+        VerificationJob.objects.filter(pk=abandoned_job.pk).update(
+            status=VerificationJob.RUNNING,
+            attempts=3,
+            claimed_at=timezone.now() - timedelta(hours=1),
+        )
+
+        with self.assertNumQueries(2):
+            self.assertIsNone(VerificationJobQueue.claim("worker-1", stale_after=60))
+        with self.assertNumQueries(1):
+            self.assertIsNone(VerificationJobQueue.claim("worker-1", stale_after=60))
+        self.assertEqual(VerificationJob.objects.get(pk=abandoned_job.pk).status, VerificationJob.FAILED)
+
+
+class EmailImportTestCases(TestCase):
+    """Test cases for the streamed email imports."""
+
+    import_url = "/api/v1/email_service/import/"
+
+    def setUp(self) -> None:
+        """Store an address the imports already know."""
+        self.api_client = APIClient()
+        Email.objects.create(email="known@example.com", status="valid", score=90, disposable=False)
+
+    @mock.patch.object(EmailServiceView, "import_chunk_size", 2)
+    def test_csv_import_queues_unknown_addresses_per_chunk(self) -> None:
+        """Test a CSV upload is handled in chunks, queueing only the unknown addresses."""
+        csv_body = "name,Email\nKnown,known@example.com\nA,a@example.com\nBad,not-an-email\nB,b@example.com\n"
+        response: Response = self.api_client.generic("POST", self.import_url, csv_body, content_type="text/csv")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            [response.data[counter] for counter in ("status", "rows_read", "known", "queued", "invalid")],
+            [EmailImport.COMPLETED, 4, 1, 2, 1],
+        )
+        self.assertEqual(
+            list(VerificationJob.objects.order_by("id").values_list("emails", flat=True)),
+            [["a@example.com"], ["b@example.com"]],
+        )
+        verification = self.api_client.get(response.data["status_url"]).data["verification"]
+        self.assertEqual(verification, {"jobs": 2, "total": 2, "processed": 0, "progress": 0.0})
+
+    def test_ndjson_import_accepts_addresses_and_objects(self) -> None:
+        """Test an NDJSON upload reads plain addresses and objects, malformed lines being invalid."""
+        ndjson_body = '"a@example.com"\n{"email": "known@example.com"}\n\n{broken\n{"email": "a@example.com"}\n'
+        response: Response = self.api_client.generic(
+            "POST",
+            self.import_url,
+            ndjson_body,
+            content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual([response.data[counter] for counter in ("known", "queued", "invalid")], [1, 1, 1])
+        self.assertEqual(VerificationJob.objects.get().emails, ["a@example.com"])
+
+    def test_unsupported_content_type_is_rejected(self) -> None:
+        """Test an upload in an unknown format is rejected before anything is imported."""
+        response: Response = self.api_client.post(self.import_url, {"emails": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        self.assertFalse(EmailImport.objects.exists())
+
+    def test_csv_without_header_is_read_lazily(self) -> None:
+        """Test a headerless CSV is read from its first row, one line at a time."""
+        stream = io.BytesIO("\ufefffirst@example.com\nsecond@example.com\n".encode())
+        addresses = iter_csv_addresses(iter_lines(stream))
+        self.assertEqual(next(addresses), "first@example.com")
+        self.assertLess(stream.tell(), len(stream.getvalue()))
+        self.assertEqual(list(addresses), ["second@example.com"])
+
+
+class EmailExportTestCases(TestCase):
+    """Test cases for the streamed email exports."""
+
+    export_url = "/api/v1/email_service/export/"
+
+    def setUp(self) -> None:
+        """Store a few emails to export."""
+        self.api_client = APIClient()
+        for index in range(3):
+            Email.objects.create(email=f"user{index}@example.com", status="valid", score=90 - index, disposable=False)
+
+    @mock.patch.object(EmailServiceView, "export_chunk_size", 2)
+    def test_ndjson_export_is_streamed_in_chunks(self) -> None:
+        """Test the NDJSON export streams one JSON object per email, chunk by chunk."""
+        response = self.api_client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        with self.assertNumQueries(1):
+            chunks = [chunk.decode() for chunk in response.streaming_content]
+        self.assertEqual([chunk.count("\n") for chunk in chunks], [2, 1])
+        exported_emails = [json.loads(line) for line in "".join(chunks).splitlines()]
+        self.assertEqual([exported_email["email"] for exported_email in exported_emails], [
+            "user0@example.com",
+            "user1@example.com",
+            "user2@example.com",
+        ])
+        self.assertEqual(exported_emails[1]["score"], 89)
+
+    def test_csv_export_has_a_header_row(self) -> None:
+        """Test the CSV export starts with the field names."""
+        response = self.api_client.get(self.export_url, {"file_format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0][:3], ["id", "email", "status"])
+        self.assertEqual([row[1] for row in rows[1:]], ["user0@example.com", "user1@example.com", "user2@example.com"])
+
+    def test_unknown_export_format_is_rejected(self) -> None:
+        """Test an unknown export format is a bad request."""
+        response = self.api_client.get(self.export_url, {"file_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EmailExportASGITestCases(TransactionTestCase):
+    """Test cases for the email exports served through the project's ASGI application."""
+
+    @staticmethod
+    async def asgi_get(path: str, query_string: bytes = b"") -> List[Dict[str, Any]]:
+        """Send a GET through the ASGI application, returning the messages it sent back."""
+        sent_messages: List[Dict[str, Any]] = []
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            sent_messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query_string,
+            "root_path": "",
+            "headers": [(b"host", b"testserver")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        await asgi_application(scope, receive, send)
+        return sent_messages
+
+    @mock.patch.object(EmailServiceView, "export_chunk_size", 2)
+    def test_export_streams_under_asgi(self) -> None:
+        """Test the export's rows are read off the event loop, chunk by chunk, to the last one."""
+        for index in range(3):
+            Email.objects.create(email=f"user{index}@example.com", status="valid", score=90, disposable=False)
+
+        sent_messages = asyncio.run(self.asgi_get("/api/v1/email_service/export/", b"file_format=csv"))
+
+        self.assertEqual(sent_messages[0]["status"], status.HTTP_200_OK)
+        body_chunks = [message["body"].decode() for message in sent_messages[1:-1]]
+        self.assertEqual([body_chunk.count("\n") for body_chunk in body_chunks], [2, 2])
+        rows = list(csv.reader("".join(body_chunks).splitlines()))
+        self.assertEqual([row[1] for row in rows[1:]], ["user0@example.com", "user1@example.com", "user2@example.com"])
+        self.assertEqual(sent_messages[-1], {"type": "http.response.body"})
+
+
+class EmailListPaginationTestCases(TestCase):
+    """Test cases for the keyset pagination of the email list."""
+
+    list_url = "/api/v1/email_service/"
+
+    def setUp(self) -> None:
+        """Store a few emails to page through."""
+        self.api_client = APIClient()
+        for index in range(5):
+            Email.objects.create(email=f"user{index}@example.com", status="valid", score=90, disposable=False)
+
+    def test_pages_are_fetched_by_keyset_without_counting(self) -> None:
+        """Test every page is fetched by a single keyset query, through opaque cursors."""
+        page_url = f"{self.list_url}?page_size=2"
+        pages = []
+        while page_url:
+            with self.assertNumQueries(1) as queries:
+                page = self.api_client.get(page_url).data
+            for query in queries.captured_queries:
+                self.assertNotIn("COUNT", query["sql"].upper())
+            self.assertNotIn("count", page)
+            pages.append([email["email"][:5] for email in page["results"]])
+            page_url = page["next"]
+
+        self.assertEqual(pages, [["user0", "user1"], ["user2", "user3"], ["user4"]])
+        for query in queries.captured_queries:
+            self.assertIn('"id" >', query["sql"])
+
+    def test_count_is_opt_in(self) -> None:
+        """Test the total is only counted when asked for, with one COUNT besides the page query."""
+        with self.assertNumQueries(2):
+            page = self.api_client.get(self.list_url, {"page_size": 2, "with_count": "true"}).data
+        self.assertEqual(page["count"], 5)
+        self.assertEqual(len(page["results"]), 2)
+
+
+class ConditionalGetTestCases(TestCase):
+    """Test cases for the ETag/Last-Modified validation of the list and retrieve endpoints."""
+
+    list_url = "/api/v1/email_service/"
+
+    def setUp(self) -> None:
+        """Store an email to poll."""
+        self.api_client = APIClient()
+        self.email = Email.objects.create(email="polled@example.com", status="valid", score=90, disposable=False)
+        self.email_url = f"{self.list_url}{self.email.id}/"
+
+    def test_retrieve_answers_not_modified_until_the_email_changes(self) -> None:
+        """Test a retrieve matching the ETag or Last-Modified is a bodiless 304, until the email is saved."""
+        response: Response = self.api_client.get(self.email_url)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            not_modified = self.api_client.get(self.email_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.content, b"")
+        not_modified = self.api_client.get(self.email_url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.email.internal_status = "completed"
+        self.email.save()
+        modified = self.api_client.get(self.email_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertEqual(modified.data["internal_status"], "completed")
+        self.assertNotEqual(modified["ETag"], etag)
+
+    def test_list_etag_changes_with_inserts_and_deletes(self) -> None:
+        """Test the list ETag is checked with one query and changes when rows come and go."""
+        etag = self.api_client.get(self.list_url)["ETag"]
+        with self.assertNumQueries(1):
+            not_modified = self.api_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotEqual(self.api_client.get(self.list_url, {"page_size": 1})["ETag"], etag)
+
+        new_email = Email.objects.create(email="new@example.com", status="valid", score=80, disposable=False)
+        response: Response = self.api_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response["ETag"]
+        new_email.delete()
+        response = self.api_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class AsyncEmailViewTestCases(TestCase):
+    """Test cases for the async email service endpoints."""
+
+    async_url = "/api/v1/async/email_service/"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Point the views' Hunter client to a local fake Hunter API, answering slowly."""
+        super().setUpClass()
+        cls.fake_hunter = FakeHunterServer(latency=0.2).start()
+        cls.addClassCleanup(cls.fake_hunter.stop)
+        base_url_patch = mock.patch.object(EmailServiceView.hunter_client, "base_url", cls.fake_hunter.base_url)
+        base_url_patch.start()
+        cls.addClassCleanup(base_url_patch.stop)
+
+    async def test_slow_verifications_run_concurrently(self) -> None:
+        """Test concurrent creates await Hunter together, then find the stored emails."""
+        async_client = AsyncClient()
+        emails = [f"async{index}@example.com" for index in range(5)]
+        started_at = time.monotonic()
+        responses = await asyncio.gather(*(
+            async_client.post(self.async_url, {"email": email}, content_type="application/json")
+            for email in emails
+        ))
+        self.assertLess(time.monotonic() - started_at, 0.2 * len(emails) / 2)
+        self.assertEqual([response.status_code for response in responses], [status.HTTP_201_CREATED] * len(emails))
+
+        response = await async_client.post(self.async_url, {"email": emails[0]}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["id"], responses[0].json()["id"])
+        self.assertEqual(await Email.objects.acount(), len(emails))
+
+    async def test_invalid_payloads_are_rejected_like_the_sync_views(self) -> None:
+        """Test the async endpoints validate with the same serializers."""
+        async_client = AsyncClient()
+        response = await async_client.post(self.async_url, {"email": "invalid"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", response.json())
+
+        email = await Email.objects.acreate(email="stored@example.com", status="valid", score=90, disposable=False)
+        email_url = f"{self.async_url}{email.id}/"
+        response = await async_client.put(email_url, {"internal_status": "bogus"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def create_with_both_views(self, verify_error: Exception) -> Tuple[Response, Any]:
+        """Create an email through the sync and the async views, Hunter failing with ``verify_error``."""
+        with mock.patch.object(HunterClient, "send_request", side_effect=verify_error):
+            sync_response = await sync_to_async(APIClient().post)(
+                "/api/v1/email_service/",
+                {"email": "failing@example.com"},
+                format="json",
+            )
+        with mock.patch.object(HunterClient, "asend_request", side_effect=verify_error):
+            async_response = await AsyncClient().post(
+                self.async_url,
+                {"email": "failing@example.com"},
+                content_type="application/json",
+            )
+        self.assertEqual(async_response.json(), sync_response.data)
+        self.assertEqual(async_response.get("Retry-After"), sync_response.get("Retry-After"))
+        return sync_response, async_response
+
+    async def test_failed_verifications_are_answered_like_the_sync_views(self) -> None:
+        """Test both create endpoints answer an open circuit with a 503, and other errors with a logged 500."""
+        _, async_response = await self.create_with_both_views(CircuitOpenError("email-verifier", 12.5))
+        self.assertEqual(async_response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(async_response["Retry-After"], "13")
+
+        with self.assertLogs("modules.email_module.views", level="ERROR") as logs:
+            _, async_response = await self.create_with_both_views(ValueError("Unexpected payload"))
+        self.assertEqual(async_response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(len(logs.records), 2)
+
+    async def test_retrieve_update_and_delete(self) -> None:
+        """Test the detail endpoints read, update and delete with the async ORM."""
+        async_client = AsyncClient()
+        email = await Email.objects.acreate(email="stored@example.com", status="valid", score=90, disposable=False)
+        email_url = f"{self.async_url}{email.id}/"
+
+        response = await async_client.put(email_url, {"internal_status": "completed"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = await async_client.get(email_url)
+        email_data = response.json()
+        # The async test client takes extra headers by their raw names
+        not_modified = await async_client.get(email_url, **{"if-none-match": response["ETag"]})
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        not_modified = await async_client.get(email_url, **{"if-modified-since": response["Last-Modified"]})
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(email_data["internal_status"], "completed")
+        self.assertEqual((await async_client.get(self.async_url)).json()["results"], [email_data])
+
+        self.assertEqual((await async_client.delete(email_url)).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual((await async_client.get(email_url)).status_code, status.HTTP_404_NOT_FOUND)
+        response = await async_client.put(email_url, {"internal_status": "completed"}, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BulkUpdateTestCases(TestCase):
+    """Test cases for the bulk internal status updates."""
+
+    bulk_update_url = "/api/v1/email_service/bulk_update/"
+
+    def setUp(self) -> None:
+        """Store valid and invalid emails."""
+        self.api_client = APIClient()
+        self.emails = [
+            Email.objects.create(email=f"user{index}@example.com", status=email_status, score=50, disposable=False)
+            for index, email_status in enumerate(["valid", "invalid", "invalid", "valid"])
+        ]
+
+    def test_update_by_filter_is_a_single_statement(self) -> None:
+        """Test emails selected by a filter are updated with one UPDATE, the count being returned."""
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = self.api_client.put(
+                self.bulk_update_url,
+                {"internal_status": "canceled", "filters": {"status": "invalid"}},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The replaced statuses are counted for the stats, then a single UPDATE changes the emails
+        email_queries = [query["sql"] for query in queries.captured_queries if '"email_module_email"' in query["sql"]]
+        self.assertEqual([email_query.split(" ", 1)[0] for email_query in email_queries], ["SELECT", "UPDATE"])
+        self.assertEqual(response.data, {"updated": 2})
+        self.assertEqual(
+            list(Email.objects.order_by("id").values_list("internal_status", flat=True)),
+            ["pending", "canceled", "canceled", "pending"],
+        )
+
+    def test_update_by_ids_skips_emails_already_in_that_status(self) -> None:
+        """Test emails selected by ID are only counted when their status changes."""
+        Email.objects.filter(pk=self.emails[0].id).update(internal_status="completed")
+        response: Response = self.api_client.put(
+            self.bulk_update_url,
+            {"internal_status": "completed", "ids": [self.emails[0].id, self.emails[3].id, 9999]},
+            format="json",
+        )
+        self.assertEqual(response.data, {"updated": 1})
+        self.assertEqual(Email.objects.get(pk=self.emails[3].id).internal_status, "completed")
+
+    def test_selection_is_required(self) -> None:
+        """Test a bulk update must select its emails by either IDs or non-empty filters."""
+        for payload in (
+            {"internal_status": "completed"},
+            {"internal_status": "completed", "filters": {}},
+            {"internal_status": "completed", "ids": [1], "filters": {"status": "valid"}},
+            {"internal_status": "bogus", "ids": [1]},
+        ):
+            response: Response = self.api_client.put(self.bulk_update_url, payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Email.objects.exclude(internal_status="pending").exists())
+
+
+class EmailListFilterTestCases(TestCase):
+    """Test cases for the filters of the email list."""
+
+    list_url = "/api/v1/email_service/"
+
+    def setUp(self) -> None:
+        """Store emails of a few statuses and domains."""
+        self.api_client = APIClient()
+        for email, email_status, disposable in (
+            ("a@Example.com", "valid", False),
+            ("b@example.com", "invalid", False),
+            ("c@mailinator.com", "invalid", True),
+        ):
+            DatabaseClient.store_email(email, email_status, 50, disposable)
+
+    def list_emails(self, **filters: Any) -> List[str]:
+        """Return the addresses listed with the given filters."""
+        response: Response = self.api_client.get(self.list_url, filters)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [email["email"] for email in response.data["results"]]
+
+    def test_filters_select_emails(self) -> None:
+        """Test each filter, and their combination, selects the matching emails."""
+        self.assertEqual(self.list_emails(status="invalid"), ["b@example.com", "c@mailinator.com"])
+        self.assertEqual(self.list_emails(domain="EXAMPLE.com"), ["a@Example.com", "b@example.com"])
+        self.assertEqual(self.list_emails(disposable="true"), ["c@mailinator.com"])
+        self.assertEqual(self.list_emails(status="invalid", disposable="false"), ["b@example.com"])
+        self.assertEqual(self.list_emails(internal_status="completed"), [])
+        self.assertEqual(self.list_emails(internal_status="bogus"), [])
+
+    def test_internal_status_filter_accepts_stored_values(self) -> None:
+        """Test the internal status filter selects emails by stored values outside the update choices."""
+        Email.objects.filter(email="b@example.com").update(internal_status="new")
+        self.assertEqual(self.list_emails(internal_status="new"), ["b@example.com"])
+
+    def test_filtered_pages_use_the_composite_indexes(self) -> None:
+        """Test the SQLite query plan of every filtered page searches its index."""
+        if connection.vendor != "sqlite":
+            self.skipTest("Query plans are checked on SQLite")
+        for filter_name, index_name in (
+            ("status", "email_status_idx"),
+            ("internal_status", "email_internal_status_idx"),
+            ("domain", "email_domain_idx"),
+            ("disposable", "email_disposable_idx"),
+        ):
+            filter_value = {"status": "invalid", "internal_status": "pending", "domain": "example.com"}
+            with CaptureQueriesContext(connection) as queries:
+                self.list_emails(**{filter_name: filter_value.get(filter_name, "true")})
+            for query in queries.captured_queries:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+                    query_plan = " ".join(str(plan_row[-1]) for plan_row in cursor.fetchall())
+                self.assertIn(f"USING INDEX {index_name}", query_plan)
+                self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", query_plan)
+
+
+class EmailStatsTestCases(TestCase):
+    """Test cases for the incrementally maintained email stats."""
+
+    stats_url = "/api/v1/email_service/stats/"
+
+    def setUp(self) -> None:
+        """Store emails through the database client."""
+        self.api_client = APIClient()
+        DatabaseClient.store_email("a@example.com", "valid", 90, False)
+        DatabaseClient.store_email("b@example.com", "invalid", 10, False)
+        DatabaseClient.store_email("c@mailinator.com", "invalid", 5, True)
+        DatabaseClient.store_email("a@example.com", "valid", 90, False)
+
+    def assert_stats_match_a_rebuild(self) -> None:
+        """Check the incremental stats equal the stats recounted from the email table."""
+        incremental_stats = get_stats(top_domains=1000)
+        call_command("rebuild_email_stats", stdout=io.StringIO())
+        self.assertEqual(incremental_stats, get_stats(top_domains=1000))
+
+    def test_stats_follow_every_write_path(self) -> None:
+        """Test stores, updates, bulk writes and deletes all keep the stats exact."""
+        stats = self.api_client.get(self.stats_url).data
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["status"], {"invalid": 2, "valid": 1})
+        self.assertEqual(stats["disposable"], {"false": 2, "true": 1})
+        self.assertEqual(stats["domain"], {"example.com": 2, "mailinator.com": 1})
+
+        first_email = Email.objects.get(email="a@example.com")
+        DatabaseClient.update_email(first_email.id, internal_status="completed")
+        DatabaseClient.bulk_update_internal_status("canceled", filters={"status": "invalid"})
+        DatabaseClient.bulk_store_emails([
+            {"email": "d@example.org", "status": "valid", "score": 70, "disposable": False},
+            {"email": "a@example.com", "status": "valid", "score": 90, "disposable": False},
+        ])
+        self.assertEqual(self.api_client.delete(f"/api/v1/email_service/{first_email.id}/").status_code, 204)
+
+        stats = get_stats()
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["internal_status"], {"canceled": 2, "pending": 1})
+        self.assertEqual(stats["domain"], {"example.com": 1, "example.org": 1, "mailinator.com": 1})
+        self.assert_stats_match_a_rebuild()
+
+    def test_stats_only_follow_writes_that_affected_a_row(self) -> None:
+        """Test deleting or updating an email that is gone leaves the stats alone."""
+        email_id = Email.objects.get(email="a@example.com").id
+        self.assertTrue(DatabaseClient.delete_email(email_id))
+        self.assertFalse(DatabaseClient.delete_email(email_id))
+        self.assertIsNone(DatabaseClient.update_email(email_id, internal_status="completed"))
+        self.assertEqual(get_stats()["status"], {"invalid": 2})
+        self.assertNotIn("completed", get_stats()["internal_status"])
+        self.assert_stats_match_a_rebuild()
+
+    def test_bulk_store_only_counts_the_rows_it_inserted(self) -> None:
+        """Test an address stored by another request mid-call is counted once, by that request."""
+        get_stored_addresses = DatabaseClient.get_stored_addresses
+
+        def store_concurrently(addresses: List[str]) -> Any:
+            stored_addresses = get_stored_addresses(addresses)
+            if "d@example.org" not in stored_addresses:
+                DatabaseClient.store_email("d@example.org", "valid", 70, False)
+            return stored_addresses
+
+        with mock.patch.object(DatabaseClient, "get_stored_addresses", side_effect=store_concurrently):
+            stored_emails = DatabaseClient.bulk_store_emails([
+                {"email": "d@example.org", "status": "valid", "score": 70, "disposable": False},
+                {"email": "e@example.org", "status": "valid", "score": 60, "disposable": False},
+                {"email": "e@example.org", "status": "invalid", "score": 0, "disposable": False},
+            ])
+
+        self.assertEqual(stored_emails["e@example.org"]["status"], "valid")
+        self.assertEqual(get_stats()["domain"]["example.org"], 2)
+        self.assert_stats_match_a_rebuild()
+
+    def test_stats_are_read_without_touching_the_email_table(self) -> None:
+        """Test the stats endpoint reads the summary only, one query per dimension."""
+        with CaptureQueriesContext(connection) as queries:
+            stats = self.api_client.get(self.stats_url, {"domains": 1}).data
+        self.assertEqual(len(queries.captured_queries), 4)
+        for query in queries.captured_queries:
+            self.assertNotIn('"email_module_email"', query["sql"])
+        self.assertEqual(stats["domain"], {"example.com": 2})
+
+    def test_rebuild_repairs_drifted_stats(self) -> None:
+        """Test the rebuild command recounts stats after writes that bypassed the database client."""
+        Email.objects.filter(status="invalid").delete()
+        self.assertEqual(get_stats()["total"], 3)
+        call_command("rebuild_email_stats", stdout=io.StringIO())
+        self.assertEqual(get_stats()["status"], {"valid": 1})
@@ -2,12 +2,23 @@ from django.urls import include, path
 from rest_framework import routers
 from rest_framework.documentation import include_docs_urls
 
-from . import views
+from . import async_views, views
 
 router = routers.DefaultRouter()
 router.register("email_service", views.EmailServiceView, "email_service")
 
 urlpatterns = [
     path("api/v1/", include(router.urls)),
+    # Async twins of the email service endpoints, for ASGI deployments
+    path(
+        "api/v1/async/email_service/",
+        async_views.AsyncEmailListView.as_view(),
+        name="async_email_service-list",
+    ),
+    path(
+        "api/v1/async/email_service/<int:pk>/",
+        async_views.AsyncEmailDetailView.as_view(),
+        name="async_email_service-detail",
+    ),
     path("docs/", include_docs_urls(title="Email service API")),
 ]
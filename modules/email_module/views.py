@@ -1,14 +1,81 @@
-from typing import Any, Dict, Optional
+import hashlib
+import io
+import logging
+import math
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 
-from .models import Email
-from .serializer import CreateEmailSerializer, EmailSerializer, UpdateEmailSerializer
+from utils.rate_limiter import RateLimitExceeded
+from utils.resilience import CircuitOpenError
+
+from .models import Email, EmailImport
+from .pagination import EmailCursorPagination
+from .serializer import (
+    BulkEmailSerializer,
+    BulkUpdateEmailSerializer,
+    CreateEmailSerializer,
+    EmailFilterSerializer,
+    EmailImportSerializer,
+    EmailSerializer,
+    UpdateEmailSerializer,
+    VerificationJobSerializer,
+)
+from .services.bulk_verification import verify_and_store_emails
 from .services.db_client import DatabaseClient
+from .services.email_export import EXPORT_FORMATS, iter_export
+from .services.email_import import IMPORT_FORMATS, import_emails
+from .services.email_stats import get_stats
 from .services.hunter_client.hunter_client import HunterClient
-from .services.hunter_client.methods.verify_email import EmailDTO
+from .services.job_queue import VerificationJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+def compute_etag(full_path: str, renderer_format: str, *state: Any) -> str:
+    """Return the ETag of a response rendering ``state``."""
+    # The same state renders differently per URL (filters, cursor) and renderer
+    request_state = (full_path, renderer_format, *state)
+    return quote_etag(hashlib.sha256(repr(request_state).encode()).hexdigest()[:32])
+
+
+def email_validators(full_path: str, renderer_format: str, updated_at: datetime) -> Tuple[str, int]:
+    """Return the ETag and Last-Modified timestamp of an email's response, from its ``updated_at``."""
+    return compute_etag(full_path, renderer_format, updated_at.timestamp()), int(updated_at.timestamp())
+
+
+def create_outcome(
+    email: str,
+    email_data: Optional[Dict[str, Any]] = None,
+    created: bool = False,
+    error: Optional[Exception] = None,
+) -> Tuple[Any, int, Dict[str, str]]:
+    """
+    Return the body, status code and headers answering the create of ``email``.
+
+    Shared by the sync and async create endpoints: the stored ``email_data``
+    (201 if ``created`` by the request, else 200), or the ``error`` that
+    prevented verifying it.
+    """
+    if error is None:
+        return email_data, status.HTTP_201_CREATED if created else status.HTTP_200_OK, {}
+    if isinstance(error, (CircuitOpenError, RateLimitExceeded)):
+        # Hunter is failing or saturated: tell the client when to come back
+        return (
+            {"error": "Email verification is temporarily unavailable"},
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            {"Retry-After": str(math.ceil(error.retry_after))},
+        )
+    logger.error("Failed to verify email %s", email, exc_info=error)
+    return {"error": "Failed to verify email"}, status.HTTP_500_INTERNAL_SERVER_ERROR, {}
 
 
 # Create your views here.
@@ -17,7 +84,14 @@ class EmailServiceView(viewsets.ModelViewSet):
 
     queryset = Email.objects.all()
     http_method_names = ["get", "post", "put", "delete", "head", "options", "trace"]
+    pagination_class = EmailCursorPagination
     hunter_client = HunterClient()
+    # Hunter calls in flight at once for a single bulk request
+    bulk_max_concurrency = 10
+    # Uploaded rows handled, and queued as one verification job, at a time
+    import_chunk_size = 500
+    # Rows fetched from the cursor, and sent to the client, at a time
+    export_chunk_size = 2000
 
     @property
     def serializer_class(self) -> Any:
@@ -27,6 +101,9 @@ class EmailServiceView(viewsets.ModelViewSet):
     serializer_classes = {
         "create": CreateEmailSerializer,
         "update": UpdateEmailSerializer,
+        "bulk": BulkEmailSerializer,
+        "enqueue": BulkEmailSerializer,
+        "bulk_update": BulkUpdateEmailSerializer,
     }
 
     def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
@@ -62,6 +139,98 @@ class EmailServiceView(viewsets.ModelViewSet):
             return serializer.is_valid(raise_exception=raise_exception)
         return True
 
+    def filter_queryset(self, queryset: Any) -> Any:
+        """
+        Filter the listed and exported emails by the query parameters.
+
+        ``status``, ``internal_status``, ``domain`` and ``disposable`` are each
+        backed by a composite index with ``id``, the keyset pages' order.
+
+        Args:
+            queryset (QuerySet): The emails to filter.
+
+        Returns:
+            QuerySet: The filtered emails.
+        """
+        queryset = super().filter_queryset(queryset)
+        if self.action not in {"list", "export"}:
+            return queryset
+        # A plain dict, as form input would read missing booleans as false
+        filter_serializer = EmailFilterSerializer(data=self.request.query_params.dict())
+        filter_serializer.is_valid(raise_exception=True)
+        return DatabaseClient.filter_emails(queryset, filter_serializer.validated_data)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Any:  # noqa: WPS125
+        """
+        List the emails, answering 304 when the client's copy is still current.
+
+        The page is fetched once, with a single keyset query, and its ETag
+        derives from the ``id`` and ``updated_at`` of the rows served. Deletes
+        do not leave an ``updated_at`` behind, so lists carry no Last-Modified.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The response object.
+        """
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        etag = self._etag(
+            request,
+            self.paginator.count,
+            [(email.id, email.updated_at.timestamp()) for email in page],
+            self.paginator.has_next,
+        )
+        not_modified = get_conditional_response(request._request, etag=etag)  # noqa: WPS437
+        if not_modified is not None:
+            return not_modified
+
+        response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        """
+        Retrieve an email, answering 304 when the client's copy is still current.
+
+        Args:
+            request (Request): The request object.
+            kwargs (Any): Additional keyword arguments.
+
+        Returns:
+            Response: The response object.
+        """
+        try:
+            updated_at: Optional[datetime] = (
+                self.get_queryset().filter(pk=kwargs.get("pk")).values_list("updated_at", flat=True).first()
+            )
+        except (TypeError, ValueError):
+            updated_at = None
+        if updated_at is None:
+            # Let the default lookup answer the 404
+            return super().retrieve(request, *args, **kwargs)
+
+        etag, last_modified = email_validators(
+            request.get_full_path(),
+            request.accepted_renderer.format,
+            updated_at,
+        )
+        not_modified = get_conditional_response(
+            request._request,  # noqa: WPS437
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def _etag(self, request: Request, *state: Any) -> str:
+        return compute_etag(request.get_full_path(), request.accepted_renderer.format, *state)
+
     def create(self, request: Request) -> Response:
         """
         Create a new email record and verifies the email address.
@@ -77,25 +246,178 @@ class EmailServiceView(viewsets.ModelViewSet):
             email,
         )
         if email_data is not None:
-            return Response(email_data, status=status.HTTP_200_OK)
+            outcome = create_outcome(email, email_data)
+        else:
+            try:
+                response = self.hunter_client.verify_email(email)
 
-        try:
-            response: EmailDTO = self.hunter_client.verify_email(email)
+                new_email_data: Optional[Dict[str, Any]] = DatabaseClient.store_email(
+                    email,
+                    response.status,
+                    response.score,
+                    response.disposable,
+                )
+                outcome = create_outcome(email, new_email_data, created=True)
+            except Exception as err:
+                outcome = create_outcome(email, error=err)
+        response_data, status_code, headers = outcome
+        return Response(response_data, status=status_code, headers=headers)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request) -> Response:
+        """
+        Verify and store many email addresses at once.
+
+        See ``verify_and_store_emails``, the request costs three queries whatever
+        the number of addresses.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: One result per distinct address, in request order, with its
+                outcome (``existing``, ``created``, ``invalid`` or ``failed``).
+        """
+        results = verify_and_store_emails(
+            self.hunter_client,
+            request.data["emails"],
+            max_concurrency=self.bulk_max_concurrency,
+        )
+        return Response(
+            {"results": results},
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["post"])
+    def enqueue(self, request: Request) -> Response:
+        """
+        Queue email addresses for verification by the background workers.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The job ID and the URL its progress can be polled at.
+        """
+        job = VerificationJobQueue.enqueue(request.data["emails"])
+        return Response(
+            {
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": reverse("email_service-job", kwargs={"job_id": job.id}, request=request),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(detail=False, methods=["get"], url_path=r"jobs/(?P<job_id>[0-9]+)", url_name="job")
+    def job(self, request: Request, job_id: str) -> Response:
+        """
+        Report the progress of a verification job.
 
-            new_email_data: Optional[Dict[str, Any]] = DatabaseClient.store_email(
-                email,
-                response.status,
-                response.score,
-                response.disposable,
+        Args:
+            request (Request): The request object.
+            job_id (str): The ID of the job.
+
+        Returns:
+            Response: The response object.
+        """
+        job = VerificationJobQueue.get_job(int(job_id))
+        if job is None:
+            return Response(
+                {"detail": "Not found."},
+                status=status.HTTP_404_NOT_FOUND,
             )
-            return Response(new_email_data, status=status.HTTP_201_CREATED)
-        except Exception as err:
-            print("err", err)  # noqa: E800
+        return Response(VerificationJobSerializer(job).data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> Any:
+        """
+        Stream the emails as NDJSON (the default) or CSV, picked with ``?file_format=``.
+
+        The emails are filtered like the list endpoint, read from the database in
+        chunks and encoded as they are sent, so exports of any size run in
+        constant memory. Under ASGI, ``StreamingASGIHandler`` reads the chunks
+        off the event loop.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            StreamingHttpResponse: The encoded emails.
+        """
+        export_format = request.query_params.get("file_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
             return Response(
-                {"error": "Failed to verify email"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": f"Unsupported file format, expected one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
+        queryset = self.filter_queryset(self.get_queryset()).order_by("id")
+        field_names = [field.attname for field in Email._meta.concrete_fields]  # noqa: WPS437
+        response = StreamingHttpResponse(
+            iter_export(queryset, field_names, export_format, chunk_size=self.export_chunk_size),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="emails.{export_format}"'
+        return response
+
+    @action(detail=False, methods=["post"], url_path="import", url_name="import")
+    def import_emails(self, request: Request) -> Response:
+        """
+        Import a CSV or NDJSON list of email addresses, sent as the raw request body.
+
+        The body is parsed as it is read rather than buffered, so uploads of any
+        size run in constant memory. Stored addresses are counted as known, the
+        unknown ones are queued for verification by the background workers.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The import counters and the URL its verification progress
+                can be polled at.
+        """
+        content_type = request.content_type.split(";", 1)[0].strip().lower()
+        file_format = IMPORT_FORMATS.get(content_type)
+        if file_format is None:
+            return Response(
+                {"error": f"Unsupported content type, expected one of: {', '.join(IMPORT_FORMATS)}"},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+
+        email_import = EmailImport.objects.create(file_format=file_format)
+        import_emails(email_import, request.stream or io.BytesIO(), chunk_size=self.import_chunk_size)
+        response_data = EmailImportSerializer(email_import).data
+        response_data["status_url"] = reverse(
+            "email_service-import-status",
+            kwargs={"import_id": email_import.id},
+            request=request,
+        )
+        if email_import.status == EmailImport.FAILED:
+            # The chunks imported before the failure stay queued, the status URL reports them
+            return Response(response_data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=["get"], url_path=r"imports/(?P<import_id>[0-9]+)", url_name="import-status")
+    def import_status(self, request: Request, import_id: str) -> Response:
+        """
+        Report the progress of an email import and of its verification.
+
+        Args:
+            request (Request): The request object.
+            import_id (str): The ID of the import.
+
+        Returns:
+            Response: The response object.
+        """
+        email_import = EmailImport.objects.filter(pk=int(import_id)).first()
+        if email_import is None:
+            return Response(
+                {"detail": "Not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(EmailImportSerializer(email_import).data, status=status.HTTP_200_OK)
+
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
         Update the internal status of an email record.
@@ -118,6 +440,66 @@ class EmailServiceView(viewsets.ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
+    @action(detail=False, methods=["get"])
+    def stats(self, request: Request) -> Response:
+        """
+        Report the number of emails per status, internal status, disposability and domain.
+
+        The counts are kept up to date as emails are written, so reading them
+        costs the same whatever the number of emails. Only the most frequent
+        domains are reported, ``?domains=`` of them (20 by default).
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The response object.
+        """
+        try:
+            top_domains = min(max(int(request.query_params.get("domains", 20)), 0), 1000)
+        except ValueError:
+            return Response(
+                {"error": "domains must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(get_stats(top_domains=top_domains), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["put"])
+    def bulk_update(self, request: Request) -> Response:
+        """
+        Update the internal status of many email records at once.
+
+        The emails are selected by ``ids`` or by ``filters`` (``status``,
+        ``internal_status``, ``domain``, ``disposable``) and updated with a
+        single UPDATE statement, whatever their number.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The number of emails updated.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated_count = DatabaseClient.bulk_update_internal_status(
+            serializer.validated_data["internal_status"],
+            email_ids=serializer.validated_data.get("ids"),
+            filters=serializer.validated_data.get("filters"),
+        )
+        return Response(
+            {"updated": updated_count},
+            status=status.HTTP_200_OK,
+        )
+
+    def perform_destroy(self, instance: Email) -> None:
+        """
+        Delete an email record, discounting it from the stats.
+
+        Args:
+            instance (Email): The email to delete.
+        """
+        DatabaseClient.delete_email(instance.pk)
+
     # Disable unused methods
     def partial_update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Disabled partial_update method."""
@@ -0,0 +1,147 @@
+import asyncio
+import weakref
+from typing import Callable, Dict, Optional, Any  # noqa: I001
+
+import httpx
+
+from .base_fetcher import BaseFetcher, Timeout
+
+AsyncTransportFactory = Callable[[httpx.Limits], httpx.AsyncBaseTransport]
+
+
+class AsyncBaseFetcher(BaseFetcher):
+    """
+    Base client class for handling HTTP requests from both sync and async code.
+
+    On top of the blocking ``send_request`` inherited from ``BaseFetcher`` it
+    exposes ``asend_request``, backed by a pooled ``httpx.AsyncClient``.
+
+    Async connections belong to the event loop that opened them, so one client
+    is kept per running loop (an ASGI worker normally has exactly one).
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        base_url: str,
+        base_headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        async_transport: Optional[AsyncTransportFactory] = None,
+        **fetcher_options: Any,
+    ) -> None:
+        """
+        Initialize a new instance of the AsyncBaseFetcher class.
+
+        Args:
+            base_url (str): The base URL every endpoint is joined to.
+            base_headers (Optional[Dict[str, str]]): Headers sent with every request.
+            max_connections (int): Maximum number of concurrent async connections.
+            max_keepalive_connections (int): Maximum number of idle async
+                connections kept alive.
+            keepalive_expiry (float): Seconds an idle async connection is kept alive.
+            async_transport (Optional[AsyncTransportFactory]): Builds the transport
+                of each event loop's client from the connection limits, instead
+                of httpx's default pooled transport.
+            fetcher_options (Any): Options forwarded to ``BaseFetcher``.
+        """
+        super().__init__(base_url, base_headers, **fetcher_options)
+        self._async_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._async_transport = async_transport
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        async_client: Optional[httpx.AsyncClient] = self._async_clients.get(loop)
+        if async_client is None or async_client.is_closed:
+            async_client = httpx.AsyncClient(
+                limits=self._async_limits,
+                timeout=self._async_timeout(),
+                transport=self._async_transport(self._async_limits) if self._async_transport else None,
+            )
+            self._async_clients[loop] = async_client
+        return async_client
+
+    def _async_timeout(self, timeout: Optional[Timeout] = None) -> httpx.Timeout:
+        timeout = self.timeout if timeout is None else timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(read_timeout, connect=connect_timeout)
+        return httpx.Timeout(timeout)
+
+    async def aclose(self) -> None:
+        """Close the pooled async connections of the running event loop."""
+        async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if async_client is not None:
+            await async_client.aclose()
+
+    async def asend_request(  # noqa: WPS211
+        self,
+        endpoint: str,
+        req_params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+        method: str = "GET",
+        **kwargs: Any,
+    ) -> Optional[Dict]:
+        """
+        Send an HTTP request to the specified endpoint without blocking the event loop.
+
+        Args:
+            endpoint (str): The API endpoint.
+            req_params (Dict[str, str]): The query parameters.
+            headers (Optional[Dict[str, str]]): The headers to be passed as overrides.
+            method (str): HTTP method (GET, POST, etc.).
+
+        Returns:
+            Optional[Dict]: The response data, or None if an error occurs.
+
+        Raises:
+            CircuitOpenError: The endpoint's circuit is open, nothing was sent.
+        """
+        url = f"{self.base_url}/{endpoint}"
+
+        headers = dict(
+            **self.headers if self.headers else {},
+            **headers if headers else {},
+        )
+
+        timeout = kwargs.pop("timeout", self.timeout)
+        deadline_at = self._deadline_at()
+        circuit_breaker = self.circuit_breaker(endpoint)
+        attempt = 0
+        while True:
+            attempt += 1
+            circuit_breaker.before_call()
+            try:
+                response = await self.async_client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=req_params,
+                    timeout=self._async_timeout(self._attempt_timeout(timeout, deadline_at)),
+                    **kwargs,
+                )
+                response.raise_for_status()
+            except (httpx.TransportError, httpx.HTTPStatusError) as err:
+                failed_response = err.response if isinstance(err, httpx.HTTPStatusError) else None
+                retry_delay = self._handle_failure(circuit_breaker, method, attempt, failed_response, deadline_at)
+                if retry_delay is None:
+                    raise
+                await asyncio.sleep(retry_delay)
+                continue
+            except Exception:
+                # Any other error (broken body, redirect loop...) is a failure of the endpoint, not retried
+                circuit_breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled before the outcome was known
+                circuit_breaker.release_trial()
+                raise
+            circuit_breaker.record_success()
+            return response.json()
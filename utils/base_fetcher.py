@@ -1,19 +1,124 @@
-from typing import Dict, Optional, Any  # noqa: I001
+import threading
+import time
+from typing import Dict, Optional, Any, Tuple, Union  # noqa: I001
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+
+Timeout = Union[float, Tuple[float, float]]
 
 
 class BaseFetcher:
-    """Base client class for handling HTTP requests."""
+    """
+    Base client class for handling HTTP requests.
+
+    Every instance owns a pooled ``HTTPAdapter`` that keeps connections alive
+    between calls, so consecutive requests to the same host reuse the TCP/TLS
+    connection instead of paying a new handshake each time.
+
+    ``requests.Session`` is not thread-safe (its cookie jar and header state are
+    shared), so each thread gets its own session; all of them are mounted on the
+    same adapter and therefore share the same connection pool.
+
+    Requests are bounded by an overall ``deadline`` covering every attempt.
+    Idempotent requests failing with a connection error, a timeout or a
+    retryable status are retried following the ``RetryPolicy`` (jittered
+    exponential backoff honoring ``Retry-After``), and every endpoint has a
+    ``CircuitBreaker`` that fails fast with ``CircuitOpenError`` while the
+    endpoint keeps failing, instead of tying worker threads up on it.
+    """
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         base_url: str,
         base_headers: Optional[Dict[str, str]] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: Timeout = 10,
+        deadline: Optional[float] = 30.0,
+        retry_max_attempts: int = 3,
+        retry_backoff_base: float = 0.2,
+        retry_backoff_max: float = 5.0,
+        circuit_failure_threshold: int = 5,
+        circuit_reset_timeout: float = 30.0,
+        transport: Optional[HTTPAdapter] = None,
     ) -> None:
-        """Initialize a new instance of the BaseClient class."""
+        """
+        Initialize a new instance of the BaseClient class.
+
+        Args:
+            base_url (str): The base URL every endpoint is joined to.
+            base_headers (Optional[Dict[str, str]]): Headers sent with every request.
+            pool_connections (int): Number of per-host connection pools to keep cached.
+            pool_maxsize (int): Maximum number of connections kept alive per host.
+            pool_block (bool): Wait for a free connection instead of opening more
+                than ``pool_maxsize`` connections to the same host.
+            timeout (Timeout): Default timeout of each attempt, either a single
+                value or a ``(connect, read)`` tuple.
+            deadline (Optional[float]): Seconds a request may take overall,
+                retries and backoff included; None for no deadline.
+            retry_max_attempts (int): Tries of an idempotent request, 1 disables retries.
+            retry_backoff_base (float): Backoff before the first retry, doubled
+                on every further retry.
+            retry_backoff_max (float): Upper bound of the backoff.
+            circuit_failure_threshold (int): Consecutive failures opening the
+                circuit of an endpoint.
+            circuit_reset_timeout (float): Seconds an open circuit rejects calls
+                before letting a trial call through.
+            transport (Optional[HTTPAdapter]): Adapter mounted instead of the
+                pooled one built from the pool options (e.g. a ``CassetteAdapter``).
+        """
         self.base_url = base_url
         self.headers = base_headers if base_headers else {}
+        self.timeout = timeout
+        self.deadline = deadline
+        self.retry_policy = RetryPolicy(
+            max_attempts=retry_max_attempts,
+            backoff_base=retry_backoff_base,
+            backoff_max=retry_backoff_max,
+        )
+        self._circuit_failure_threshold = circuit_failure_threshold
+        self._circuit_reset_timeout = circuit_reset_timeout
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
+        self._adapter = transport or HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the keep-alive session of the current thread."""
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            session.headers["Connection"] = "keep-alive"
+            self._local.session = session
+        return session
+
+    def circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint."""
+        with self._circuit_breakers_lock:
+            circuit_breaker = self._circuit_breakers.get(endpoint)
+            if circuit_breaker is None:
+                circuit_breaker = CircuitBreaker(
+                    endpoint,
+                    self._circuit_failure_threshold,
+                    self._circuit_reset_timeout,
+                )
+                self._circuit_breakers[endpoint] = circuit_breaker
+            return circuit_breaker
+
+    def close(self) -> None:
+        """Close every pooled connection held by this instance."""
+        self._adapter.close()
 
     def send_request(  # noqa: WPS211
         self,
@@ -34,6 +139,9 @@ class BaseFetcher:
 
         Returns:
             Optional[Dict]: The response data, or None if an error occurs.
+
+        Raises:
+            CircuitOpenError: The endpoint's circuit is open, nothing was sent.
         """
         url = f"{self.base_url}/{endpoint}"
 
@@ -41,14 +149,74 @@ class BaseFetcher:
             **self.headers if self.headers else {},
             **headers if headers else {},
         )
+        timeout = kwargs.pop("timeout", self.timeout)
+        deadline_at = self._deadline_at()
+        circuit_breaker = self.circuit_breaker(endpoint)
+        attempt = 0
+        while True:
+            attempt += 1
+            circuit_breaker.before_call()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=req_params,
+                    timeout=self._attempt_timeout(timeout, deadline_at),
+                    **kwargs,
+                )
+                response.raise_for_status()
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as err:
+                retry_delay = self._handle_failure(circuit_breaker, method, attempt, err.response, deadline_at)
+                if retry_delay is None:
+                    raise
+                time.sleep(retry_delay)
+                continue
+            except Exception:
+                # Any other error (broken body, redirect loop...) is a failure of the endpoint, not retried
+                circuit_breaker.record_failure()
+                raise
+            except BaseException:
+                # Interrupted before the outcome was known
+                circuit_breaker.release_trial()
+                raise
+            circuit_breaker.record_success()
+            return response.json()
 
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=req_params,
-            timeout=10,
-            **kwargs,
-        )
-        response.raise_for_status()
-        return response.json()
+    def _deadline_at(self) -> Optional[float]:
+        return None if self.deadline is None else time.monotonic() + self.deadline
+
+    def _attempt_timeout(self, timeout: Timeout, deadline_at: Optional[float]) -> Timeout:
+        # No single attempt may outlive the deadline of the whole request
+        if deadline_at is None:
+            return timeout
+        remaining = max(deadline_at - time.monotonic(), 0.001)
+        if isinstance(timeout, tuple):
+            return min(timeout[0], remaining), min(timeout[1], remaining)
+        return min(timeout, remaining)
+
+    def _handle_failure(  # noqa: WPS211
+        self,
+        circuit_breaker: CircuitBreaker,
+        method: str,
+        attempt: int,
+        response: Any,
+        deadline_at: Optional[float],
+    ) -> Optional[float]:
+        """Record a failed attempt and return the delay before retrying it, or None to give up."""
+        status_code = None if response is None else response.status_code
+        # Client errors come from a healthy endpoint
+        if status_code is None or status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
+        if status_code is not None and status_code not in self.retry_policy.retry_statuses:
+            return None
+        if not self.retry_policy.can_retry(method, attempt):
+            return None
+        retry_after = None if response is None else parse_retry_after(response.headers.get("Retry-After"))
+        retry_delay = self.retry_policy.delay(attempt, retry_after)
+        if deadline_at is not None and time.monotonic() + retry_delay >= deadline_at:
+            return None
+        return retry_delay
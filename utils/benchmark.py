@@ -0,0 +1,71 @@
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_timings: List[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted timings."""
+    rank = max(math.ceil(percent / 100 * len(sorted_timings)), 1)
+    return sorted_timings[rank - 1]
+
+
+def measure(
+    benchmark: Callable[[int], Any],
+    iterations: int,
+    warmup: int = 0,
+) -> Dict[str, float]:
+    """
+    Time ``iterations`` runs of a benchmark, called with the iteration index.
+
+    Returns:
+        Dict[str, float]: The p50/p95/p99 and mean latencies in milliseconds,
+            and the throughput in operations per second.
+    """
+    for warmup_index in range(warmup):
+        benchmark(-warmup_index - 1)
+
+    timings: List[float] = []
+    started_at = time.perf_counter()
+    for index in range(iterations):
+        call_started_at = time.perf_counter()
+        benchmark(index)
+        timings.append((time.perf_counter() - call_started_at) * 1000)
+    total_seconds = time.perf_counter() - started_at
+
+    timings.sort()
+    results = {f"p{percent}_ms": round(percentile(timings, percent), 4) for percent in PERCENTILES}
+    results["mean_ms"] = round(sum(timings) / len(timings), 4)
+    results["ops_per_sec"] = round(iterations / total_seconds, 2)
+    results["iterations"] = iterations
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    metric: str = "p50_ms",
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Compare benchmark results to a baseline.
+
+    A benchmark regressed when its ``metric`` grew by more than ``threshold``
+    (a ratio, e.g. 0.1 for 10%) over the baseline. Benchmarks missing from the
+    baseline are reported with no change.
+    """
+    comparison: Dict[str, Dict[str, Any]] = {}
+    for name, benchmark_results in results.items():
+        baseline_value = baseline.get(name, {}).get(metric)
+        change = None
+        if baseline_value:
+            change = round(benchmark_results[metric] / baseline_value - 1, 4)
+        comparison[name] = {
+            "metric": metric,
+            "baseline": baseline_value,
+            "current": benchmark_results[metric],
+            "change": change,
+            "regressed": change is not None and change > threshold,
+        }
+    return comparison
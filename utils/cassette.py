@@ -0,0 +1,199 @@
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+CASSETTE_MODES = frozenset(("replay", "record", "replay_or_record"))
+
+# Never written to a cassette, nor part of the request matching
+FILTERED_PARAMS = frozenset(("api_key",))
+
+# The recorded body is already decoded, these would no longer describe it
+DROPPED_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding", "connection"))
+
+
+class CassetteMissError(Exception):
+    """Raised when replaying a request that is not in the cassette."""
+
+
+class Cassette:
+    """
+    Recorded HTTP interactions stored in a JSON file.
+
+    Requests are matched on their method and URL, query parameters sorted and
+    ``FILTERED_PARAMS`` (credentials) left out. A request recorded several times
+    is replayed in the recorded order, its last response repeating afterwards.
+
+    Modes:
+        - ``replay``: serve recorded responses only, raising ``CassetteMissError``
+          for anything else, so nothing ever reaches the network.
+        - ``record``: send every request and record its response.
+        - ``replay_or_record``: replay what was recorded, record the rest.
+    """
+
+    def __init__(self, path: str, mode: str = "replay") -> None:
+        """Initialize a new instance of the Cassette class."""
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'")
+        self.path = path
+        self.mode = mode
+        self._interactions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._play_counts: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if mode != "record" and os.path.exists(path):
+            with open(path) as cassette_file:
+                for interaction in json.load(cassette_file)["interactions"]:
+                    request_key = self.request_key(interaction["request"]["method"], interaction["request"]["url"])
+                    self._interactions[request_key].append(interaction["response"])
+
+    @staticmethod
+    def request_key(method: str, url: str) -> str:
+        """Return the key requests are matched on."""
+        url_parts = urlsplit(url)
+        query = urlencode(sorted(
+            (param, param_value)
+            for param, param_value in parse_qsl(url_parts.query, keep_blank_values=True)
+            if param not in FILTERED_PARAMS
+        ))
+        return f"{method.upper()} {urlunsplit(url_parts._replace(query=query))}"
+
+    def play(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded response of a request, or None if it must be sent."""
+        if self.mode == "record":
+            return None
+        request_key = self.request_key(method, url)
+        with self._lock:
+            responses = self._interactions.get(request_key)
+            if not responses:
+                if self.mode == "replay":
+                    raise CassetteMissError(f"No recorded response for {request_key} in {self.path}")
+                return None
+            play_count = self._play_counts[request_key]
+            self._play_counts[request_key] += 1
+            return responses[min(play_count, len(responses) - 1)]
+
+    def record(self, method: str, url: str, status_code: int, headers: Dict[str, str], body: bytes) -> None:
+        """Record the response of a request and save the cassette."""
+        recorded_response = {
+            "status_code": status_code,
+            "headers": {
+                header: header_value
+                for header, header_value in headers.items()
+                if header.lower() not in DROPPED_HEADERS
+            },
+            "body": body.decode("utf-8"),
+        }
+        with self._lock:
+            self._interactions[self.request_key(method, url)].append(recorded_response)
+            self._save()
+
+    def _save(self) -> None:
+        interactions = [
+            {"request": dict(zip(("method", "url"), request_key.split(" ", 1))), "response": recorded_response}
+            for request_key, responses in self._interactions.items()
+            for recorded_response in responses
+        ]
+        cassette_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(cassette_dir, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=cassette_dir)
+        with os.fdopen(file_descriptor, "w") as cassette_file:
+            json.dump({"interactions": interactions}, cassette_file, indent=2)
+        os.replace(temp_path, self.path)
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter for ``BaseFetcher`` replaying and recording through a cassette."""
+
+    def __init__(self, cassette: Cassette, **adapter_options: Any) -> None:
+        """Initialize a new instance of the CassetteAdapter class."""
+        super().__init__(**adapter_options)
+        self.cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore
+        """Replay the recorded response of a request, or send and record it."""
+        recorded_response = self.cassette.play(request.method or "GET", request.url or "")
+        if recorded_response is not None:
+            return self._build_recorded_response(request, recorded_response)
+
+        response = super().send(request, **kwargs)
+        self.cassette.record(
+            request.method or "GET",
+            request.url or "",
+            response.status_code,
+            dict(response.headers),
+            response.content,
+        )
+        return response
+
+    @staticmethod
+    def _build_recorded_response(
+        request: requests.PreparedRequest,
+        recorded_response: Dict[str, Any],
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recorded_response["status_code"]
+        response.headers = CaseInsensitiveDict(recorded_response["headers"])
+        response._content = recorded_response["body"].encode("utf-8")  # noqa: WPS437
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Transport for ``AsyncBaseFetcher`` replaying and recording through a cassette."""
+
+    def __init__(self, cassette: Cassette, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize a new instance of the AsyncCassetteTransport class."""
+        self.cassette = cassette
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Replay the recorded response of a request, or send and record it."""
+        recorded_response = self.cassette.play(request.method, str(request.url))
+        if recorded_response is not None:
+            return httpx.Response(
+                recorded_response["status_code"],
+                headers=recorded_response["headers"],
+                content=recorded_response["body"].encode("utf-8"),
+                request=request,
+            )
+
+        response = await self.transport.handle_async_request(request)
+        body = await response.aread()
+        headers = {
+            header: header_value
+            for header, header_value in response.headers.items()
+            if header.lower() not in DROPPED_HEADERS
+        }
+        self.cassette.record(request.method, str(request.url), response.status_code, headers, body)
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+def cassette_transports(
+    cassette: Cassette,
+    **adapter_options: Any,
+) -> Dict[str, Any]:
+    """Return the ``transport`` and ``async_transport`` fetcher options of a cassette."""
+
+    def async_transport(limits: httpx.Limits) -> httpx.AsyncBaseTransport:  # noqa: WPS430
+        return AsyncCassetteTransport(cassette, httpx.AsyncHTTPTransport(limits=limits))
+
+    transports: Dict[str, Any] = {
+        "transport": CassetteAdapter(cassette, **adapter_options),
+        "async_transport": async_transport,
+    }
+    return transports
+
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class BatchResult:
+    """The outcome of a single call made through ``ClientServicesManager.batch``."""
+
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the call finished without raising."""
+        return self.error is None
+
+
+def split_batch_item(batch_item: Any) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Turn a batch item into call arguments.
+
+    Tuples and lists are positional arguments, dicts are request parameters by
+    name (passed as ``params=``, the only way service methods take them by
+    name) and any other value is the single positional argument of the call.
+    """
+    if isinstance(batch_item, (tuple, list)):
+        return tuple(batch_item), {}
+    if isinstance(batch_item, dict):
+        return (), {"params": dict(batch_item)}
+    return (batch_item,), {}
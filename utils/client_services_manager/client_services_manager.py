@@ -1,14 +1,16 @@
-import ast
-import glob
+import asyncio
 import inspect
-import json
 import os
-import textwrap
 import types
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
-
-import astor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
+from ..rate_limiter import RateLimit, RateLimiter
+from .batch_result import BatchResult, split_batch_item
+from .paginator import Pagination, aiter_pages, iter_pages
+from .response_cache import ResponseCache
+from .service_manifest import ServiceManifest
+from .single_flight import SingleFlight, make_call_key
 from .stubs_generator import StubsGenerator
 
 
@@ -19,24 +21,75 @@ class ClientServicesManager(StubsGenerator):  # noqa: WPS214
     This class simplifies service interaction by dynamically generating methods
     from JSON-defined and file-defined services, in conjunction to optional DTOs.
 
+    Every JSON-defined method also gets a coroutine twin prefixed with ``a``
+    (e.g. ``verify_email`` and ``averify_email``). The twin awaits the
+    ``_default_async_service_method_handler`` when the instance defines one, and
+    otherwise runs the blocking handler in a worker thread.
+
+    Many calls of the same method can be fanned out with ``batch`` (thread pool)
+    or ``abatch`` (event loop), both bounded by ``max_concurrency``.
+
+    Service configs, DTO lookups and method files come from a ``ServiceManifest``
+    compiled once and cached on disk, so new instances and new processes don't
+    re-read or re-parse the ``methods`` directory. Method files are imported as
+    regular modules, so DTO classes are shared with the rest of the process.
+
+    With ``lazy=True`` nothing is bound at construction: a method's closure, DTO
+    lookup and handler resolution happen on first attribute access and are then
+    memoized on the instance, so construction cost no longer grows with the
+    number of services.
+
+    Responses of methods with a ``cache`` directive in methods.json are served
+    from a two-tier ``ResponseCache`` (see its docstring for the directive).
+
+    Identical concurrent calls (same method, endpoint, parameters and headers)
+    share one in-flight upstream call, unless the method sets
+    ``"single_flight": false`` in methods.json.
+
+    Methods with a ``rate_limit`` directive in methods.json wait for (or fail
+    without) a token of the ``RateLimiter`` before every upstream call; cache
+    hits and coalesced calls don't spend tokens (see ``RateLimit``).
+
+    Methods with a ``pagination`` directive also get ``iter_<method>`` and
+    ``aiter_<method>`` generators yielding the items of every page, fetched
+    lazily (see ``Pagination``), e.g. ``iter_domain_search(domain, prefetch=True)``.
+    Pages skip the response cache and single-flight, their rate limit still applies.
+
     Real time stub generation is also supported, which allows for IDE autocompletion and type checking.
+    It can be turned off with ``generate_stubs=False`` (e.g. in production) and
+    run ahead of time with the ``generate_client_stubs`` management command.
 
     It boosts scalability and coding efficiency.
 
     Attributes:
         methods_file_path (str): The path to the JSON file containing service
             definitions.
+        manifest (ServiceManifest): The compiled service definitions.
     """
 
-    def __init__(self, methods_file_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        methods_file_path: Optional[str] = None,
+        manifest_cache_dir: Optional[str] = None,
+        generate_stubs: bool = True,
+        lazy: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         """Initialize a new instance of the ClientServicesManager class."""
+        self.response_cache = response_cache or ResponseCache()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.single_flight = SingleFlight()
+        methods_dir = self._get_methods_dir()
         # Determine the methods.json path based on the class of the instance if not provided
         if methods_file_path is None:
-            methods_file_path = os.path.join(
-                os.path.dirname(inspect.getfile(self.__class__)),
-                "methods",
-                "methods.json",
-            )
+            methods_file_path = os.path.join(methods_dir, "methods.json")
+        self.manifest = ServiceManifest.load(
+            methods_dir,
+            methods_file_path,
+            manifest_cache_dir,
+            self._get_methods_package(methods_dir),
+        )
 
         super().__init__(methods_file_path, self._find_dto_class)
 
@@ -45,58 +98,414 @@ class ClientServicesManager(StubsGenerator):  # noqa: WPS214
                 "The instance must have a '_default_service_method_handler' method",
             )
         self.default_handler = self._default_service_method_handler
+        self.default_async_handler: Optional[Callable] = getattr(
+            self,
+            "_default_async_service_method_handler",
+            None,
+        )
         self.services = self._load_service_config()
-        self._create_service_methods()
-        self._load_and_bind_methods_from_files()
-        self._generate_stubs()
+        if lazy:
+            self._create_class_handled_service_methods()
+            self._lazy_methods = True
+        else:
+            self._create_service_methods()
+            self._load_and_bind_methods_from_files()
+        if generate_stubs:
+            self._generate_stubs()
 
-    def _load_and_bind_methods_from_files(self) -> None:
-        methods_dir = os.path.join(
+    def __getattr__(self, name: str) -> Any:
+        """Bind a service method or method file object on first access in lazy mode."""
+        # Only reached when regular lookup fails; the flag is set once construction is done
+        if not self.__dict__.get("_lazy_methods"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        resolved_names = {name}
+        service_name = self._find_service_name(name)
+        if service_name is not None:
+            self._bind_service_methods(service_name)
+            resolved_names.add(service_name)
+
+        # Method files override the JSON-defined methods of the same name
+        for resolved_name in resolved_names:
+            module_name = self.manifest.defined_names.get(resolved_name)
+            if module_name is not None:
+                self._bind_namespace_object(
+                    resolved_name,
+                    self.manifest.namespace(module_name)[resolved_name],
+                )
+
+        if name not in self.__dict__:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        return self.__dict__[name]
+
+    def __dir__(self) -> Iterable[str]:
+        """List the lazily bound names as well."""
+        lazy_names = {*self.manifest.defined_names, *self.services}
+        for method_name, service_info in self.services.items():
+            lazy_names.add(f"a{method_name}")
+            if service_info.get("pagination"):
+                lazy_names.update((f"iter_{method_name}", f"aiter_{method_name}"))
+        return sorted({*super().__dir__(), *lazy_names})
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the response cache hit and miss counters of every cached method."""
+        return self.response_cache.stats()
+
+    def batch(
+        self,
+        method_name: str,
+        arg_list: Iterable[Any],
+        max_concurrency: int = 10,
+    ) -> List[BatchResult]:
+        """
+        Call a service method once per item of ``arg_list`` over a bounded thread pool.
+
+        Args:
+            method_name (str): Name of the service method, e.g. ``verify_email``.
+            arg_list (Iterable[Any]): One item per call, see ``split_batch_item``.
+            max_concurrency (int): Maximum number of calls in flight at once.
+
+        Returns:
+            List[BatchResult]: One result per item, in input order. Errors raised
+                by a call are stored on its result instead of being propagated.
+        """
+        service_method = getattr(self, method_name)
+        batch_results = [BatchResult(*split_batch_item(batch_item)) for batch_item in arg_list]
+        if not batch_results:
+            return batch_results
+
+        def run(batch_result: BatchResult) -> None:  # noqa: WPS430
+            try:
+                batch_result.result = service_method(*batch_result.args, **batch_result.kwargs)
+            except Exception as err:
+                batch_result.error = err
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batch_results))) as executor:
+            list(executor.map(run, batch_results))
+        return batch_results
+
+    async def abatch(
+        self,
+        method_name: str,
+        arg_list: Iterable[Any],
+        max_concurrency: int = 10,
+    ) -> List[BatchResult]:
+        """
+        Await a service method once per item of ``arg_list`` on the running event loop.
+
+        The coroutine twin of ``method_name`` is used when available, otherwise the
+        blocking method runs in worker threads. See ``batch`` for the arguments.
+        """
+        service_method = getattr(self, f"a{method_name}", None)
+        if not asyncio.iscoroutinefunction(service_method):
+            blocking_method = getattr(self, method_name)
+
+            async def service_method(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430,WPS440
+                return await asyncio.to_thread(blocking_method, *args, **kwargs)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        batch_results = [BatchResult(*split_batch_item(batch_item)) for batch_item in arg_list]
+
+        async def run(batch_result: BatchResult) -> None:  # noqa: WPS430
+            async with semaphore:
+                try:
+                    batch_result.result = await service_method(*batch_result.args, **batch_result.kwargs)
+                except Exception as err:
+                    batch_result.error = err
+
+        await asyncio.gather(*(run(batch_result) for batch_result in batch_results))
+        return batch_results
+
+    def _get_methods_dir(self) -> str:
+        return os.path.join(
             os.path.dirname(inspect.getfile(self.__class__)),
             "methods",
         )
-        for file_path in glob.glob(os.path.join(methods_dir, "*.py")):
-            with open(file_path, "r") as method_file:
-                file_contents = method_file.read()
 
-            # Execute the entire file's source code in the local namespace
-            local_namespace: Any = {}
-            exec(file_contents, local_namespace)
+    def _get_methods_package(self, methods_dir: str) -> Optional[str]:
+        parent_package = self.__class__.__module__.rpartition(".")[0]
+        if parent_package and os.path.isfile(os.path.join(methods_dir, "__init__.py")):
+            return f"{parent_package}.methods"
+        return None
+
+    def _load_and_bind_methods_from_files(self) -> None:
+        for module_name in self.manifest.module_names:
+            # The file is imported once per process and its module reused
+            local_namespace = self.manifest.namespace(module_name)
 
             # Bind each object defined in the file as a method or store classes/variables
             for name, namespace_obj in local_namespace.items():
-                if callable(namespace_obj):
-                    # Bind functions as methods
-                    bound_method = types.MethodType(namespace_obj, self)
-                    setattr(self, name, bound_method)
-                else:
-                    # Store variables as attributes of the object
-                    setattr(self, name, namespace_obj)
+                self._bind_namespace_object(name, namespace_obj)
+
+    def _bind_namespace_object(self, name: str, namespace_obj: Any) -> None:
+        if inspect.isfunction(namespace_obj):
+            # Bind functions as methods
+            bound_method = types.MethodType(namespace_obj, self)
+            setattr(self, name, bound_method)
+        else:
+            # Store variables as attributes of the object
+            setattr(self, name, namespace_obj)
 
     def _load_service_config(self) -> Dict[str, Any]:
-        with open(self.methods_file_path, "r") as method_file:
-            return json.load(method_file)
+        return self.manifest.services
+
+    def _read_methods(self) -> Dict[str, Any]:
+        return self.manifest.services
 
     def _create_service_methods(self) -> None:
-        for method_name, service_info in self.services.items():
-            endpoint = service_info["endpoint"]
-            param_names: List[str] = service_info.get("params", [])
-            headers = service_info.get("headers", {})
-            method_handler = getattr(self, method_name, self.default_handler)
-
-            if method_handler is None:
-                raise AttributeError(
-                    f"Method handler for '{method_name}' is not defined",
-                )
+        for method_name in self.services:
+            self._bind_service_methods(method_name)
+
+    def _create_class_handled_service_methods(self) -> None:
+        # Regular lookup finds class attributes before __getattr__ is ever called,
+        # so services handled by a class method must be wrapped right away
+        for method_name in self.services:
+            if hasattr(self.__class__, method_name) or hasattr(self.__class__, f"a{method_name}"):
+                self._bind_service_methods(method_name)
+
+    def _find_service_name(self, name: str) -> Optional[str]:
+        if name in self.services:
+            return name
+        for prefix in ("a", "iter_", "aiter_"):
+            if name.startswith(prefix) and name[len(prefix):] in self.services:
+                return name[len(prefix):]
+        return None
+
+    def _get_class_handler(self, name: str) -> Optional[Callable]:
+        # Handlers are looked up on the class, the instance only holds generated methods
+        return getattr(self, name) if hasattr(self.__class__, name) else None
+
+    def _bind_service_methods(self, method_name: str) -> None:
+        service_info = self.services[method_name]
+        endpoint = service_info["endpoint"]
+        param_names: List[str] = service_info.get("params", [])
+        headers = service_info.get("headers", {})
+        method_handler = self._get_class_handler(method_name) or self.default_handler
 
-            bound_method = self._create_service_method(
+        if method_handler is None:
+            raise AttributeError(
+                f"Method handler for '{method_name}' is not defined",
+            )
+
+        async_method_name = f"a{method_name}"
+        async_method_handler = (
+            self._get_class_handler(async_method_name) or self._to_async_handler(method_handler)
+        )
+        rate_limit_config = service_info.get("rate_limit")
+        if rate_limit_config:
+            rate_limit = RateLimit.from_config(rate_limit_config)
+            method_handler = self._with_rate_limit(rate_limit, method_handler)
+            async_method_handler = self._with_async_rate_limit(rate_limit, async_method_handler)
+        # Pages are rate limited but not cached: a crawl would flush the cache of single calls
+        page_handlers = (method_handler, async_method_handler)
+        cache_config = service_info.get("cache")
+        if cache_config:
+            method_handler = self._with_response_cache(method_name, method_handler, cache_config)
+            async_method_handler = self._with_async_response_cache(
                 method_name,
-                endpoint,
-                method_handler,
+                async_method_handler,
+                cache_config,
+            )
+        if service_info.get("single_flight", True):
+            method_handler = self._with_single_flight(method_name, method_handler)
+            async_method_handler = self._with_async_single_flight(method_name, async_method_handler)
+
+        bound_method = self._create_service_method(
+            method_name,
+            endpoint,
+            method_handler,
+            param_names,
+            headers,
+        ).__get__(self, self.__class__)
+        setattr(self, method_name, bound_method)
+
+        bound_async_method = self._create_async_service_method(
+            method_name,
+            endpoint,
+            async_method_handler,
+            param_names,
+            headers,
+        ).__get__(self, self.__class__)
+        setattr(self, async_method_name, bound_async_method)
+
+        pagination_config = service_info.get("pagination")
+        if pagination_config:
+            self._bind_iter_service_methods(
+                method_name,
+                Pagination.from_config(pagination_config),
+                page_handlers,
+                param_names,
+                headers,
+            )
+
+    def _bind_iter_service_methods(  # noqa: WPS211
+        self,
+        method_name: str,
+        pagination: Pagination,
+        method_handlers: Tuple[Callable, Callable],
+        param_names: List[str],
+        headers: Dict[str, str],
+    ) -> None:
+        endpoint = self.services[method_name]["endpoint"]
+        method_handler, async_method_handler = method_handlers
+
+        def iter_service_method(  # noqa: WPS430
+            _: Any,
+            *args: Optional[Any],
+            prefetch: bool = False,
+            **kwargs: Optional[Dict[str, Any]],
+        ) -> Iterator[Any]:
+            req_params, custom_headers = self._prepare_request_params_and_headers(
+                args,
+                kwargs,
+                param_names,
+                headers,
+            )
+            return iter_pages(
+                pagination,
+                lambda offset: method_handler(
+                    endpoint,
+                    {**req_params, **pagination.page_params(offset)},
+                    custom_headers,
+                ),
+                prefetch,
+            )
+
+        def aiter_service_method(  # noqa: WPS430
+            _: Any,
+            *args: Optional[Any],
+            prefetch: bool = False,
+            **kwargs: Optional[Dict[str, Any]],
+        ) -> AsyncIterator[Any]:
+            req_params, custom_headers = self._prepare_request_params_and_headers(
+                args,
+                kwargs,
                 param_names,
                 headers,
-            ).__get__(self, self.__class__)
-            setattr(self, method_name, bound_method)
+            )
+            return aiter_pages(
+                pagination,
+                lambda offset: async_method_handler(
+                    endpoint,
+                    {**req_params, **pagination.page_params(offset)},
+                    custom_headers,
+                ),
+                prefetch,
+            )
+
+        setattr(self, f"iter_{method_name}", iter_service_method.__get__(self, self.__class__))
+        setattr(self, f"aiter_{method_name}", aiter_service_method.__get__(self, self.__class__))
+
+    def _with_single_flight(self, method_name: str, method_handler: Callable) -> Callable:
+        def coalesced_method_handler(  # noqa: WPS430
+            endpoint: str,
+            req_params: Dict[str, Any],
+            req_headers: Dict[str, Any],
+        ) -> Any:
+            return self.single_flight.do(
+                make_call_key(method_name, endpoint, req_params, req_headers),
+                lambda: method_handler(endpoint, req_params, req_headers),
+            )
+
+        return coalesced_method_handler
+
+    def _with_async_single_flight(self, method_name: str, method_handler: Callable) -> Callable:
+        async def coalesced_method_handler(  # noqa: WPS430
+            endpoint: str,
+            req_params: Dict[str, Any],
+            req_headers: Dict[str, Any],
+        ) -> Any:
+            return await self.single_flight.ado(
+                make_call_key(method_name, endpoint, req_params, req_headers),
+                lambda: method_handler(endpoint, req_params, req_headers),
+            )
+
+        return coalesced_method_handler
+
+    def _with_rate_limit(self, rate_limit: RateLimit, method_handler: Callable) -> Callable:
+        def rate_limited_method_handler(  # noqa: WPS430
+            endpoint: str,
+            req_params: Dict[str, Any],
+            req_headers: Dict[str, Any],
+        ) -> Any:
+            self.rate_limiter.acquire(rate_limit)
+            return method_handler(endpoint, req_params, req_headers)
+
+        return rate_limited_method_handler
+
+    def _with_async_rate_limit(self, rate_limit: RateLimit, method_handler: Callable) -> Callable:
+        async def rate_limited_method_handler(  # noqa: WPS430
+            endpoint: str,
+            req_params: Dict[str, Any],
+            req_headers: Dict[str, Any],
+        ) -> Any:
+            await self.rate_limiter.aacquire(rate_limit)
+            return await method_handler(endpoint, req_params, req_headers)
+
+        return rate_limited_method_handler
+
+    def _with_response_cache(
+        self,
+        method_name: str,
+        method_handler: Callable,
+        cache_config: Dict[str, Any],
+    ) -> Callable:
+        def cached_method_handler(  # noqa: WPS430
+            endpoint: str,
+            req_params: Dict[str, Any],
+            req_headers: Dict[str, Any],
+        ) -> Any:
+            cache_key = self.response_cache.make_key(
+                self.__class__.__name__,
+                method_name,
+                endpoint,
+                req_params,
+                cache_config.get("key_params"),
+            )
+            return self.response_cache.get_or_call(
+                method_name,
+                cache_key,
+                lambda: method_handler(endpoint, req_params, req_headers),
+                cache_config,
+            )
+
+        return cached_method_handler
+
+    def _with_async_response_cache(
+        self,
+        method_name: str,
+        method_handler: Callable,
+        cache_config: Dict[str, Any],
+    ) -> Callable:
+        async def cached_method_handler(  # noqa: WPS430
+            endpoint: str,
+            req_params: Dict[str, Any],
+            req_headers: Dict[str, Any],
+        ) -> Any:
+            cache_key = self.response_cache.make_key(
+                self.__class__.__name__,
+                method_name,
+                endpoint,
+                req_params,
+                cache_config.get("key_params"),
+            )
+            return await self.response_cache.aget_or_call(
+                method_name,
+                cache_key,
+                lambda: method_handler(endpoint, req_params, req_headers),
+                cache_config,
+            )
+
+        return cached_method_handler
+
+    def _to_async_handler(self, method_handler: Callable) -> Callable:
+        if method_handler == self.default_handler and self.default_async_handler:
+            return self.default_async_handler
+
+        async def async_method_handler(*args: Any) -> Any:  # noqa: WPS430
+            return await asyncio.to_thread(method_handler, *args)
+
+        return async_method_handler
 
     def _create_service_method(  # noqa: WPS211
         self,
@@ -124,6 +533,32 @@ class ClientServicesManager(StubsGenerator):  # noqa: WPS214
 
         return created_service_method
 
+    def _create_async_service_method(  # noqa: WPS211
+        self,
+        method_name: str,
+        endpoint: str,
+        method_handler: Callable,
+        param_names: Optional[List[str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Callable:
+        dto_class = self._find_dto_class(method_name)
+
+        async def created_async_service_method(  # noqa: WPS430
+            _: Any,
+            *args: Optional[Any],
+            **kwargs: Optional[Dict[str, Any]],
+        ) -> Any:
+            req_params, custom_headers = self._prepare_request_params_and_headers(
+                args,
+                kwargs,
+                param_names,
+                headers,
+            )
+            response = await method_handler(endpoint, req_params, custom_headers)
+            return self._process_response_with_dto_class(response, dto_class)
+
+        return created_async_service_method
+
     def _prepare_request_params_and_headers(
         self,
         args: Optional[Any],
@@ -150,35 +585,4 @@ class ClientServicesManager(StubsGenerator):  # noqa: WPS214
         return response
 
     def _find_dto_class(self, method_name: str) -> Optional[type]:
-        # Construct the file path for the method
-        methods_dir = os.path.join(
-            os.path.dirname(inspect.getfile(self.__class__)),
-            "methods",
-        )
-        file_path = os.path.join(methods_dir, f"{method_name}.py")
-
-        try:
-            with open(file_path, "r") as dto_file:
-                file_contents = dto_file.read()
-        except FileNotFoundError:
-            # If the file does not exist, no DTO class is found
-            return None
-
-        # Preparing a custom namespace
-        custom_namespace: Any = {}
-
-        # Parse the file and find the DTO class
-        parsed_ast = ast.parse(file_contents)
-        for node in parsed_ast.body:
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                # Execute import statements to populate the namespace
-                exec(astor.to_source(node), custom_namespace)
-            elif isinstance(node, ast.ClassDef) and "dto" in node.name.lower():
-                class_source = textwrap.dedent(astor.to_source(node))
-                class_name = node.name
-
-                # Execute the class definition in the custom namespace
-                exec(class_source, custom_namespace)
-                return custom_namespace.get(class_name)
-
-        return None
+        return self.manifest.dto_class(method_name)
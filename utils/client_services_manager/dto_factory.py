@@ -0,0 +1,122 @@
+import keyword
+from typing import Any, Dict, List, Tuple
+
+# Schema type name -> (accepted runtime types, expression building the stored value)
+FIELD_TYPES: Dict[str, Tuple[str, str]] = {
+    "str": ("str", "{value}"),
+    "int": ("int", "{value}"),
+    "float": ("(int, float)", "float({value})"),
+    "bool": ("bool", "{value}"),
+    "dict": ("dict", "{value}"),
+    "list": ("list", "{value}"),
+    "any": ("object", "{value}"),
+}
+
+EXTRA_FIELDS_ATTRIBUTE = "extra"
+RESERVED_NAMES = frozenset(("self", "extra_fields", "to_dict"))
+
+
+def build_dto_class(class_name: str, schema: Dict[str, Any]) -> type:
+    """
+    Build a ``__slots__`` based DTO class from a response schema.
+
+    The schema maps field names to type names (see ``FIELD_TYPES``), a trailing
+    ``?`` marks a field as optional (``None`` allowed, defaults to ``None``):
+
+        {"fields": {"status": "str", "score": "float", "result": "str?"}, "extra": "drop"}
+
+    Fields that are not declared are dropped, or kept in a single ``extra``
+    mapping when ``"extra": "keep"``. The ``__init__`` with its validation is
+    generated and compiled once per class, so building an instance costs one
+    call with no per-field loop or per-instance ``__dict__``.
+    """
+    fields = _parse_fields(schema["fields"])
+    keep_extra = schema.get("extra", "drop") == "keep"
+    if keep_extra and EXTRA_FIELDS_ATTRIBUTE in schema["fields"]:
+        raise ValueError(f"'{EXTRA_FIELDS_ATTRIBUTE}' is reserved for the undeclared fields")
+    slots = tuple(field_name for field_name, _, _ in fields)
+    if keep_extra:
+        slots += (EXTRA_FIELDS_ATTRIBUTE,)
+
+    class_namespace: Dict[str, Any] = {
+        "__slots__": slots,
+        "__schema__": schema,
+        "__init__": _compile_init(class_name, fields, keep_extra),
+        "__repr__": _dto_repr,
+        "__eq__": _dto_eq,
+        "__hash__": None,
+        "to_dict": _dto_to_dict,
+    }
+    return type(class_name, (), class_namespace)
+
+
+def _parse_fields(schema_fields: Dict[str, str]) -> List[Tuple[str, str, bool]]:
+    fields = []
+    for field_name, type_name in schema_fields.items():
+        if not field_name.isidentifier() or keyword.iskeyword(field_name) or field_name in RESERVED_NAMES:
+            raise ValueError(f"Invalid DTO field name '{field_name}'")
+        optional = type_name.endswith("?")
+        type_name = type_name.rstrip("?")
+        if type_name not in FIELD_TYPES:
+            raise ValueError(f"Unsupported type '{type_name}' for DTO field '{field_name}'")
+        fields.append((field_name, type_name, optional))
+    # Required fields come first so they can be positional parameters
+    return sorted(fields, key=lambda dto_field: dto_field[2])
+
+
+def _compile_init(class_name: str, fields: List[Tuple[str, str, bool]], keep_extra: bool) -> Any:
+    parameters = [
+        f"{field_name}=None" if optional else field_name
+        for field_name, _, optional in fields
+    ]
+    parameters.append("**extra_fields")
+
+    body = []
+    for field_name, type_name, optional in fields:
+        accepted_types, stored_value = FIELD_TYPES[type_name]
+        if type_name == "any":
+            body.append(f"    self.{field_name} = {field_name}")
+            continue
+        check = f"not isinstance({field_name}, {accepted_types})"
+        if type_name in {"int", "float"}:
+            # bool is a subclass of int, but True is not a valid score
+            check = f"({check} or isinstance({field_name}, bool))"
+        if optional:
+            check = f"{field_name} is not None and {check}"
+        body.append(f"    if {check}:")
+        body.append(f"        raise ValueError('{field_name.capitalize()} must be a {type_name}')")
+        value = stored_value.format(value=field_name)
+        if optional and value != field_name:
+            value = f"None if {field_name} is None else {value}"
+        body.append(f"    self.{field_name} = {value}")
+    if keep_extra:
+        body.append(f"    self.{EXTRA_FIELDS_ATTRIBUTE} = extra_fields")
+    if not body:
+        body.append("    pass")
+
+    init_source = "def __init__(self, {0}):\n{1}\n".format(", ".join(parameters), "\n".join(body))
+    init_namespace: Dict[str, Any] = {}
+    exec(compile(init_source, f"<{class_name} __init__>", "exec"), init_namespace)  # noqa: S102
+    dto_init = init_namespace["__init__"]
+    dto_init.__qualname__ = f"{class_name}.__init__"
+    return dto_init
+
+
+def _dto_to_dict(self: Any) -> Dict[str, Any]:
+    """Return the DTO fields as a dictionary."""
+    return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+def _dto_repr(self: Any) -> str:
+    field_values = ", ".join(
+        f"{slot}={getattr(self, slot)!r}"
+        for slot in self.__slots__
+        if slot != EXTRA_FIELDS_ATTRIBUTE
+    )
+    return f"{self.__class__.__name__}({field_values})"
+
+
+def _dto_eq(self: Any, other: Any) -> bool:
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    return _dto_to_dict(self) == _dto_to_dict(other)
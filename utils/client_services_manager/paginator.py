@@ -0,0 +1,101 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """
+    Offset/limit pagination of a list endpoint, declared in methods.json.
+
+        "pagination": {"items": "emails", "offset_param": "offset", "limit_param": "limit", "page_size": 100}
+
+    ``items`` is the key of the page items in the response. Pages are requested
+    ``page_size`` items at a time until a page comes back short or ``max_items``
+    (unbounded by default) items were returned.
+    """
+
+    items: str
+    offset_param: str = "offset"
+    limit_param: str = "limit"
+    page_size: int = 100
+    max_items: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, pagination_config: Dict[str, Any]) -> "Pagination":
+        """Build a pagination from its methods.json declaration."""
+        return cls(**pagination_config)
+
+    def page_params(self, offset: int) -> Dict[str, int]:
+        """Return the request parameters selecting the page starting at ``offset``."""
+        return {self.offset_param: offset, self.limit_param: self.page_limit(offset)}
+
+    def page_limit(self, offset: int) -> int:
+        """Return how many items to request from ``offset``."""
+        if self.max_items is None:
+            return self.page_size
+        return min(self.page_size, self.max_items - offset)
+
+    def page_items(self, response: Any) -> List[Any]:
+        """Return the items of a page response."""
+        return (response or {}).get(self.items) or []
+
+    def next_offset(self, page_items: List[Any], offset: int) -> Optional[int]:
+        """Return the offset of the page following the one at ``offset``, or None after the last page."""
+        next_offset = offset + self.page_limit(offset)
+        if len(page_items) < self.page_limit(offset) or self.page_limit(next_offset) <= 0:
+            return None
+        return next_offset
+
+
+def iter_pages(
+    pagination: Pagination,
+    fetch_page: Callable[[int], Any],
+    prefetch: bool = False,
+) -> Iterator[Any]:
+    """
+    Yield the items of every page, fetching each page only when it is reached.
+
+    Only the current page is held in memory; with ``prefetch`` the next page is
+    fetched in a background thread while the current one is being consumed.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        offset: Optional[int] = 0
+        page = fetch_page(0)
+        while offset is not None:
+            page_items = pagination.page_items(page)
+            offset = pagination.next_offset(page_items, offset)
+            next_page = executor.submit(fetch_page, offset) if executor and offset is not None else None
+            yield from page_items
+            if offset is not None:
+                page = next_page.result() if next_page else fetch_page(offset)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    pagination: Pagination,
+    fetch_page: Callable[[int], Awaitable[Any]],
+    prefetch: bool = False,
+) -> AsyncIterator[Any]:
+    """Yield the items of every page from an async fetcher, see ``iter_pages``."""
+    next_page: Optional[asyncio.Task] = None
+    try:
+        offset: Optional[int] = 0
+        page = await fetch_page(0)
+        while offset is not None:
+            page_items = pagination.page_items(page)
+            offset = pagination.next_offset(page_items, offset)
+            if prefetch and offset is not None:
+                next_page = asyncio.ensure_future(fetch_page(offset))
+            for page_item in page_items:
+                yield page_item
+            if offset is not None:
+                page = await (next_page or fetch_page(offset))
+                next_page = None
+    finally:
+        if next_page is not None:
+            next_page.cancel()
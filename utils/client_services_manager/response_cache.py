@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+NEGATIVE_MARKER = "__negative_response__"
+
+# Client errors that say nothing about the requested resource are never cached
+UNCACHEABLE_STATUS_CODES = frozenset((401, 403, 407, 408, 429))
+
+
+class CachedErrorResponse(Exception):
+    """Raised when a negatively cached call is served from the cache."""
+
+    def __init__(self, message: str, status_code: Optional[int]) -> None:
+        """Initialize a new instance of the CachedErrorResponse class."""
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class DjangoCacheBackend:
+    """Shared cache tier backed by one of Django's configured caches."""
+
+    def __init__(self, alias: str = "default") -> None:
+        """Initialize a new instance of the DjangoCacheBackend class."""
+        from django.core.cache import caches  # noqa: WPS433
+
+        self.cache = caches[alias]
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or None."""
+        return self.cache.get(key)
+
+    def set(self, key: str, cache_value: Any, ttl: float) -> None:  # noqa: WPS125
+        """Store a value for ``ttl`` seconds."""
+        self.cache.set(key, cache_value, ttl)
+
+    async def aget(self, key: str) -> Any:
+        """Return the cached value or None without blocking the event loop."""
+        return await self.cache.aget(key)
+
+    async def aset(self, key: str, cache_value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds without blocking the event loop."""
+        await self.cache.aset(key, cache_value, ttl)
+
+
+class ResponseCache:  # noqa: WPS214
+    """
+    Two-tier cache for service method responses.
+
+    An in-process LRU, bounded to ``max_entries``, sits in front of an optional
+    shared backend (e.g. ``DjangoCacheBackend``) so that hot keys never leave the
+    process while other workers still benefit from each other's calls.
+
+    Methods opt in through a ``cache`` directive in methods.json:
+
+        "cache": {"ttl": 21600, "key_params": ["domain"], "negative": true, "negative_ttl": 600}
+
+    ``key_params`` defaults to every request parameter. With ``negative`` set,
+    empty responses and client errors about the resource (e.g. 404) are cached
+    too, for ``negative_ttl`` seconds (``ttl`` by default).
+    """
+
+    def __init__(self, max_entries: int = 1024, shared_backend: Optional[Any] = None) -> None:
+        """Initialize a new instance of the ResponseCache class."""
+        self.max_entries = max_entries
+        self.shared_backend = shared_backend
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"local_hits": 0, "shared_hits": 0, "misses": 0},
+        )
+
+    def make_key(  # noqa: WPS211
+        self,
+        namespace: str,
+        method_name: str,
+        endpoint: str,
+        req_params: Dict[str, Any],
+        key_params: Optional[List[str]] = None,
+    ) -> str:
+        """Build a backend-safe cache key from the call parameters."""
+        if key_params is not None:
+            req_params = {param: req_params.get(param) for param in key_params}
+        params_hash = hashlib.sha256(
+            json.dumps(req_params, sort_keys=True, default=str).encode(),
+        ).hexdigest()
+        return f"{namespace}:{method_name}:{endpoint}:{params_hash}"
+
+    def get_or_call(
+        self,
+        method_name: str,
+        key: str,
+        call: Callable[[], Any],
+        cache_config: Dict[str, Any],
+    ) -> Any:
+        """Return the cached response of a call, calling it on a miss."""
+        hit, cached_value = self._get_local(method_name, key)
+        if not hit and self.shared_backend is not None:
+            hit, cached_value = self._from_shared(method_name, key, self.shared_backend.get(key))
+        if hit:
+            return self._unwrap(cached_value)
+
+        self._count(method_name, "misses")
+        try:
+            response = call()
+        except Exception as err:
+            negative_entry = self._negative_entry(err, cache_config)
+            if negative_entry is not None:
+                self._set(key, *negative_entry)
+            raise
+        response_entry = self._response_entry(response, cache_config)
+        if response_entry is not None:
+            self._set(key, *response_entry)
+        return response
+
+    async def aget_or_call(
+        self,
+        method_name: str,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        cache_config: Dict[str, Any],
+    ) -> Any:
+        """Return the cached response of a coroutine call, awaiting it on a miss."""
+        hit, cached_value = self._get_local(method_name, key)
+        if not hit and self.shared_backend is not None:
+            hit, cached_value = self._from_shared(method_name, key, await self._shared_aget(key))
+        if hit:
+            return self._unwrap(cached_value)
+
+        self._count(method_name, "misses")
+        try:
+            response = await call()
+        except Exception as err:
+            negative_entry = self._negative_entry(err, cache_config)
+            if negative_entry is not None:
+                await self._aset(key, *negative_entry)
+            raise
+        response_entry = self._response_entry(response, cache_config)
+        if response_entry is not None:
+            await self._aset(key, *response_entry)
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the hit and miss counters of every cached method."""
+        with self._lock:
+            return {method_name: dict(counters) for method_name, counters in self._stats.items()}
+
+    def clear(self) -> None:
+        """Drop the in-process entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def _get_local(self, method_name: str, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, cached_value = entry
+            if expires_at <= time.time():
+                del self._entries[key]  # noqa: WPS420
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats[method_name]["local_hits"] += 1
+            return True, cached_value
+
+    def _from_shared(self, method_name: str, key: str, shared_entry: Any) -> Tuple[bool, Any]:
+        if shared_entry is None:
+            return False, None
+        expires_at, cached_value = shared_entry
+        self._set_local(key, cached_value, expires_at)
+        self._count(method_name, "shared_hits")
+        return True, cached_value
+
+    def _set(self, key: str, cache_value: Any, ttl: float) -> None:
+        expires_at = time.time() + ttl
+        self._set_local(key, cache_value, expires_at)
+        if self.shared_backend is not None:
+            self.shared_backend.set(key, (expires_at, cache_value), ttl)
+
+    async def _aset(self, key: str, cache_value: Any, ttl: float) -> None:
+        expires_at = time.time() + ttl
+        self._set_local(key, cache_value, expires_at)
+        if self.shared_backend is None:
+            return
+        if hasattr(self.shared_backend, "aset"):
+            await self.shared_backend.aset(key, (expires_at, cache_value), ttl)
+        else:
+            await asyncio.to_thread(self.shared_backend.set, key, (expires_at, cache_value), ttl)
+
+    async def _shared_aget(self, key: str) -> Any:
+        if hasattr(self.shared_backend, "aget"):
+            return await self.shared_backend.aget(key)  # type: ignore
+        return await asyncio.to_thread(self.shared_backend.get, key)  # type: ignore
+
+    def _set_local(self, key: str, cache_value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, cache_value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _response_entry(self, response: Any, cache_config: Dict[str, Any]) -> Optional[Tuple[Any, float]]:
+        if response in (None, {}, []):
+            return (response, self._negative_ttl(cache_config)) if cache_config.get("negative") else None
+        return response, cache_config["ttl"]
+
+    def _negative_entry(self, err: Exception, cache_config: Dict[str, Any]) -> Optional[Tuple[Any, float]]:
+        status_code = getattr(getattr(err, "response", None), "status_code", None)
+        if not cache_config.get("negative") or status_code is None:
+            return None
+        if not 400 <= status_code < 500 or status_code in UNCACHEABLE_STATUS_CODES:
+            return None
+        return {NEGATIVE_MARKER: status_code, "message": str(err)}, self._negative_ttl(cache_config)
+
+    def _negative_ttl(self, cache_config: Dict[str, Any]) -> float:
+        return cache_config.get("negative_ttl", cache_config["ttl"])
+
+    def _unwrap(self, cached_value: Any) -> Any:
+        if isinstance(cached_value, dict) and NEGATIVE_MARKER in cached_value:
+            raise CachedErrorResponse(cached_value["message"], cached_value[NEGATIVE_MARKER])
+        return cached_value
+
+    def _count(self, method_name: str, counter: str) -> None:
+        with self._lock:
+            self._stats[method_name][counter] += 1
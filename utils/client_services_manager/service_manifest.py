@@ -0,0 +1,283 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
+import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import types
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dto_factory import build_dto_class
+
+MANIFEST_VERSION = 3
+
+# (path, mtime_ns, size, sha256) of every source the manifest was built from
+SourceFingerprint = Tuple[str, int, int, str]
+
+
+class ServiceManifest:  # noqa: WPS214
+    """
+    Compiled view of the service definitions of a client.
+
+    Built once from ``methods.json`` and the ``methods/*.py`` files: it holds the
+    parsed service configs and the DTO class name and top-level names of every
+    method file. The manifest is marshalled to disk, keyed by the mtimes, sizes
+    and hashes of its sources, so later processes (gunicorn workers, test runs)
+    skip reading and parsing them again.
+
+    Method files are loaded through ``importlib``: they are imported once per
+    process, their bytecode is cached in ``__pycache__`` and the objects they
+    define are the same ones any other module imports.
+    """
+
+    _loaded: Dict[Tuple[str, str, Optional[str]], "ServiceManifest"] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        fingerprint: List[SourceFingerprint],
+        services: Dict[str, Any],
+        dto_classes: Dict[str, str],
+        module_names: Dict[str, List[str]],
+        module_files: Dict[str, str],
+        package: Optional[str] = None,
+    ) -> None:
+        """Initialize a new instance of the ServiceManifest class."""
+        self.fingerprint = fingerprint
+        self.services = services
+        self.dto_classes = dto_classes
+        self.module_names = module_names
+        self.module_files = module_files
+        self.package = package
+        self._schema_dto_classes: Dict[str, type] = {}
+        # Later files win, as they do when the namespaces are bound in order
+        self.defined_names = {
+            name: module_name
+            for module_name, names in module_names.items()
+            for name in names
+        }
+        self.is_dirty = True
+
+    @classmethod
+    def load(
+        cls,
+        methods_dir: str,
+        methods_file_path: str,
+        cache_dir: Optional[str] = None,
+        package: Optional[str] = None,
+    ) -> "ServiceManifest":
+        """
+        Return the manifest of a methods directory, building it only if its sources changed.
+
+        Args:
+            methods_dir (str): Directory holding the method files.
+            methods_file_path (str): Path of the JSON file with the service definitions.
+            cache_dir (Optional[str]): Where the compiled manifest is stored,
+                ``methods_dir/__pycache__`` by default.
+            package (Optional[str]): Dotted name of the methods package, the
+                method files are loaded straight from their paths without it.
+        """
+        cache_key = (methods_dir, methods_file_path, package)
+        source_paths = cls._source_paths(methods_dir, methods_file_path)
+        with cls._lock:
+            manifest = cls._loaded.get(cache_key)
+            if manifest is None or not manifest.is_fresh(source_paths):
+                manifest_path = cls._manifest_path(methods_dir, methods_file_path, cache_dir)
+                manifest = cls._read(manifest_path, source_paths)
+                if manifest is None:
+                    manifest = cls.build(methods_file_path, source_paths)
+                manifest.package = package
+                if manifest.is_dirty:
+                    manifest.write(manifest_path)
+                cls._loaded[cache_key] = manifest
+        return manifest
+
+    @classmethod
+    def build(cls, methods_file_path: str, source_paths: List[str]) -> "ServiceManifest":
+        """Build a manifest by reading and parsing every source."""
+        fingerprint: List[SourceFingerprint] = []
+        services: Dict[str, Any] = {}
+        dto_classes: Dict[str, str] = {}
+        module_names: Dict[str, List[str]] = {}
+        module_files: Dict[str, str] = {}
+        for source_path in source_paths:
+            with open(source_path, "rb") as source_file:
+                source = source_file.read()
+            fingerprint.append(cls._fingerprint(source_path, source))
+            if source_path == methods_file_path:
+                services = json.loads(source)
+                continue
+
+            module_name = os.path.splitext(os.path.basename(source_path))[0]
+            parsed_ast = ast.parse(source, source_path)
+            dto_class_name = cls._find_dto_class_name(parsed_ast)
+            if dto_class_name:
+                dto_classes[module_name] = dto_class_name
+            module_names[module_name] = cls._find_defined_names(parsed_ast)
+            module_files[module_name] = source_path
+        return cls(fingerprint, services, dto_classes, module_names, module_files)
+
+    def is_fresh(self, source_paths: List[str]) -> bool:
+        """Return whether the manifest still matches the given sources."""
+        if [source[0] for source in self.fingerprint] != source_paths:
+            return False
+
+        for index, (source_path, mtime_ns, size, sha256) in enumerate(self.fingerprint):
+            try:
+                source_stat = os.stat(source_path)
+            except OSError:
+                return False
+            if (source_stat.st_mtime_ns, source_stat.st_size) == (mtime_ns, size):
+                continue
+            # Touched but maybe not modified (checkout, deploy copy): compare contents
+            with open(source_path, "rb") as source_file:
+                source = source_file.read()
+            if hashlib.sha256(source).hexdigest() != sha256:
+                return False
+            self.fingerprint[index] = self._fingerprint(source_path, source)
+            self.is_dirty = True
+        return True
+
+    def write(self, manifest_path: str) -> None:
+        """Atomically store the manifest, ignoring unwritable cache directories."""
+        payload = marshal.dumps({
+            "version": MANIFEST_VERSION,
+            "fingerprint": self.fingerprint,
+            "services": json.dumps(self.services),
+            "dto_classes": self.dto_classes,
+            "module_names": self.module_names,
+            "module_files": self.module_files,
+        })
+        try:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path))
+            with os.fdopen(file_descriptor, "wb") as manifest_file:
+                manifest_file.write(payload)
+            os.replace(temp_path, manifest_path)
+        except OSError:
+            return
+        self.is_dirty = False
+
+    def module(self, module_name: str) -> types.ModuleType:
+        """Return the module of a method file, importing it on first use."""
+        if self.package:
+            return importlib.import_module(f"{self.package}.{module_name}")
+
+        # Not part of a package: load it from its path, still through the source
+        # loader so that its bytecode is cached
+        module_path = self.module_files[module_name]
+        path_hash = hashlib.sha256(module_path.encode()).hexdigest()[:12]
+        qualified_name = f"service_methods_{path_hash}_{module_name}"
+        loaded_module = sys.modules.get(qualified_name)
+        if loaded_module is None:
+            module_spec = importlib.util.spec_from_file_location(qualified_name, module_path)
+            loaded_module = importlib.util.module_from_spec(module_spec)  # type: ignore
+            sys.modules[qualified_name] = loaded_module
+            module_spec.loader.exec_module(loaded_module)  # type: ignore
+        return loaded_module
+
+    def namespace(self, module_name: str) -> Dict[str, Any]:
+        """Return the objects defined at the top level of a method file."""
+        module_vars = vars(self.module(module_name))
+        return {name: module_vars[name] for name in self.module_names[module_name]}
+
+    def dto_class(self, module_name: str) -> Optional[type]:
+        """
+        Return the DTO class of a method, if any.
+
+        A ``response`` schema declared in methods.json takes precedence over a DTO
+        class defined in the method file.
+        """
+        response_schema = self.services.get(module_name, {}).get("response")
+        if response_schema is not None:
+            return self._schema_dto_class(module_name, response_schema)
+
+        class_name = self.dto_classes.get(module_name)
+        if class_name is None:
+            return None
+        return getattr(self.module(module_name), class_name, None)
+
+    def _schema_dto_class(self, method_name: str, response_schema: Dict[str, Any]) -> type:
+        # Built once per process so every client instance shares the same class
+        schema_dto_class = self._schema_dto_classes.get(method_name)
+        if schema_dto_class is None:
+            class_name = response_schema.get("name") or "".join(
+                name_part.capitalize() for name_part in method_name.split("_")
+            ) + "DTO"
+            schema_dto_class = build_dto_class(class_name, response_schema)
+            self._schema_dto_classes[method_name] = schema_dto_class
+        return schema_dto_class
+
+    @classmethod
+    def _read(cls, manifest_path: str, source_paths: List[str]) -> Optional["ServiceManifest"]:
+        try:
+            with open(manifest_path, "rb") as manifest_file:
+                payload = marshal.load(manifest_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(payload, dict) or payload.get("version") != MANIFEST_VERSION:
+            return None
+        manifest = cls(
+            [tuple(source) for source in payload["fingerprint"]],  # type: ignore
+            json.loads(payload["services"]),
+            payload["dto_classes"],
+            payload["module_names"],
+            payload["module_files"],
+        )
+        manifest.is_dirty = False
+        return manifest if manifest.is_fresh(source_paths) else None
+
+    @staticmethod
+    def _source_paths(methods_dir: str, methods_file_path: str) -> List[str]:
+        method_files = sorted(
+            os.path.join(methods_dir, file_name)
+            for file_name in os.listdir(methods_dir)
+            if file_name.endswith(".py") and not file_name.startswith("__")
+        ) if os.path.isdir(methods_dir) else []
+        return [methods_file_path, *method_files]
+
+    @staticmethod
+    def _manifest_path(
+        methods_dir: str,
+        methods_file_path: str,
+        cache_dir: Optional[str],
+    ) -> str:
+        # Bytecode is only valid for the interpreter that produced it
+        path_hash = hashlib.sha256(f"{methods_dir}:{methods_file_path}".encode()).hexdigest()[:12]
+        file_name = f"manifest.{path_hash}.{sys.implementation.cache_tag}.marshal"
+        return os.path.join(cache_dir or os.path.join(methods_dir, "__pycache__"), file_name)
+
+    @staticmethod
+    def _fingerprint(source_path: str, source: bytes) -> SourceFingerprint:
+        source_stat = os.stat(source_path)
+        return (
+            source_path,
+            source_stat.st_mtime_ns,
+            source_stat.st_size,
+            hashlib.sha256(source).hexdigest(),
+        )
+
+    @staticmethod
+    def _find_dto_class_name(parsed_ast: ast.Module) -> Optional[str]:
+        for node in parsed_ast.body:
+            if isinstance(node, ast.ClassDef) and "dto" in node.name.lower():
+                return node.name
+        return None
+
+    @staticmethod
+    def _find_defined_names(parsed_ast: ast.Module) -> List[str]:
+        defined_names: List[str] = []
+        for node in parsed_ast.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                defined_names.append(node.name)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                defined_names.extend(
+                    target.id for target in targets if isinstance(target, ast.Name)
+                )
+        return defined_names
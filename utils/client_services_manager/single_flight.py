@@ -0,0 +1,100 @@
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def make_call_key(
+    method_name: str,
+    endpoint: str,
+    req_params: Optional[Dict[str, Any]],
+    req_headers: Optional[Dict[str, Any]],
+) -> str:
+    """Build the key identifying identical calls."""
+    return json.dumps(
+        [method_name, endpoint, req_params or {}, req_headers or {}],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class _InFlightCall:
+    """A blocking call shared by every thread asking for the same key."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls into a single upstream call.
+
+    While a call for a key is in flight, any other caller asking for the same
+    key waits for it and gets its result (or its exception) instead of making a
+    call of its own. Works for threads (``do``) and coroutines (``ado``).
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the SingleFlight class."""
+        self.coalesced_calls = 0
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Run ``call`` unless an identical call is in flight, then share its outcome."""
+        with self._lock:
+            in_flight_call = self._calls.get(key)
+            is_leader = in_flight_call is None
+            if in_flight_call is None:
+                in_flight_call = _InFlightCall()
+                self._calls[key] = in_flight_call
+            else:
+                self.coalesced_calls += 1
+
+        if not is_leader:
+            in_flight_call.done.wait()
+            if in_flight_call.error is not None:
+                raise in_flight_call.error
+            return in_flight_call.result
+
+        try:
+            in_flight_call.result = call()
+        except BaseException as err:
+            in_flight_call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]  # noqa: WPS420
+            in_flight_call.done.set()
+        return in_flight_call.result
+
+    async def ado(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``call`` unless an identical call is in flight, then share its outcome."""
+        # Tasks belong to their event loop, so calls only coalesce within a loop
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = asyncio.ensure_future(call())
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda done_task: self._forget_task(task_key, done_task))
+            else:
+                self.coalesced_calls += 1
+        # A cancelled caller must not cancel the call the other callers wait for
+        return await asyncio.shield(task)
+
+    def _forget_task(
+        self,
+        task_key: Tuple[asyncio.AbstractEventLoop, Hashable],
+        done_task: asyncio.Future,
+    ) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+        if not done_task.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            done_task.exception()
@@ -1,14 +1,24 @@
 import ast
 import astor
 import glob
+import hashlib
 import inspect
 import json
 import os
-from typing import Any, Dict, List, Tuple, Callable
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple, Callable, Union
+
+SOURCES_HASH_PREFIX = "# Sources hash: "
 
 
 class StubsGenerator:  # noqa: WPS214
-    """Build stubs for the dynamic generated methods."""
+    """
+    Build stubs for the dynamic generated methods.
+
+    The stubs file records a hash of the sources it was generated from, and is
+    only rewritten when the class file, the methods.json file or a method file
+    changed.
+    """
 
     def __init__(self, methods_file_path: str, _find_dto_class: Callable) -> None:
         """Initialize a new instance of the StubsGenerator class."""
@@ -17,25 +27,65 @@ class StubsGenerator:  # noqa: WPS214
         self.class_file_path = class_file_path
         self._find_dto_class = _find_dto_class
 
-    def _generate_stubs(self) -> None:
-        """Generate stubs for the methods defined in the methods.json file and the class itself."""
-        methods = self._read_methods()
+    def _generate_stubs(self, force: bool = False) -> bool:
+        """
+        Generate stubs for the methods defined in the methods.json file and the class itself.
+
+        Args:
+            force (bool): Rewrite the stubs file even if its sources did not change.
+
+        Returns:
+            bool: Whether the stubs file was written.
+        """
         class_file_dir, class_file_name = self._get_class_file_info()
         stubs_file_path = self._create_stubs_file_path(class_file_dir, class_file_name)
+        sources_hash = self._hash_stubs_sources(class_file_dir)
+        if not force and self._read_sources_hash(stubs_file_path) == sources_hash:
+            return False
+
+        methods = self._read_methods()
 
         dto_imports, stubs = self._initialize_stubs()
+        # Classes of the DTOs built from methods.json schemas, rendered after the imports
+        dto_stubs: List[str] = []
 
         # Generate stubs for the class itself
         class_stubs = self._generate_class_stubs(dto_imports)
         stubs += class_stubs
 
         # Generate stubs from methods defined in the JSON file
-        stubs += self._generate_method_stubs(methods, dto_imports)
+        stubs += self._generate_method_stubs(methods, dto_imports, dto_stubs)
 
         # Process any additional method files
         stubs += self._process_method_files(class_file_dir, dto_imports)
 
-        self._write_stubs_to_file(stubs_file_path, dto_imports, stubs)
+        self._write_stubs_to_file(stubs_file_path, dto_imports, dto_stubs, stubs, sources_hash)
+        return True
+
+    def _hash_stubs_sources(self, class_file_dir: str) -> str:
+        """Hash every source the stubs are generated from."""
+        source_paths = [
+            self.class_file_path,
+            self.methods_file_path,
+            *sorted(glob.glob(os.path.join(class_file_dir, "methods", "*.py"))),
+        ]
+        sources_hash = hashlib.sha256()
+        for source_path in source_paths:
+            sources_hash.update(source_path.encode())
+            with open(source_path, "rb") as source_file:
+                sources_hash.update(source_file.read())
+        return sources_hash.hexdigest()
+
+    def _read_sources_hash(self, stubs_file_path: str) -> Optional[str]:
+        """Return the sources hash recorded in an existing stubs file."""
+        try:
+            with open(stubs_file_path, "r") as stub_file:
+                first_line = stub_file.readline().strip()
+        except OSError:
+            return None
+        if first_line.startswith(SOURCES_HASH_PREFIX):
+            return first_line[len(SOURCES_HASH_PREFIX):]
+        return None
 
     def _generate_class_stubs(self, dto_imports: List[str]) -> str:
         """Generate stubs for the class defined in the .py file."""
@@ -70,7 +120,7 @@ class StubsGenerator:  # noqa: WPS214
         """Generate stubs for the methods of a class."""
         method_stubs = ""
         for body_item in class_node.body:
-            if isinstance(body_item, ast.FunctionDef):
+            if isinstance(body_item, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 return_type = self._determine_function_return_type(body_item)
                 if return_type and return_type not in dto_imports:
                     dto_imports.append(return_type)
@@ -83,7 +133,10 @@ class StubsGenerator:  # noqa: WPS214
                 )
         return method_stubs
 
-    def _determine_function_return_type(self, function_node: ast.FunctionDef) -> str:
+    def _determine_function_return_type(
+        self,
+        function_node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+    ) -> str:
         """Determine the return type of a function from its AST node."""
         # Check if the function has a return type annotation
         if function_node.returns:
@@ -117,7 +170,7 @@ class StubsGenerator:  # noqa: WPS214
 
     def _initialize_stubs(self) -> Tuple[List[str], str]:
         """Initialize the stubs file with the necessary imports and header."""
-        dto_imports = ["from typing import Any, Optional, Dict, List, Tuple"]
+        dto_imports = ["from typing import Any, AsyncIterator, Optional, Dict, Iterator, List, Tuple"]
         stubs = "# This file is generated. Do not edit directly.\n\n"
         return dto_imports, stubs
 
@@ -125,13 +178,17 @@ class StubsGenerator:  # noqa: WPS214
         self,
         methods: Dict[str, Any],
         dto_imports: List[str],
+        dto_stubs: List[str],
     ) -> str:
-        """Generate stubs for the methods defined in the methods.json file."""
+        """Generate stubs for the methods defined in the methods.json file, and for their schema DTOs."""
         stubs = ""
         for method_name, details in methods.items():
             dto_class = self._find_dto_class(method_name)
             class_name = dto_class.__name__ if dto_class else "Any"
-            if dto_class:
+            if dto_class and hasattr(dto_class, "__schema__"):
+                # DTOs built from a methods.json schema have no module to import from
+                dto_stubs.append(self._generate_schema_dto_stub(dto_class))
+            elif dto_class:
                 module_name = method_name  # or however you determine the module name
                 dto_imports.append(f"from .methods.{module_name} import {class_name}")
 
@@ -141,11 +198,33 @@ class StubsGenerator:  # noqa: WPS214
             param_list = f"self, {param_list}" if param_list else "self"
             docstring = f'"""Call the "{details["endpoint"]}" endpoint with parameters: {details["params"]}."""'
             method_def = f"\tdef {method_name}({param_list}) -> {class_name}:"
+            async_method_def = f"\tasync def a{method_name}({param_list}) -> {class_name}:"
             method_doc = f"\t\t{docstring}\n\t\tpass\n\n"
 
             stubs += method_def + "\n" + method_doc
+            stubs += async_method_def + "\n" + method_doc
+            if details.get("pagination"):
+                iter_param_list = f"{param_list}, prefetch: bool = False"
+                iter_def = f"\tdef iter_{method_name}({iter_param_list}) -> Iterator[Dict[str, Any]]:"
+                aiter_def = f"\tdef aiter_{method_name}({iter_param_list}) -> AsyncIterator[Dict[str, Any]]:"
+                stubs += iter_def + "\n" + method_doc
+                stubs += aiter_def + "\n" + method_doc
         return stubs
 
+    def _generate_schema_dto_stub(self, dto_class: type) -> str:
+        """Generate a class stub for a DTO built from a methods.json schema."""
+        stub_types = {"dict": "Dict[str, Any]", "list": "List[Any]", "any": "Any"}
+        class_stub = f"class {dto_class.__name__}:\n"
+        for field_name, type_name in dto_class.__schema__["fields"].items():  # type: ignore
+            stub_type = stub_types.get(type_name.rstrip("?"), type_name.rstrip("?"))
+            if type_name.endswith("?"):
+                stub_type = f"Optional[{stub_type}]"
+            class_stub += f"\t{field_name}: {stub_type}\n"
+        if dto_class.__schema__.get("extra") == "keep":  # type: ignore
+            class_stub += "\textra: Dict[str, Any]\n"
+        class_stub += "\tdef to_dict(self) -> Dict[str, Any]: ...\n"
+        return class_stub
+
     def _process_method_files(self, class_file_dir: str, dto_imports: List[str]) -> str:
         """Process the method files and generate stubs for each method."""
         methods_dir = os.path.join(class_file_dir, "methods")
@@ -174,13 +253,13 @@ class StubsGenerator:  # noqa: WPS214
         stubs = ""
         parsed_ast = ast.parse(file_contents)
         for node in parsed_ast.body:
-            if isinstance(node, ast.FunctionDef):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 stubs += self._generate_stub_for_function(node, dto_imports, file_path)
         return stubs
 
     def _generate_stub_for_function(
         self,
-        node: ast.FunctionDef,
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
         dto_imports: List[str],
         file_path: str,
         return_type: str = "Any",
@@ -216,8 +295,9 @@ class StubsGenerator:  # noqa: WPS214
             if class_name not in dto_imports:
                 dto_imports.append(f"from .methods.{file_name} import {class_name}")
 
+        def_keyword = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
         return (
-            f"\tdef {function_name}({function_args}) -> {class_name}:\n"
+            f"\t{def_keyword} {function_name}({function_args}) -> {class_name}:\n"
             f"\t\t{formatted_docstring}\n"
             f"\t\tpass\n\n"
         )
@@ -226,8 +306,16 @@ class StubsGenerator:  # noqa: WPS214
         self,
         stubs_file_path: str,
         dto_imports: List[str],
+        dto_stubs: List[str],
         stubs: str,
+        sources_hash: str,
     ) -> None:
-        """Write the stubs to the stubs file."""
-        with open(stubs_file_path, "w") as stub_file:
-            stub_file.write("\n".join(dto_imports) + "\n\n" + stubs)
+        """Write the stubs to the stubs file, atomically so concurrent writers never leave it partial."""
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(stubs_file_path))
+        with os.fdopen(file_descriptor, "w") as stub_file:
+            stub_file.write(f"{SOURCES_HASH_PREFIX}{sources_hash}\n")
+            stub_file.write("\n".join(dto_imports) + "\n\n\n")
+            stub_file.write("".join(f"{dto_stub}\n\n" for dto_stub in dto_stubs))
+            stub_file.write(stubs)
+        os.chmod(temp_path, 0o644)  # noqa: WPS432
+        os.replace(temp_path, stubs_file_path)
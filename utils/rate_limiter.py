@@ -0,0 +1,225 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call would exceed a rate limit and cannot wait for a token."""
+
+    def __init__(self, bucket_names: Sequence[str], retry_after: float) -> None:
+        """Initialize a new instance of the RateLimitExceeded class."""
+        super().__init__(f"Rate limit exceeded for {', '.join(bucket_names)}, retry after {retry_after:.2f}s")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """A token bucket refilled with ``rate`` tokens per second up to ``capacity``."""
+
+    name: str
+    rate: float
+    capacity: float
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    The rate limit of a service method, declared in methods.json.
+
+        "rate_limit": {
+            "buckets": [{"name": "hunter", "rate": 15, "per": 1, "burst": 15}],
+            "on_limit": "block",
+            "max_wait": 2
+        }
+
+    Every bucket must have a token for a call to go out; methods sharing a
+    bucket name share its tokens. ``per`` is the period ``rate`` is counted over
+    in seconds (e.g. 2592000 for a monthly quota) and ``burst`` the bucket
+    capacity, ``rate`` by default. Over the limit, ``block`` waits up to
+    ``max_wait`` seconds for a token while ``fail`` raises right away.
+    """
+
+    buckets: Tuple[Bucket, ...]
+    on_limit: str = "block"
+    max_wait: float = 5.0
+
+    @classmethod
+    def from_config(cls, rate_limit_config: Dict[str, Any]) -> "RateLimit":
+        """Build a rate limit from its methods.json declaration."""
+        buckets = tuple(
+            Bucket(
+                name=bucket_config["name"],
+                rate=bucket_config["rate"] / bucket_config.get("per", 1),
+                capacity=bucket_config.get("burst", bucket_config["rate"]),
+            )
+            for bucket_config in rate_limit_config["buckets"]
+        )
+        on_limit = rate_limit_config.get("on_limit", "block")
+        if on_limit not in {"block", "fail"}:
+            raise ValueError(f"Unsupported on_limit '{on_limit}', expected 'block' or 'fail'")
+        return cls(buckets, on_limit, rate_limit_config.get("max_wait", 5.0))
+
+
+def _refill(bucket: Bucket, tokens: float, updated_at: float, now: float) -> float:
+    return min(bucket.capacity, tokens + max(now - updated_at, 0) * bucket.rate)
+
+
+class MemoryBucketBackend:
+    """Token buckets kept in process memory, only shared by the threads of one worker."""
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the MemoryBucketBackend class."""
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, buckets: Sequence[Bucket]) -> float:
+        """Take a token from every bucket, or return how long to wait for one."""
+        now = time.time()
+        with self._lock:
+            refilled = [
+                _refill(bucket, *self._buckets.get(bucket.name, (bucket.capacity, now)), now)
+                for bucket in buckets
+            ]
+            wait = max(
+                ((1 - tokens) / bucket.rate for bucket, tokens in zip(buckets, refilled) if tokens < 1),
+                default=0.0,
+            )
+            if not wait:
+                for bucket, tokens in zip(buckets, refilled):
+                    self._buckets[bucket.name] = (tokens - 1, now)
+            return wait
+
+
+class SQLiteBucketBackend:
+    """
+    Token buckets stored in a SQLite file, shared by every worker process on a host.
+
+    Each acquisition runs in a ``BEGIN IMMEDIATE`` transaction, so SQLite's file
+    lock serializes the read-refill-consume step across processes.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize a new instance of the SQLiteBucketBackend class."""
+        self.path = path
+        self._local = threading.local()
+
+    def try_acquire(self, buckets: Sequence[Bucket]) -> float:
+        """Take a token from every bucket, or return how long to wait for one."""
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            refilled = []
+            for bucket in buckets:
+                row = connection.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE name = ?",
+                    (bucket.name,),
+                ).fetchone()
+                refilled.append(_refill(bucket, *(row or (bucket.capacity, now)), now))
+            wait = max(
+                ((1 - tokens) / bucket.rate for bucket, tokens in zip(buckets, refilled) if tokens < 1),
+                default=0.0,
+            )
+            if not wait:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    [(bucket.name, tokens - 1, now) for bucket, tokens in zip(buckets, refilled)],
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return wait
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)",
+            )
+            self._local.connection = connection
+        return connection
+
+
+class DjangoCacheBucketBackend:
+    """
+    Rate limits counted in one of Django's caches, shared by every worker using it.
+
+    Caches have no compare-and-set, so buckets are approximated with fixed
+    windows of ``capacity / rate`` seconds counted through atomic ``incr``; a
+    call rejected by a later bucket still spends its token in the earlier ones.
+    """
+
+    def __init__(self, alias: str = "default") -> None:
+        """Initialize a new instance of the DjangoCacheBucketBackend class."""
+        from django.core.cache import caches  # noqa: WPS433
+
+        self.cache = caches[alias]
+
+    def try_acquire(self, buckets: Sequence[Bucket]) -> float:
+        """Count the call in every bucket window, or return how long to wait for the next one."""
+        now = time.time()
+        for bucket in buckets:
+            window = bucket.capacity / bucket.rate
+            window_key = f"rate_limit:{bucket.name}:{int(now // window)}"
+            self.cache.add(window_key, 0, timeout=int(window) + 1)
+            try:
+                calls = self.cache.incr(window_key)
+            except ValueError:
+                # The window expired between add and incr
+                self.cache.add(window_key, 1, timeout=int(window) + 1)
+                calls = 1
+            if calls > bucket.capacity:
+                return window - now % window
+        return 0.0
+
+
+class RateLimiter:
+    """Make callers wait for, or fail without, a token of every bucket of a rate limit."""
+
+    def __init__(self, backend: Optional[Any] = None) -> None:
+        """Initialize a new instance of the RateLimiter class."""
+        self.backend = backend or MemoryBucketBackend()
+
+    def acquire(self, rate_limit: RateLimit) -> None:
+        """Block until a call is allowed, raising RateLimitExceeded past the deadline."""
+        deadline = time.monotonic() + rate_limit.max_wait
+        while True:
+            wait = self.backend.try_acquire(rate_limit.buckets)
+            if not wait:
+                return
+            self._check_wait(rate_limit, wait, deadline)
+            time.sleep(wait)
+
+    async def aacquire(self, rate_limit: RateLimit) -> None:
+        """Wait, without blocking the event loop, until a call is allowed."""
+        deadline = time.monotonic() + rate_limit.max_wait
+        while True:
+            wait = await asyncio.to_thread(self.backend.try_acquire, rate_limit.buckets)
+            if not wait:
+                return
+            self._check_wait(rate_limit, wait, deadline)
+            await asyncio.sleep(wait)
+
+    def _check_wait(self, rate_limit: RateLimit, wait: float, deadline: float) -> None:
+        if rate_limit.on_limit == "fail" or time.monotonic() + wait > deadline:
+            raise RateLimitExceeded([bucket.name for bucket in rate_limit.buckets], wait)
+
+
+def build_bucket_backend(backend_name: str, **backend_options: Any) -> Any:
+    """Return the bucket backend called ``memory``, ``sqlite`` or ``cache``."""
+    if backend_name == "memory":
+        return MemoryBucketBackend()
+    if backend_name == "sqlite":
+        return SQLiteBucketBackend(backend_options["sqlite_path"])
+    if backend_name == "cache":
+        return DjangoCacheBucketBackend(backend_options.get("cache_alias", "default"))
+    raise ValueError(f"Unknown rate limit backend '{backend_name}'")
+
@@ -0,0 +1,113 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """Initialize a new instance of the CircuitOpenError class."""
+        super().__init__(f"Circuit open for '{endpoint}', retry after {retry_after:.2f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Only idempotent methods are retried, after connection errors, timeouts and
+    ``retry_statuses``. The wait is drawn with full jitter from an exponential
+    backoff capped at ``backoff_max``, but never shorter than the ``Retry-After``
+    the server asked for.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    retry_statuses: FrozenSet[int] = frozenset((429, 500, 502, 503, 504))
+    idempotent_methods: FrozenSet[str] = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Return whether a request that failed on its ``attempt``-th try (from 1) can be retried."""
+        return method.upper() in self.idempotent_methods and attempt < self.max_attempts
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return how long to wait before the try following the ``attempt``-th one."""
+        backoff = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))  # noqa: S311
+        return max(backoff, retry_after or 0)
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """Return the seconds to wait from a ``Retry-After`` header (seconds or HTTP date)."""
+    if not retry_after:
+        return None
+    if retry_after.strip().isdigit():
+        return float(retry_after)
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Fail fast on an endpoint after ``failure_threshold`` consecutive failures.
+
+    Once open, calls raise ``CircuitOpenError`` without touching the network for
+    ``reset_timeout`` seconds; then a single trial call is let through
+    (half-open), closing the circuit on success and reopening it on failure.
+    Every call let through must end with ``record_success``, ``record_failure``
+    or ``release_trial``, or the circuit would wait on its trial forever.
+    """
+
+    def __init__(self, endpoint: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """Initialize a new instance of the CircuitBreaker class."""
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether calls are currently rejected."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless the call may go out."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            retry_after = self._opened_at + self.reset_timeout - time.monotonic()
+            if retry_after > 0 or self._trial_in_flight:
+                raise CircuitOpenError(self.endpoint, max(retry_after, 0))
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit past the threshold or on a failed trial."""
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Let another trial call through, the outcome of this one being unknown (e.g. it was cancelled)."""
+        with self._lock:
+            self._trial_in_flight = False